@@ -0,0 +1,32 @@
+"""add copywriting token usage to carousel_generations
+
+Revision ID: c5d91e7f3a20
+Revises: a239ce4260fd
+Create Date: 2026-10-17 10:12:31.514207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d91e7f3a20'
+down_revision: Union[str, None] = 'a239ce4260fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('carousel_generations', sa.Column('copy_input_tokens', sa.Integer(), nullable=True))
+    op.add_column('carousel_generations', sa.Column('copy_output_tokens', sa.Integer(), nullable=True))
+    op.add_column('carousel_generations', sa.Column('copy_cache_read_tokens', sa.Integer(), nullable=True))
+    op.add_column('carousel_generations', sa.Column('copy_cache_write_tokens', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('carousel_generations', 'copy_cache_write_tokens')
+    op.drop_column('carousel_generations', 'copy_cache_read_tokens')
+    op.drop_column('carousel_generations', 'copy_output_tokens')
+    op.drop_column('carousel_generations', 'copy_input_tokens')
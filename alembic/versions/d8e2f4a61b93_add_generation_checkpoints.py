@@ -0,0 +1,28 @@
+"""add stage checkpoints to carousel_generations
+
+Revision ID: d8e2f4a61b93
+Revises: c5d91e7f3a20
+Create Date: 2026-10-17 15:40:08.127634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e2f4a61b93'
+down_revision: Union[str, None] = 'c5d91e7f3a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('carousel_generations', sa.Column('slides_data', sa.Text(), nullable=True))
+    op.add_column('carousel_generations', sa.Column('hook_image_s3_key', sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('carousel_generations', 'hook_image_s3_key')
+    op.drop_column('carousel_generations', 'slides_data')
@@ -0,0 +1,91 @@
+"""Benchmark: per-slide rendering vs. one-page batch rendering of a carousel.
+
+Usage: python scripts/benchmark_batch_render.py [style_slug] [rounds]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+
+from src.config.settings import get_settings
+from src.renderer.browser import shutdown, warm_up
+from src.renderer.engine import SlideRenderer
+from src.renderer.styles import load_style_config
+from src.schemas.slide import (
+    ContentTemplate,
+    ListingData,
+    QuoteData,
+    SlideContent,
+    SlideType,
+    StatsData,
+)
+
+SLIDES = [
+    SlideContent(position=0, heading="Why your carousels flop", slide_type=SlideType.HOOK),
+    SlideContent(
+        position=1,
+        heading="Lead with the outcome",
+        body_text="People scroll past process. Show the result on slide one.",
+        slide_number=1,
+    ),
+    SlideContent(
+        position=2,
+        heading="Three rules",
+        content_template=ContentTemplate.LISTING,
+        listing_data=ListingData(items=["One idea per slide", "Big type", "Clear CTA"]),
+        slide_number=2,
+    ),
+    SlideContent(
+        position=3,
+        heading="Numbers",
+        content_template=ContentTemplate.STATS,
+        stats_data=StatsData(value="3x", label="more saves", context="vs. single images"),
+        slide_number=3,
+    ),
+    SlideContent(
+        position=4,
+        heading="Quote",
+        content_template=ContentTemplate.QUOTE,
+        quote_data=QuoteData(quote_text="Clarity beats cleverness.", author_name="Editor"),
+        slide_number=4,
+    ),
+    SlideContent(position=5, heading="Follow for more", slide_type=SlideType.CTA),
+]
+
+
+async def _time_rounds(renderer: SlideRenderer, rounds: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await renderer.render_carousel(SLIDES)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def main() -> None:
+    style_slug = sys.argv[1] if len(sys.argv) > 1 else "tech"
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    # Measure rendering itself, not cache lookups
+    get_settings().renderer.render_cache_max_bytes = 0
+    style = load_style_config(style_slug)
+    await warm_up()
+    try:
+        for label, batch in (("per-slide", False), ("batch", True)):
+            renderer = SlideRenderer(style, batch=batch)
+            await renderer.render_carousel(SLIDES)  # warm templates and fonts
+            timings = await _time_rounds(renderer, rounds)
+            print(
+                f"{label:>9}: median {statistics.median(timings) * 1000:7.1f} ms, "
+                f"min {min(timings) * 1000:7.1f} ms over {rounds} carousels "
+                f"of {len(SLIDES)} slides"
+            )
+    finally:
+        await shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
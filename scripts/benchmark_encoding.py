@@ -0,0 +1,75 @@
+"""Benchmark: encode time and output size of a slide per output format.
+
+Usage: python scripts/benchmark_encoding.py [image_path] [rounds]
+
+Without an image a slide is drawn with the Pillow engine's default font.
+"""
+
+from __future__ import annotations
+
+import io
+import statistics
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
+from src.renderer.image_ops import OutputFormat, encode_image
+
+FORMATS = [
+    OutputFormat(format="png", compress_level=1),
+    OutputFormat(format="png", compress_level=6),
+    OutputFormat(format="png", compress_level=9),
+    OutputFormat(format="jpeg", quality=85),
+    OutputFormat(format="jpeg", quality=95),
+    OutputFormat(format="webp", quality=80),
+    OutputFormat(format="webp", quality=95),
+]
+
+
+def _sample_slide() -> Image.Image:
+    img = Image.new("RGB", (SLIDE_WIDTH, SLIDE_HEIGHT), "#1a1a2e")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((0, 0, SLIDE_WIDTH, 240), fill="#e94560")
+    heading = ImageFont.load_default(72)
+    body = ImageFont.load_default(36)
+    draw.text((80, 320), "Lead with the outcome", font=heading, fill="#e94560")
+    for i in range(12):
+        draw.text((80, 460 + i * 56), "People scroll past process. " * 2, font=body, fill="white")
+    return img
+
+
+def _label(output: OutputFormat) -> str:
+    if output.format == "png":
+        return f"png level={output.compress_level}"
+    return f"{output.format} q={output.quality}"
+
+
+def main() -> None:
+    image_path = sys.argv[1] if len(sys.argv) > 1 else None
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    if image_path:
+        with Image.open(image_path) as src:
+            img = src.convert("RGB")
+    else:
+        img = _sample_slide()
+
+    raw = io.BytesIO()
+    img.save(raw, format="BMP")
+    print(f"{img.width}x{img.height}, {len(raw.getvalue()) / 1024:.0f} KiB uncompressed")
+    for output in FORMATS:
+        timings: list[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            data = encode_image(img, output)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{_label(output):>16}: median {statistics.median(timings) * 1000:7.1f} ms, "
+            f"{len(data) / 1024:7.1f} KiB over {rounds} encodes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,15 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections import deque
+from collections.abc import AsyncGenerator
+from functools import lru_cache
 
 import anthropic
+from anthropic.lib.streaming import AsyncMessageStream
 
-from src.ai.base import CopywriterProvider
+from src.ai.base import CopywriterProvider, TokenUsage
+from src.ai.rate_limit import get_rate_limiter
 from src.ai.template_loader import render_prompt
 from src.config.settings import get_settings
 from src.schemas.slide import (
@@ -25,6 +30,67 @@ from src.schemas.slide import (
 
 logger = logging.getLogger(__name__)
 
+HOOK_MAX_TOKENS = 1024
+
+
+@lru_cache(maxsize=1)
+def _system_prompt() -> str:
+    """Static copywriter system prompt, rendered once per process."""
+    return render_prompt("copywriter_system.mako")
+
+
+def _system_blocks() -> list[anthropic.types.TextBlockParam]:
+    """System prompt marked for Anthropic prompt caching."""
+    return [
+        {
+            "type": "text",
+            "text": _system_prompt(),
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+def _record_usage(usage: TokenUsage | None, response_usage: anthropic.types.Usage) -> None:
+    """Add a response's token counts, including prompt cache reads/writes, to ``usage``."""
+    cache_read = response_usage.cache_read_input_tokens or 0
+    cache_write = response_usage.cache_creation_input_tokens or 0
+    logger.debug(
+        "Claude usage: input=%d output=%d cache_read=%d cache_write=%d",
+        response_usage.input_tokens,
+        response_usage.output_tokens,
+        cache_read,
+        cache_write,
+    )
+    if usage is None:
+        return
+    usage.input_tokens += response_usage.input_tokens
+    usage.output_tokens += response_usage.output_tokens
+    usage.cache_read_tokens += cache_read
+    usage.cache_write_tokens += cache_write
+
+
+def _snapshot_usage(stream: AsyncMessageStream) -> anthropic.types.Usage | None:
+    """Usage of a stream closed before its final message, if it got that far.
+
+    Input and cache counts are complete once the message has started; output
+    tokens only cover what was reported before the stream was closed.
+    """
+    try:
+        return stream.current_message_snapshot.usage
+    except AssertionError:  # no message_start event received yet
+        return None
+
+
+def _billed_tokens(response_usage: anthropic.types.Usage) -> int:
+    """Tokens a response counts against the TPM budget (cache reads are not limited)."""
+    cache_write = response_usage.cache_creation_input_tokens or 0
+    return response_usage.input_tokens + cache_write + response_usage.output_tokens
+
+
+def _estimate_tokens(user_prompt: str, max_tokens: int) -> int:
+    """Upper-bound TPM reservation for a call: ~4 chars per prompt token plus max output."""
+    return (len(_system_prompt()) + len(user_prompt)) // 4 + max_tokens
+
 
 def _strip_markdown_fences(text: str) -> str:
     """Strip markdown code fences (```json ... ```) from AI response."""
@@ -112,6 +178,106 @@ def _parse_slide(raw: dict[str, object]) -> SlideContent:
     return slide
 
 
+def _apply_slide_rules(slide: SlideContent, index: int, is_last: bool) -> None:
+    """Enforce slide types (first = hook, last = cta) and text template for non-content."""
+    if index == 0:
+        slide.slide_type = SlideType.HOOK
+        if slide.text_position != TextPosition.NONE and not slide.body_text:
+            slide.text_position = TextPosition.NONE
+    elif is_last:
+        slide.slide_type = SlideType.CTA
+
+    if slide.slide_type != SlideType.CONTENT:
+        slide.content_template = ContentTemplate.TEXT
+        slide.listing_data = None
+        slide.comparison_data = None
+        slide.quote_data = None
+        slide.stats_data = None
+        slide.steps_data = None
+
+
+def _parse_response_json(response: anthropic.types.Message) -> list[dict[str, object]]:
+    """Extract the JSON slide array from a Claude response."""
+    if not response.content:
+        raise ValueError("Claude returned empty response content")
+
+    raw_text = response.content[0].text  # type: ignore[union-attr]
+    logger.debug("Claude response: %s", raw_text)
+
+    cleaned = _strip_markdown_fences(raw_text)
+    try:
+        slides_data: list[dict[str, object]] = json.loads(cleaned)
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse Claude response as JSON: %s", raw_text[:500])
+        raise ValueError(f"AI returned invalid JSON: {e}") from e
+    return slides_data
+
+
+class _SlideArrayParser:
+    """Incrementally extract top-level objects from a streamed JSON array.
+
+    Text before the opening ``[`` (markdown fences, preamble) is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._current: list[str] = []
+
+    @property
+    def in_object(self) -> bool:
+        """True while an element object has been opened but not yet closed."""
+        return self._depth > 0
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, chunk: str) -> list[dict[str, object]]:
+        """Consume a chunk of text, returning every object completed by it."""
+        completed: list[dict[str, object]] = []
+        for ch in chunk:
+            if self._finished:
+                break
+            if not self._started:
+                self._started = ch == "["
+                continue
+
+            if self._depth > 0:
+                self._current.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._current = [ch]
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    text = "".join(self._current)
+                    try:
+                        completed.append(json.loads(text))
+                    except json.JSONDecodeError as e:
+                        logger.error("Failed to parse streamed slide JSON: %s", text[:500])
+                        raise ValueError(f"AI returned invalid JSON: {e}") from e
+            elif ch == "]" and self._depth == 0:
+                self._finished = True
+        return completed
+
+
 class AnthropicCopywriter(CopywriterProvider):
     def __init__(self) -> None:
         settings = get_settings()
@@ -127,6 +293,7 @@ class AnthropicCopywriter(CopywriterProvider):
         input_text: str,
         style_slug: str,
         slide_count: int,
+        usage: TokenUsage | None = None,
     ) -> list[SlideContent]:
         user_prompt = render_prompt(
             "copywriter_user.mako",
@@ -135,45 +302,21 @@ class AnthropicCopywriter(CopywriterProvider):
             input_text=input_text,
         )
 
-        response = await self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            system=render_prompt("copywriter_system.mako"),
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-
-        if not response.content:
-            raise ValueError("Claude returned empty response content")
-
-        raw_text = response.content[0].text  # type: ignore[union-attr]
-        logger.debug("Claude response: %s", raw_text)
-
-        cleaned = _strip_markdown_fences(raw_text)
-        try:
-            slides_data = json.loads(cleaned)
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse Claude response as JSON: %s", raw_text[:500])
-            raise ValueError(f"AI returned invalid JSON: {e}") from e
+        limiter = get_rate_limiter("anthropic")
+        async with limiter.acquire(_estimate_tokens(user_prompt, self.max_tokens)) as lease:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                system=_system_blocks(),
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+            await lease.settle(_billed_tokens(response.usage))
+        _record_usage(usage, response.usage)
+        slides_data = _parse_response_json(response)
 
         slides = [_parse_slide(s) for s in slides_data]
-
-        # Enforce slide types: first = hook, last = cta
-        if slides:
-            slides[0].slide_type = SlideType.HOOK
-            if slides[0].text_position != TextPosition.NONE and not slides[0].body_text:
-                slides[0].text_position = TextPosition.NONE
-        if len(slides) > 1:
-            slides[-1].slide_type = SlideType.CTA
-
-        # Enforce: non-content slides always use text template
-        for s in slides:
-            if s.slide_type != SlideType.CONTENT:
-                s.content_template = ContentTemplate.TEXT
-                s.listing_data = None
-                s.comparison_data = None
-                s.quote_data = None
-                s.stats_data = None
-                s.steps_data = None
+        for index, slide in enumerate(slides):
+            _apply_slide_rules(slide, index, is_last=index == len(slides) - 1)
 
         # Assign slide numbers (1-based for content slides)
         content_counter = 0
@@ -183,3 +326,103 @@ class AnthropicCopywriter(CopywriterProvider):
                 s.slide_number = content_counter
 
         return slides
+
+    async def generate_hook(
+        self,
+        input_text: str,
+        style_slug: str,
+        slide_count: int,
+        usage: TokenUsage | None = None,
+    ) -> SlideContent:
+        """Generate only the hook slide with a short, low-token call."""
+        user_prompt = render_prompt(
+            "copywriter_hook.mako",
+            style_slug=style_slug,
+            slide_count=slide_count,
+            input_text=input_text,
+        )
+
+        limiter = get_rate_limiter("anthropic")
+        async with limiter.acquire(_estimate_tokens(user_prompt, HOOK_MAX_TOKENS)) as lease:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=HOOK_MAX_TOKENS,
+                system=_system_blocks(),
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+            await lease.settle(_billed_tokens(response.usage))
+        _record_usage(usage, response.usage)
+        slides_data = _parse_response_json(response)
+        if not slides_data:
+            raise ValueError("Claude returned no hook slide")
+
+        hook = _parse_slide(slides_data[0])
+        _apply_slide_rules(hook, 0, is_last=False)
+        return hook
+
+    async def stream_slides(
+        self,
+        input_text: str,
+        style_slug: str,
+        slide_count: int,
+        usage: TokenUsage | None = None,
+    ) -> AsyncGenerator[SlideContent]:
+        """Stream slides from Claude, yielding each one as soon as it is final.
+
+        A slide is final once the next slide object has started (so it cannot be
+        the CTA) or the array has closed. Slide rules and numbering match
+        ``generate_slides``.
+        """
+        user_prompt = render_prompt(
+            "copywriter_user.mako",
+            style_slug=style_slug,
+            slide_count=slide_count,
+            input_text=input_text,
+        )
+
+        parser = _SlideArrayParser()
+        pending: deque[dict[str, object]] = deque()
+        index = 0
+        content_counter = 0
+
+        def _finalize(raw: dict[str, object], is_last: bool) -> SlideContent:
+            nonlocal index, content_counter
+            slide = _parse_slide(raw)
+            _apply_slide_rules(slide, index, is_last=is_last)
+            if slide.slide_type == SlideType.CONTENT:
+                content_counter += 1
+                slide.slide_number = content_counter
+            index += 1
+            return slide
+
+        limiter = get_rate_limiter("anthropic")
+        async with (
+            limiter.acquire(_estimate_tokens(user_prompt, self.max_tokens)) as lease,
+            self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                system=_system_blocks(),
+                messages=[{"role": "user", "content": user_prompt}],
+            ) as stream,
+        ):
+            final_usage: anthropic.types.Usage | None = None
+            try:
+                async for text in stream.text_stream:
+                    pending.extend(parser.feed(text))
+                    while len(pending) > 1 or (pending and parser.in_object):
+                        yield _finalize(pending.popleft(), is_last=False)
+                final_usage = (await stream.get_final_message()).usage
+            finally:
+                if final_usage is None:
+                    # Closed early (caller stopped consuming, or an error): count what
+                    # the stream reported so far, including prompt cache reads/writes
+                    final_usage = _snapshot_usage(stream)
+                if final_usage is not None:
+                    await lease.settle(_billed_tokens(final_usage))
+                    _record_usage(usage, final_usage)
+
+        if index == 0 and not pending:
+            raise ValueError("Claude returned no slides")
+        while pending:
+            raw = pending.popleft()
+            yield _finalize(raw, is_last=not pending)
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
 
+from src.renderer.image_ops import GeneratedImage
 from src.renderer.styles import StyleConfig
 from src.schemas.slide import SlideContent
 
 
+@dataclass(slots=True)
+class TokenUsage:
+    """Token counts accumulated across the copywriter calls of one generation."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
 class CopywriterProvider(ABC):
     @abstractmethod
     async def generate_slides(
@@ -13,20 +27,71 @@ class CopywriterProvider(ABC):
         input_text: str,
         style_slug: str,
         slide_count: int,
+        usage: TokenUsage | None = None,
     ) -> list[SlideContent]:
-        """Generate slide content from user text."""
+        """Generate slide content from user text.
+
+        If ``usage`` is given, the call's token counts are added to it.
+        """
         ...
 
+    async def generate_hook(
+        self,
+        input_text: str,
+        style_slug: str,
+        slide_count: int,
+        usage: TokenUsage | None = None,
+    ) -> SlideContent:
+        """Generate only the hook slide, ideally with a cheaper call than the full copy.
+
+        Providers without a dedicated call fall back to the first generated slide.
+        """
+        slides = await self.generate_slides(input_text, style_slug, slide_count, usage=usage)
+        return slides[0]
+
+    async def stream_slides(
+        self,
+        input_text: str,
+        style_slug: str,
+        slide_count: int,
+        usage: TokenUsage | None = None,
+    ) -> AsyncGenerator[SlideContent]:
+        """Yield slides as soon as each one is final.
+
+        Providers without streaming support yield the full result at once.
+        """
+        for slide in await self.generate_slides(input_text, style_slug, slide_count, usage=usage):
+            yield slide
+
+
+class ImageProviderOverloadedError(Exception):
+    """The image provider is shedding load (rate limited, unavailable or timing out).
+
+    Unlike an ordinary failure (``generate_slide_image`` returning None) this
+    is a signal to lower concurrency before retrying.
+    """
+
 
 class ImageProvider(ABC):
+    def admit(self) -> AbstractAsyncContextManager[object]:
+        """Wait for the provider's shared rate limits; hold it around one call.
+
+        Kept apart from ``generate_slide_image`` so callers can queue here
+        before taking a local concurrency slot. Providers without shared
+        limits admit at once.
+        """
+        return nullcontext()
+
     @abstractmethod
     async def generate_slide_image(
         self,
         slide: SlideContent,
         style_config: StyleConfig,
-    ) -> bytes | None:
+    ) -> GeneratedImage | None:
         """Generate a complete slide image with heading/subtitle baked in.
 
-        Returns PNG bytes on success, or None if image generation fails.
+        Returns the provider's image, header-checked but not re-encoded, or
+        None if image generation fails. Raises ImageProviderOverloadedError
+        when the provider is overloaded. Callers hold ``admit()`` around it.
         """
         ...
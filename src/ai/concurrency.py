@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.ai.base import ImageProviderOverloadedError
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Adaptive (AIMD) in-flight limit for image generation in one worker process.
+# Every call that returns a result with latency close to the running average
+# raises the limit by 1/limit (about +1 per limit's worth of calls); an
+# overload (429, 503, timeout) halves it, at most once per average latency so a burst of
+# errors from the same window counts once.
+# ---------------------------------------------------------------------------
+
+_LATENCY_SMOOTHING = 0.2  # EWMA weight of the newest sample
+_LATENCY_TOLERANCE = 2.0  # a call slower than this times the average is not "stable"
+_DECREASE_FACTOR = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveLimitStats:
+    limit: int
+    in_flight: int
+    increases: int  # calls that raised the limit
+    decreases: int
+    overloads: int
+    latency_seconds: float | None  # running average of successful calls
+
+
+class SlotOutcome:
+    """Handed to the block running in a limiter slot; report the call's result on it."""
+
+    __slots__ = ("succeeded",)
+
+    def __init__(self) -> None:
+        self.succeeded = False
+
+    def report(self, result: object) -> None:
+        """Record the call's result: only a non-None one counts as a success."""
+        self.succeeded = result is not None
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that grows additively and shrinks multiplicatively."""
+
+    def __init__(self, name: str, *, initial: int, max_limit: int, min_limit: int = 1) -> None:
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.initial = min(max(initial, min_limit), self.max_limit)
+        self._limit = float(self.initial)
+        self._in_flight = 0
+        self._latency: float | None = None
+        self._last_decrease = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+        self._overloads = 0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Bound to the loop of its first use (the worker's shared loop)
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    def _on_success(self, latency: float) -> None:
+        average = self._latency
+        self._latency = (
+            latency if average is None else average + _LATENCY_SMOOTHING * (latency - average)
+        )
+        if average is not None and latency > average * _LATENCY_TOLERANCE:
+            return
+        if self._limit < self.max_limit:
+            before = self.limit
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._increases += 1
+            if self.limit != before:
+                logger.info("%s concurrency limit raised to %d", self.name, self.limit)
+
+    def _on_overload(self) -> None:
+        self._overloads += 1
+        now = time.monotonic()
+        if now - self._last_decrease < (self._latency or 0):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * _DECREASE_FACTOR)
+        self._decreases += 1
+        logger.warning("%s overloaded, concurrency limit cut to %d", self.name, self.limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[SlotOutcome]:
+        """Wait until a call fits under the limit, then run it and learn from the outcome.
+
+        Completing the block after reporting a non-None result on the yielded
+        SlotOutcome counts as a success with its latency; raising
+        ImageProviderOverloadedError counts as an overload; a None result or
+        any other exception leaves the limit unchanged.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        async with self._occupied() as outcome:
+            yield outcome
+
+    @asynccontextmanager
+    async def try_slot(self) -> AsyncIterator[SlotOutcome | None]:
+        """Like slot(), but yield None at once instead of waiting when the limit is reached."""
+        if self._in_flight >= self.limit:
+            yield None
+            return
+        self._in_flight += 1
+        async with self._occupied() as outcome:
+            yield outcome
+
+    @asynccontextmanager
+    async def _occupied(self) -> AsyncIterator[SlotOutcome]:
+        # Runs the block in a slot already counted in _in_flight, then frees it
+        condition = self._get_condition()
+        outcome = SlotOutcome()
+        start = time.monotonic()
+        try:
+            yield outcome
+        except ImageProviderOverloadedError:
+            self._on_overload()
+            raise
+        else:
+            if outcome.succeeded:
+                self._on_success(time.monotonic() - start)
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+    def stats(self) -> AdaptiveLimitStats:
+        return AdaptiveLimitStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            increases=self._increases,
+            decreases=self._decreases,
+            overloads=self._overloads,
+            latency_seconds=self._latency,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_image_limiter() -> AdaptiveLimiter:
+    """Process-wide adaptive limit on in-flight image generation calls."""
+    settings = get_settings().gemini
+    return AdaptiveLimiter(
+        "Image generation",
+        initial=settings.max_concurrency,
+        max_limit=settings.max_in_flight,
+    )
+
+
+def get_image_concurrency_stats() -> AdaptiveLimitStats:
+    """Return the current image generation limit and what moved it."""
+    return get_image_limiter().stats()
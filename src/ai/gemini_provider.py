@@ -1,33 +1,47 @@
 from __future__ import annotations
 
-import io
 import logging
+from contextlib import AbstractAsyncContextManager
 
+import httpx
 from google import genai
-from google.genai import types
-from PIL import Image
+from google.genai import errors, types
 
-from src.ai.base import ImageProvider
+from src.ai.base import ImageProvider, ImageProviderOverloadedError
+from src.ai.rate_limit import Lease, get_rate_limiter
 from src.ai.template_loader import render_prompt
-from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
 from src.config.settings import get_settings
+from src.renderer.image_ops import GeneratedImage, probe_image
 from src.renderer.styles import StyleConfig
 from src.schemas.slide import SlideContent
 
 logger = logging.getLogger(__name__)
 
+# Responses that mean "slow down" rather than "this request is bad"
+_OVERLOAD_STATUS_CODES = frozenset({429, 503, 504})
+
 
 class GeminiImageProvider(ImageProvider):
     def __init__(self) -> None:
         settings = get_settings()
-        self.client = genai.Client(api_key=settings.gemini.api_key.get_secret_value())
+        self.client = genai.Client(
+            api_key=settings.gemini.api_key.get_secret_value(),
+            http_options=types.HttpOptions(timeout=int(settings.gemini.timeout * 1000)),
+        )
         self.model = settings.gemini.model
 
+    def admit(self) -> AbstractAsyncContextManager[Lease]:
+        """Wait for the Gemini rate limits shared by all workers.
+
+        Raises RateLimitTimeoutError if not admitted within the queue timeout.
+        """
+        return get_rate_limiter("gemini").acquire()
+
     async def generate_slide_image(
         self,
         slide: SlideContent,
         style_config: StyleConfig,
-    ) -> bytes | None:
+    ) -> GeneratedImage | None:
         extra = style_config.extra
         mood = extra.get("mood", "modern and clean")
         description = extra.get("description", style_config.name)
@@ -59,6 +73,13 @@ class GeminiImageProvider(ImageProvider):
                     response_modalities=["IMAGE", "TEXT"],
                 ),
             )
+        except errors.APIError as e:
+            if e.code in _OVERLOAD_STATUS_CODES:
+                raise ImageProviderOverloadedError(f"Gemini returned {e.code}") from e
+            logger.exception("Gemini API call failed for slide %d", slide.position)
+            return None
+        except (httpx.TimeoutException, TimeoutError) as e:
+            raise ImageProviderOverloadedError("Gemini request timed out") from e
         except Exception:
             logger.exception("Gemini API call failed for slide %d", slide.position)
             return None
@@ -85,29 +106,14 @@ class GeminiImageProvider(ImageProvider):
         logger.warning("Gemini did not return an image for slide %d", position)
         return None
 
-    def _validate_image(self, data: bytes, position: int) -> bytes | None:
-        """Validate image data: check format, resize if needed, convert to PNG."""
+    def _validate_image(self, data: bytes, position: int) -> GeneratedImage | None:
+        """Validate image data by its header (format and dimensions) only.
+
+        Pixels are not decoded here; the renderer decodes or re-encodes the
+        image at most once when producing the final slide.
+        """
         try:
-            img: Image.Image = Image.open(io.BytesIO(data))
+            return probe_image(data)
         except Exception:
             logger.warning("Gemini returned invalid image data for slide %d", position)
             return None
-
-        # Resize if dimensions don't match expected size
-        if img.size != (SLIDE_WIDTH, SLIDE_HEIGHT):
-            logger.debug(
-                "Resizing slide %d from %s to %dx%d",
-                position,
-                img.size,
-                SLIDE_WIDTH,
-                SLIDE_HEIGHT,
-            )
-            img = img.resize((SLIDE_WIDTH, SLIDE_HEIGHT), Image.LANCZOS)  # type: ignore[attr-defined]
-
-        # Convert to RGB PNG
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-
-        buf = io.BytesIO()
-        img.save(buf, format="PNG", optimize=True)
-        return buf.getvalue()
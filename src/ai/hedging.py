@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.ai.concurrency import SlotOutcome
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Hedged requests: if a call has not returned by the p90 of recent latencies,
+# fire an identical second call and take whichever answers first, cancelling
+# the other. Hedges are bounded by a budget (a fraction of all calls) so the
+# extra spend stays predictable, and are skipped until enough latencies have
+# been observed to estimate the p90. A hedge is a real extra request, so the
+# caller can make it take its own concurrency slot; with none free it is
+# skipped rather than queued.
+# ---------------------------------------------------------------------------
+
+_WINDOW = 200  # recent latencies the percentile is taken over
+_MIN_SAMPLES = 20
+_PERCENTILE = 0.9
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeStats:
+    requests: int
+    hedged: int  # extra calls fired (the spend the budget bounds)
+    hedge_wins: int  # hedges that answered first
+    delay_seconds: float | None  # current hedge delay (p90), None while warming up
+
+
+class HedgePolicy:
+    """Tracks call latency and decides when, and whether, to hedge."""
+
+    def __init__(self, budget: float) -> None:
+        self.budget = budget
+        self._latencies: deque[float] = deque(maxlen=_WINDOW)
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def record(self, latency: float) -> None:
+        """Add the latency of a call that returned a result."""
+        self._latencies.append(latency)
+
+    def delay(self) -> float | None:
+        """Seconds to wait before hedging: the p90 of recent latencies."""
+        if len(self._latencies) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[math.ceil(_PERCENTILE * len(ordered)) - 1]
+
+    def _allow_hedge(self) -> bool:
+        return self._hedged + 1 <= self.budget * self._requests
+
+    async def run[T](
+        self,
+        call: Callable[[], Awaitable[T | None]],
+        hedge_slot: Callable[[], AbstractAsyncContextManager[SlotOutcome | None]] | None = None,
+    ) -> T | None:
+        """Run ``call``, hedging it with a second identical call if it is slow.
+
+        The first non-None result wins and the other call is cancelled. If both
+        fail, the primary's exception is raised, or None returned. An exception
+        before the hedge delay is raised as is, without hedging. The hedge runs
+        inside ``hedge_slot()``, which is told its result, and is skipped when
+        that yields None.
+        """
+        self._requests += 1
+        start = time.monotonic()
+        primary: asyncio.Task[T | None] = asyncio.ensure_future(call())
+        tasks = [primary]
+        try:
+            delay = self.delay()
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+            if delay is None or primary.done() or not self._allow_hedge():
+                result = await primary
+                if result is not None:
+                    self.record(time.monotonic() - start)
+                return result
+
+            self._hedged += 1
+            logger.info("Call still running after %.1f s (p90), hedging", delay)
+
+            async def _hedge() -> T | None:
+                if hedge_slot is None:
+                    return await call()
+                async with hedge_slot() as outcome:
+                    if outcome is None:
+                        # Not fired after all, so it does not count against the budget
+                        self._hedged -= 1
+                        logger.info("No free slot for the hedge, waiting on the primary call")
+                        return None
+                    result = await call()
+                    outcome.report(result)
+                    return result
+
+            hedge_start = time.monotonic()
+            hedge: asyncio.Task[T | None] = asyncio.ensure_future(_hedge())
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None or task.result() is None:
+                        continue
+                    # Each call's own duration, so hedging does not skew the p90
+                    if task is hedge:
+                        self._hedge_wins += 1
+                        self.record(time.monotonic() - hedge_start)
+                    else:
+                        self.record(time.monotonic() - start)
+                    return task.result()
+        finally:
+            # The loser, or both calls if the caller was cancelled
+            for task in tasks:
+                task.cancel()
+
+        error = primary.exception()
+        if error is not None:
+            raise error
+        return None
+
+    def stats(self) -> HedgeStats:
+        return HedgeStats(
+            requests=self._requests,
+            hedged=self._hedged,
+            hedge_wins=self._hedge_wins,
+            delay_seconds=self.delay(),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_hook_hedge_policy() -> HedgePolicy:
+    """Process-wide hedging policy for hook image generation."""
+    return HedgePolicy(budget=get_settings().pipeline.hedge_budget)
+
+
+def get_hedge_stats() -> HedgeStats:
+    """Return hook image hedging counts: requests, extra calls fired and their wins."""
+    return get_hook_hedge_policy().stats()
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings
+from src.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Provider rate limits shared by every worker process through Redis: token
+# buckets for requests and tokens per minute, plus a lease set capping calls
+# in flight. Callers queue (poll with jitter) until admitted or the queue
+# timeout passes. If Redis is unreachable the limiter fails open.
+# ---------------------------------------------------------------------------
+
+Provider = Literal["anthropic", "gemini"]
+
+_KEY_PREFIX = "ratelimit:"
+_LEASE_TTL_MS = 300_000  # a crashed worker's slot frees itself after this
+_MIN_POLL = 0.05
+_MAX_POLL = 1.0
+
+# KEYS: one hash per bucket. ARGV: capacity, refill per ms, cost for each key, then
+# a force flag. Takes every cost or none; returns 0, or ms until all would fit.
+# Forced takes (usage reconciliation) may drive a bucket negative.
+_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local force = ARGV[#ARGV] == '1'
+local state = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+  local base = (i - 1) * 3
+  local capacity = tonumber(ARGV[base + 1])
+  local rate = tonumber(ARGV[base + 2])
+  local cost = tonumber(ARGV[base + 3])
+  local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+  local tokens = tonumber(bucket[1]) or capacity
+  local ts = tonumber(bucket[2]) or now
+  tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+  if not force and cost > tokens then
+    wait = math.max(wait, math.ceil((cost - tokens) / rate))
+  end
+  state[i] = {tokens - cost, capacity, rate}
+end
+if wait > 0 then
+  return wait
+end
+for i, key in ipairs(KEYS) do
+  local s = state[i]
+  redis.call('HSET', key, 'tokens', tostring(math.min(s[2], s[1])), 'ts', now)
+  redis.call('PEXPIRE', key, math.ceil(s[2] / s[3]) + 1000)
+end
+return 0
+"""
+
+# KEYS[1]: sorted set of leases scored by expiry. ARGV: limit, lease id, ttl ms.
+_SLOT_LUA = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+  redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[2])
+  redis.call('PEXPIRE', KEYS[1], ARGV[3])
+  return 1
+end
+return 0
+"""
+
+
+class RateLimitTimeoutError(TimeoutError):
+    """A provider call waited longer than its queue timeout for the limiter."""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitStats:
+    acquired: int
+    timeouts: int
+    wait_seconds: float  # summed queueing time of admitted calls
+    max_wait_seconds: float
+    in_flight: int  # calls of this process holding a slot
+    redis_errors: int  # admissions that failed open
+
+
+class Lease:
+    """Admission of one call; report its real token usage with ``settle``."""
+
+    __slots__ = ("_limiter", "estimated_tokens")
+
+    def __init__(self, limiter: RateLimiter, estimated_tokens: int) -> None:
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+
+    async def settle(self, actual_tokens: int) -> None:
+        """Charge (or refund) the difference between actual and estimated tokens."""
+        diff = actual_tokens - self.estimated_tokens
+        self.estimated_tokens = actual_tokens
+        await self._limiter._adjust_tokens(diff)
+
+
+class RateLimiter:
+    """Distributed RPM/TPM token buckets and concurrency cap for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        redis: Redis | None,
+        *,
+        rpm: int = 0,
+        tpm: int = 0,
+        max_in_flight: int = 0,
+        queue_timeout: float = 60.0,
+    ) -> None:
+        self.name = name
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self._redis = redis if rpm or tpm or max_in_flight else None
+        if self._redis is not None:
+            self._bucket_script = self._redis.register_script(_BUCKET_LUA)
+            self._slot_script = self._redis.register_script(_SLOT_LUA)
+        self._acquired = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._in_flight = 0
+        self._redis_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    def _bucket_args(self, tokens: int, requests: int = 1) -> tuple[list[str], list[float]]:
+        keys: list[str] = []
+        args: list[float] = []
+        if self.rpm:
+            keys.append(f"{_KEY_PREFIX}{self.name}:rpm")
+            args += [self.rpm, self.rpm / 60_000, requests]
+        if self.tpm and tokens:
+            keys.append(f"{_KEY_PREFIX}{self.name}:tpm")
+            args += [self.tpm, self.tpm / 60_000, tokens]
+        return keys, args
+
+    async def _take_tokens(self, tokens: int, deadline: float) -> None:
+        keys, args = self._bucket_args(tokens)
+        if not keys:
+            return
+        while True:
+            wait_ms = int(await self._bucket_script(keys=keys, args=[*args, 0]))
+            if wait_ms <= 0:
+                return
+            await self._sleep(wait_ms / 1000, deadline)
+
+    async def _take_slot(self, lease_id: str, deadline: float) -> bool:
+        if not self.max_in_flight:
+            return False
+        key = f"{_KEY_PREFIX}{self.name}:slots"
+        poll = _MIN_POLL
+        while not await self._slot_script(
+            keys=[key], args=[self.max_in_flight, lease_id, _LEASE_TTL_MS]
+        ):
+            await self._sleep(poll, deadline)
+            poll = min(poll * 2, _MAX_POLL)
+        return True
+
+    async def _sleep(self, seconds: float, deadline: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RateLimitTimeoutError(
+                f"{self.name} rate limiter: no capacity within {self.queue_timeout:.0f} s"
+            )
+        # Jitter so queued callers on different workers do not retry in lockstep
+        await asyncio.sleep(min(seconds * random.uniform(1.0, 1.5), remaining))
+
+    async def _adjust_tokens(self, diff: int) -> None:
+        if self._redis is None or not self.tpm or not diff:
+            return
+        key = f"{_KEY_PREFIX}{self.name}:tpm"
+        try:
+            await self._bucket_script(keys=[key], args=[self.tpm, self.tpm / 60_000, diff, 1])
+        except Exception:
+            logger.warning("Rate limiter %s: token reconciliation failed", self.name, exc_info=True)
+
+    async def _refund(self, tokens: int) -> None:
+        # Give back the request and tokens taken for a call that was not admitted
+        keys, args = self._bucket_args(-tokens, requests=-1)
+        if not keys:
+            return
+        try:
+            await self._bucket_script(keys=keys, args=[*args, 1])
+        except Exception:
+            logger.warning("Rate limiter %s: refund failed", self.name, exc_info=True)
+
+    async def _release(self, lease_id: str) -> None:
+        assert self._redis is not None
+        try:
+            await self._redis.zrem(f"{_KEY_PREFIX}{self.name}:slots", lease_id)
+        except Exception:
+            # The lease expires on its own after _LEASE_TTL_MS
+            logger.warning("Rate limiter %s: slot release failed", self.name, exc_info=True)
+
+    @asynccontextmanager
+    async def acquire(self, tokens: int = 0) -> AsyncIterator[Lease]:
+        """Wait for a request (and ``tokens`` estimated tokens) and a slot, then run the block.
+
+        A reservation larger than the whole TPM budget would never fit, so it is
+        capped to drain the bucket instead. Raises RateLimitTimeoutError if not
+        admitted within ``queue_timeout``, refunding the request and tokens if
+        only the slot was missing.
+        """
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+        lease = Lease(self, tokens)
+        if self._redis is None:
+            yield lease
+            return
+
+        lease_id = uuid.uuid4().hex
+        start = time.monotonic()
+        deadline = start + self.queue_timeout
+        took_tokens = holds_slot = False
+        try:
+            await self._take_tokens(tokens, deadline)
+            took_tokens = True
+            holds_slot = await self._take_slot(lease_id, deadline)
+        except RateLimitTimeoutError:
+            self._timeouts += 1
+            if took_tokens:
+                await self._refund(tokens)
+            raise
+        except Exception:
+            self._redis_errors += 1
+            logger.warning("Rate limiter %s unavailable, admitting call", self.name, exc_info=True)
+        waited = time.monotonic() - start
+        self._acquired += 1
+        self._wait_seconds += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        if waited >= 1:
+            logger.info("Rate limiter %s: call waited %.1f s", self.name, waited)
+
+        self._in_flight += 1
+        try:
+            yield lease
+        finally:
+            self._in_flight -= 1
+            if holds_slot:
+                await self._release(lease_id)
+
+    def stats(self) -> RateLimitStats:
+        return RateLimitStats(
+            acquired=self._acquired,
+            timeouts=self._timeouts,
+            wait_seconds=self._wait_seconds,
+            max_wait_seconds=self._max_wait_seconds,
+            in_flight=self._in_flight,
+            redis_errors=self._redis_errors,
+        )
+
+
+@lru_cache(maxsize=2)
+def get_rate_limiter(provider: Provider) -> RateLimiter:
+    """Process-wide limiter for ``provider``; a no-op when its limits are all 0."""
+    settings = get_settings()
+    if provider == "anthropic":
+        a = settings.anthropic
+        rpm, tpm, in_flight, timeout = a.rpm, a.tpm, a.global_concurrency, a.queue_timeout
+    else:
+        g = settings.gemini
+        rpm, tpm, in_flight, timeout = g.rpm, 0, g.global_concurrency, g.queue_timeout
+    redis = get_redis() if rpm or tpm or in_flight else None
+    return RateLimiter(
+        provider,
+        redis,
+        rpm=rpm,
+        tpm=tpm,
+        max_in_flight=in_flight,
+        queue_timeout=timeout,
+    )
+
+
+def get_rate_limit_stats() -> dict[str, RateLimitStats]:
+    """Return queueing metrics of this process's enabled limiters."""
+    stats: dict[str, RateLimitStats] = {}
+    for provider in ("anthropic", "gemini"):
+        limiter = get_rate_limiter(provider)
+        if limiter.enabled:
+            stats[provider] = limiter.stats()
+    return stats
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+import logging
+from functools import lru_cache
 from pathlib import Path
 
 from mako.lookup import TemplateLookup
 
-_TEMPLATE_DIR = str(Path(__file__).resolve().parent / "templates")
+from src.config.settings import get_settings
 
-_lookup = TemplateLookup(
-    directories=[_TEMPLATE_DIR],
-    strict_undefined=True,
-    input_encoding="utf-8",
-    default_filters=["str", "h"],
-)
+logger = logging.getLogger(__name__)
+
+_TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+
+@lru_cache(maxsize=1)
+def _get_lookup() -> TemplateLookup:
+    cache_dir = get_settings().template_cache_dir
+    return TemplateLookup(
+        directories=[str(_TEMPLATE_DIR)],
+        module_directory=str(Path(cache_dir) / "prompts") if cache_dir else None,
+        strict_undefined=True,
+        input_encoding="utf-8",
+        default_filters=["str", "h"],
+    )
 
 
 def render_prompt(template_name: str, **kwargs: object) -> str:
     """Render a Mako template by name and return the stripped result."""
-    tmpl = _lookup.get_template(template_name)
+    tmpl = _get_lookup().get_template(template_name)
     return tmpl.render(**kwargs).strip()  # type: ignore[no-any-return]
+
+
+def warm_templates() -> int:
+    """Compile every prompt template so the first generation doesn't pay for it."""
+    lookup = _get_lookup()
+    names = sorted(p.name for p in _TEMPLATE_DIR.glob("*.mako"))
+    for name in names:
+        lookup.get_template(name)
+    logger.debug("Compiled %d prompt templates", len(names))
+    return len(names)
@@ -0,0 +1,10 @@
+Style: ${style_slug}
+Number of slides: ${slide_count}
+
+Write ONLY the first slide of this carousel: the "hook" slide.
+Output a JSON array containing exactly one hook slide object.
+
+User text:
+<user_text>
+${input_text}
+</user_text>
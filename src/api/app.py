@@ -13,6 +13,7 @@ from fastapi import FastAPI
 from src.api.routers import admin, health, payments, webhook
 from src.bot.factory import create_bot, create_dispatcher
 from src.config.settings import get_settings
+from src.worker.startup import warm_templates
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,12 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
 
+    # Compile Mako templates before the first request needs them
+    try:
+        await asyncio.to_thread(warm_templates)
+    except Exception:
+        logger.warning("Failed to precompile templates", exc_info=True)
+
     # Create bot & dispatcher
     bot = create_bot(settings)
     dp = create_dispatcher(settings)
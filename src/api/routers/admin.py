@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.dependencies import get_db_session, verify_admin_api_key
 from src.models.carousel import CarouselGeneration
 from src.models.user import User
+from src.renderer.cta import request_cta_refresh
 
 router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(verify_admin_api_key)])
 
@@ -21,3 +22,10 @@ async def stats(
         "total_users": user_count or 0,
         "total_carousels": carousel_count or 0,
     }
+
+
+@router.post("/cta/refresh")
+async def refresh_cta() -> dict[str, int]:
+    """Make workers re-read CTA assets after they change on disk."""
+    version = await request_cta_refresh()
+    return {"cta_version": version}
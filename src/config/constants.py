@@ -64,7 +64,8 @@ AVAILABLE_STYLES: tuple[str, ...] = (
 
 # ── Image generation ─────────────────────────────────────
 IMAGE_GEN_MAX_RETRIES = 2
-IMAGE_GEN_RETRY_BACKOFF = 1.0
+IMAGE_GEN_RETRY_BACKOFF = 1.0  # base of the jittered exponential backoff
+IMAGE_GEN_RETRY_BACKOFF_MAX = 16.0
 
 # ── Style display names ──────────────────────────────────
 STYLE_DISPLAY_NAMES: dict[str, str] = {
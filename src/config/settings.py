@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import tempfile
 from functools import lru_cache
+from pathlib import Path
+from typing import Literal
 from urllib.parse import quote_plus
 
 from pydantic import Field, SecretStr, model_validator
@@ -43,6 +46,8 @@ class S3Settings(BaseSettings):
     secret_key: SecretStr = SecretStr("minioadmin")
     bucket: str = "carousels"
     region: str = "us-east-1"
+    max_pool_connections: int = 16  # urllib3 pool size of the shared boto3 client
+    upload_concurrency: int = 8  # threads running blocking PUTs off the event loop
 
 
 class TelegramSettings(BaseSettings):
@@ -59,6 +64,12 @@ class AnthropicSettings(BaseSettings):
     api_key: SecretStr = SecretStr("")
     model: str = "claude-sonnet-4-20250514"
     max_tokens: int = 4096
+    streaming: bool = False  # stream slides and start rendering before copy is complete
+    # Budgets shared by every worker through Redis (src.ai.rate_limit); 0 disables each
+    rpm: int = 0
+    tpm: int = 0  # input + output tokens per minute
+    global_concurrency: int = 0  # calls in flight across all workers
+    queue_timeout: float = 60.0  # seconds a call may wait for the limiter
 
 
 class GeminiSettings(BaseSettings):
@@ -66,7 +77,69 @@ class GeminiSettings(BaseSettings):
 
     api_key: SecretStr = SecretStr("")
     model: str = "gemini-2.5-flash-image"
-    max_concurrency: int = 3
+    max_concurrency: int = 3  # image calls in flight per carousel
+    # Image calls in flight per worker process; adapted (AIMD) between 1 and this cap,
+    # starting at max_concurrency
+    max_in_flight: int = 8
+    timeout: float = 90.0  # seconds per image request
+    retry_deadline: float = 120.0  # seconds a carousel may spend on image calls and retries
+    # Budgets shared by every worker through Redis (src.ai.rate_limit); 0 disables each
+    rpm: int = 0
+    global_concurrency: int = 0  # calls in flight across all workers
+    queue_timeout: float = 60.0  # seconds a call may wait for the limiter
+
+
+class RendererSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", env_prefix="RENDERER_")
+
+    page_pool_size: int = 4
+    page_max_uses: int = 100  # recycle a pooled page after this many renders
+    # Recycle the whole browser after this many renders or above this memory (MiB, summed
+    # PSS of Chromium's processes); 0 disables
+    browser_max_renders: int = 5000
+    browser_max_rss_mb: int = 1536
+    render_concurrency: int = 0  # slides rendered in parallel; 0 = page_pool_size
+    render_cache_max_bytes: int = 64 * 1024 * 1024  # local LRU budget; 0 disables the cache
+    render_cache_redis: bool = False  # share rendered slides across workers via Redis
+    render_cache_ttl: int = 86400
+    # "ready": wait for the template's fonts/images sentinel; "networkidle": legacy 500 ms idle
+    wait_strategy: Literal["ready", "networkidle"] = "ready"
+    ready_timeout_ms: int = 10_000
+    batch_render: bool = False  # render a carousel's HTML slides in one page
+    # Content templates drawn with Pillow instead of Chromium, e.g. ["text","stats","quote"].
+    # Only used when the style's fonts are present in assets/fonts.
+    pillow_templates: list[str] = []
+    image_workers: int = 2  # threads for Pillow decode/resize/encode off the event loop
+    # Encoding of every produced slide (renders, CTA, hook image, S3, Telegram)
+    output_format: Literal["png", "jpeg", "webp"] = "png"
+    output_quality: int = 90  # jpeg/webp quality
+    png_compress_level: int = 6  # zlib level 0-9; higher is smaller and slower
+
+
+class PipelineSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", env_prefix="PIPELINE_")
+
+    # Start the hook image while Claude is still writing the remaining slides
+    speculative_hook: bool = False
+    # What to do when the final hook differs from the speculative one
+    hook_mismatch_policy: Literal["adopt", "regenerate"] = "adopt"
+    # Fire a second hook image request if the first is slower than the recent p90;
+    # the faster one wins. Hedges are capped at hedge_budget of all hook image requests.
+    hedge_hook_image: bool = False
+    hedge_budget: float = 0.1
+
+
+class WorkerSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", env_prefix="WORKER_")
+
+    # "prefork": one carousel per process; "threads": one process runs many carousels
+    # as coroutines on its shared loop, a pool thread only waiting on each
+    pool: Literal["prefork", "threads"] = "prefork"
+    concurrency: int = 2  # prefork processes
+    max_in_flight: int = 16  # threads pool: carousels in flight per process
+    # Each worker process writes <pid>.json here once warm; read by src.worker.healthcheck
+    ready_dir: str = str(Path(tempfile.gettempdir()) / "carouselmaker-worker")
+    stats_log_interval: float = 60.0  # seconds between src.worker.metrics log lines, 0 disables
 
 
 class YooKassaSettings(BaseSettings):
@@ -91,6 +164,8 @@ class Settings(BaseSettings):
     app_debug: bool = False
     app_log_level: str = "INFO"
     admin_api_key: SecretStr = SecretStr("change-me")
+    # Compiled Mako templates are persisted here and reused across processes; "" = memory only
+    template_cache_dir: str = str(Path(tempfile.gettempdir()) / "carouselmaker-mako")
 
     db: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
@@ -98,6 +173,9 @@ class Settings(BaseSettings):
     telegram: TelegramSettings = Field(default_factory=TelegramSettings)
     anthropic: AnthropicSettings = Field(default_factory=AnthropicSettings)
     gemini: GeminiSettings = Field(default_factory=GeminiSettings)
+    renderer: RendererSettings = Field(default_factory=RendererSettings)
+    pipeline: PipelineSettings = Field(default_factory=PipelineSettings)
+    worker: WorkerSettings = Field(default_factory=WorkerSettings)
     yookassa: YooKassaSettings = Field(default_factory=YooKassaSettings)
 
     @property
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    """Shared async Redis client for the current process (lazily connected)."""
+    settings = get_settings()
+    return Redis.from_url(settings.redis.url)  # type: ignore[no-any-return]
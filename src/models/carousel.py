@@ -41,6 +41,13 @@ class CarouselGeneration(TimestampMixin, Base):
     slide_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     celery_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    copy_input_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    copy_output_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    copy_cache_read_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    copy_cache_write_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Stage checkpoints so a retry of the same task resumes instead of starting over
+    slides_data: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON SlideContent list
+    hook_image_s3_key: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     user: Mapped[User] = relationship("User", back_populates="carousel_generations")
     slides: Mapped[list[Slide]] = relationship(
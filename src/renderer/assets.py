@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from playwright.async_api import Route
+
+logger = logging.getLogger(__name__)
+
+# Fake origin for fonts and images referenced from slide HTML. Requests to it
+# never leave Chromium: pooled pages fulfil them from memory via page.route().
+ASSET_ORIGIN = "https://assets.carouselmaker.invalid"
+ASSET_ROUTE_PATTERN = f"{ASSET_ORIGIN}/**"
+
+_ASSET_HEADERS = {
+    # Slides are loaded with set_content (opaque origin); fonts need CORS.
+    "Access-Control-Allow-Origin": "*",
+    # URLs are content-addressed, so the bytes behind one never change.
+    "Cache-Control": "public, max-age=31536000, immutable",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class AssetStoreStats:
+    entries: int
+    bytes: int
+    served: int
+    missing: int
+
+
+class _Asset:
+    __slots__ = ("content_type", "data", "pinned", "refs")
+
+    def __init__(self, data: bytes, content_type: str, pinned: bool) -> None:
+        self.data = data
+        self.content_type = content_type
+        self.pinned = pinned
+        self.refs = 0
+
+
+class AssetStore:
+    """In-memory assets served to Chromium under ``ASSET_ORIGIN``.
+
+    Paths are content hashes. Pinned assets (fonts) live for the process;
+    others are reference-counted and dropped once the last render using
+    them releases its URL.
+    """
+
+    def __init__(self) -> None:
+        self._assets: dict[str, _Asset] = {}
+        self._served = 0
+        self._missing = 0
+
+    def put(self, data: bytes, content_type: str, suffix: str, *, pinned: bool = False) -> str:
+        """Store ``data`` and return its URL. Unpinned assets must be released."""
+        path = f"{hashlib.sha256(data).hexdigest()}{suffix}"
+        asset = self._assets.get(path)
+        if asset is None:
+            asset = _Asset(data, content_type, pinned)
+            self._assets[path] = asset
+        asset.pinned = asset.pinned or pinned
+        asset.refs += 1
+        return f"{ASSET_ORIGIN}/{path}"
+
+    def release(self, url: str) -> None:
+        path = urlsplit(url).path.lstrip("/")
+        asset = self._assets.get(path)
+        if asset is None:
+            return
+        asset.refs -= 1
+        if asset.refs <= 0 and not asset.pinned:
+            del self._assets[path]
+
+    @contextmanager
+    def published(self, data: bytes, content_type: str, suffix: str) -> Iterator[str]:
+        """Serve ``data`` for the duration of the block."""
+        url = self.put(data, content_type, suffix)
+        try:
+            yield url
+        finally:
+            self.release(url)
+
+    async def handle_route(self, route: Route) -> None:
+        """Playwright route handler for ``ASSET_ROUTE_PATTERN``."""
+        path = urlsplit(route.request.url).path.lstrip("/")
+        asset = self._assets.get(path)
+        if asset is None:
+            self._missing += 1
+            logger.warning("Renderer requested unknown asset %s", route.request.url)
+            await route.fulfill(status=404, headers=_ASSET_HEADERS)
+            return
+        self._served += 1
+        await route.fulfill(
+            status=200,
+            body=asset.data,
+            content_type=asset.content_type,
+            headers=_ASSET_HEADERS,
+        )
+
+    def stats(self) -> AssetStoreStats:
+        return AssetStoreStats(
+            entries=len(self._assets),
+            bytes=sum(len(a.data) for a in self._assets.values()),
+            served=self._served,
+            missing=self._missing,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_asset_store() -> AssetStore:
+    """Process-wide asset store shared by all pooled pages."""
+    return AssetStore()
@@ -2,67 +2,570 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
-from playwright.async_api import Browser, Playwright, async_playwright
+from playwright.async_api import Browser, FloatRect, Page, Playwright, async_playwright
 
 from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
+from src.config.settings import get_settings
+from src.renderer.assets import ASSET_ROUTE_PATTERN, get_asset_store
+from src.renderer.image_ops import get_output_format, run_image_op, transcode
 
 logger = logging.getLogger(__name__)
 
 _playwright: Playwright | None = None
-_browser: Browser | None = None
+_current: _BrowserHandle | None = None
+_retiring: set[_BrowserHandle] = set()  # recycled, closed once their renders finish
+_background: set[asyncio.Task[None]] = set()
+_restarts: dict[str, int] = {}  # by reason: renders, rss, crash
+_total_renders = 0
 _lock = asyncio.Lock()
 
+# Scanning /proc for the browser's memory is cheap but not free
+_RSS_CHECK_INTERVAL = 30.0
 
-async def _ensure_browser() -> Browser:
-    """Lazily start Playwright and launch headless Chromium."""
-    global _playwright, _browser  # noqa: PLW0603
-    if _browser is not None and _browser.is_connected():
-        return _browser
-    async with _lock:
-        if _browser is not None and _browser.is_connected():
-            return _browser
-        _playwright = await async_playwright().start()
-        _browser = await _playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-            ],
+# Set by base.html.mako once fonts and images are decoded
+_READY_EXPRESSION = "window.__slideReady === true"
+
+
+@dataclass(frozen=True, slots=True)
+class PagePoolStats:
+    size: int
+    idle: int
+    in_use: int
+    waiters: int
+    hits: int
+    misses: int
+    recycles: int
+
+
+@dataclass(frozen=True, slots=True)
+class RenderLatencyStats:
+    renders: int
+    load_seconds: float  # set_content until ready, summed
+    screenshot_seconds: float
+    max_load_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserStats:
+    running: bool
+    uptime_seconds: float  # of the current browser
+    renders: int  # served by the current browser
+    total_renders: int
+    restarts: int
+    restarts_by_reason: dict[str, int]
+    retiring: int  # recycled browsers still finishing in-flight renders
+
+
+class _LatencyTimer:
+    __slots__ = ("load_seconds", "max_load_seconds", "renders", "screenshot_seconds")
+
+    def __init__(self) -> None:
+        self.renders = 0
+        self.load_seconds = 0.0
+        self.screenshot_seconds = 0.0
+        self.max_load_seconds = 0.0
+
+
+# Keyed by wait strategy so the two can be compared side by side
+_latency: dict[str, _LatencyTimer] = {}
+
+
+class PagePool:
+    """Bounded pool of reusable Chromium pages at the standard slide viewport.
+
+    Pages are checked out per render and reset to ``about:blank`` on return.
+    A page is recycled (closed and replaced lazily) after ``max_uses`` renders,
+    when it crashed or was closed, or when the render using it raised.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        size: int,
+        max_uses: int,
+        width: int = SLIDE_WIDTH,
+        height: int = SLIDE_HEIGHT,
+    ) -> None:
+        self.browser = browser
+        self.size = max(1, size)
+        self.width = width
+        self.height = height
+        self._max_uses = max_uses
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: deque[Page] = deque()
+        self._uses: dict[Page, int] = {}
+        self._in_use = 0
+        self._waiters = 0
+        self._hits = 0
+        self._misses = 0
+        self._recycles = 0
+
+    async def _new_page(self) -> Page:
+        page = await _open_page(self.browser, self.width, self.height)
+        self._uses[page] = 0
+        return page
+
+    async def _discard(self, page: Page) -> None:
+        self._uses.pop(page, None)
+        self._recycles += 1
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            logger.debug("Failed to close recycled page", exc_info=True)
+
+    async def acquire(self) -> Page:
+        """Check out a page, waiting if all ``size`` pages are in use."""
+        if self._slots.locked():
+            self._waiters += 1
+            try:
+                await self._slots.acquire()
+            finally:
+                self._waiters -= 1
+        else:
+            await self._slots.acquire()
+
+        try:
+            while self._idle:
+                page = self._idle.popleft()
+                if not page.is_closed():
+                    self._hits += 1
+                    break
+                await self._discard(page)
+            else:
+                page = await self._new_page()
+                self._misses += 1
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_use += 1
+        return page
+
+    async def release(self, page: Page, *, discard: bool = False) -> None:
+        """Return a page to the pool, resetting or recycling it."""
+        try:
+            uses = self._uses.get(page, 0) + 1
+            self._uses[page] = uses
+            if discard or page.is_closed() or uses >= self._max_uses:
+                await self._discard(page)
+                return
+            try:
+                await page.goto("about:blank")
+            except Exception:
+                logger.debug("Failed to reset pooled page, recycling", exc_info=True)
+                await self._discard(page)
+                return
+            self._idle.append(page)
+        finally:
+            self._in_use -= 1
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Check out a page for the duration of the block."""
+        page = await self.acquire()
+        failed = False
+        try:
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.release(page, discard=failed)
+
+    async def warm(self) -> None:
+        """Pre-create idle pages until the pool is full."""
+        missing = self.size - len(self._idle) - self._in_use
+        if missing <= 0:
+            return
+        pages = await asyncio.gather(*(self._new_page() for _ in range(missing)))
+        self._idle.extend(pages)
+        logger.info("Page pool warmed with %d pages", len(pages))
+
+    async def close(self) -> None:
+        """Close all idle pages. In-use pages close with their browser."""
+        while self._idle:
+            page = self._idle.popleft()
+            self._uses.pop(page, None)
+            try:
+                await page.close()
+            except Exception:
+                logger.debug("Failed to close pooled page", exc_info=True)
+
+    def stats(self) -> PagePoolStats:
+        return PagePoolStats(
+            size=self.size,
+            idle=len(self._idle),
+            in_use=self._in_use,
+            waiters=self._waiters,
+            hits=self._hits,
+            misses=self._misses,
+            recycles=self._recycles,
         )
-        logger.info("Playwright Chromium browser launched")
-        return _browser
 
 
-async def render_html_to_png(
-    html: str,
-    width: int = SLIDE_WIDTH,
-    height: int = SLIDE_HEIGHT,
-) -> bytes:
-    """Render an HTML string to PNG bytes via headless Chromium."""
-    browser = await _ensure_browser()
+async def _open_page(browser: Browser, width: int, height: int) -> Page:
+    """Open a page at the given viewport with in-memory asset routing installed."""
     page = await browser.new_page(
         viewport={"width": width, "height": height},
         device_scale_factor=1,
     )
+    await page.route(ASSET_ROUTE_PATTERN, get_asset_store().handle_route)
+    return page
+
+
+class _BrowserHandle:
+    """One launched Chromium with its page pool and usage counters."""
+
+    __slots__ = ("browser", "in_flight", "last_rss_check", "pool", "renders", "started")
+
+    def __init__(self, browser: Browser, pool: PagePool) -> None:
+        self.browser = browser
+        self.pool = pool
+        self.started = time.monotonic()
+        self.last_rss_check = self.started
+        self.renders = 0
+        self.in_flight = 0
+
+
+async def _launch() -> _BrowserHandle:
+    global _playwright  # noqa: PLW0603
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    browser = await _playwright.chromium.launch(
+        headless=True,
+        args=[
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+        ],
+    )
+    settings = get_settings().renderer
+    pool = PagePool(
+        browser,
+        size=settings.page_pool_size,
+        max_uses=settings.page_max_uses,
+    )
+    logger.info("Playwright Chromium browser launched")
+    return _BrowserHandle(browser, pool)
+
+
+async def _ensure_handle() -> _BrowserHandle:
+    """Return the current browser, launching one if there is none or it crashed."""
+    global _current  # noqa: PLW0603
+    handle = _current
+    if handle is not None and handle.browser.is_connected():
+        return handle
+    async with _lock:
+        handle = _current
+        if handle is not None and handle.browser.is_connected():
+            return handle
+        if handle is not None:
+            _retire(handle, "crash")
+        _current = await _launch()
+        return _current
+
+
+def _retire(handle: _BrowserHandle, reason: str, memory: int | None = None) -> None:
+    """Stop routing renders to ``handle``; close it once its in-flight renders finish.
+
+    ``memory`` is the process tree's PSS in bytes, when it was just measured.
+    """
+    global _current  # noqa: PLW0603
+    if handle in _retiring:
+        return
+    if _current is handle:
+        _current = None
+    _retiring.add(handle)
+    _restarts[reason] = _restarts.get(reason, 0) + 1
+    pool = handle.pool.stats()
+    logger.info(
+        "Recycling Chromium browser (%s) after %d renders, %.0f s uptime%s; "
+        "page pool: %d hits, %d misses, %d recycles",
+        reason,
+        handle.renders,
+        time.monotonic() - handle.started,
+        f", {memory / 1024 / 1024:.0f} MB PSS" if memory is not None else "",
+        pool.hits,
+        pool.misses,
+        pool.recycles,
+    )
+    if handle.in_flight == 0:
+        _spawn(_close_handle(handle))
+    if reason != "shutdown":
+        # Launch the replacement now rather than on the next render
+        _spawn(warm_up())
+
+
+async def _close_handle(handle: _BrowserHandle) -> None:
     try:
+        await handle.pool.close()
+        if handle.browser.is_connected():
+            await handle.browser.close()
+    except Exception:
+        logger.debug("Failed to close retired browser", exc_info=True)
+    finally:
+        _retiring.discard(handle)
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> None:
+    task = asyncio.create_task(coro)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+def _process_memory(pid: int, page_size: int) -> int:
+    """Proportional set size (PSS) of ``pid``, or its RSS without smaps_rollup.
+
+    Chromium's processes share many pages; PSS splits each shared page
+    between its sharers, so a sum over the tree counts it once where RSS
+    would count it in every process.
+    """
+    proc = Path("/proc") / str(pid)
+    try:
+        with (proc / "smaps_rollup").open() as rollup:
+            for line in rollup:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, IndexError, ValueError):
+        pass
+    try:
+        return int((proc / "statm").read_text().split()[1]) * page_size
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def _process_tree_pss() -> int | None:
+    """Memory of this process's descendants (Playwright driver and Chromium), as PSS.
+
+    Reads /proc, so it is Linux only; returns None elsewhere.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children: dict[int, list[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # Fields after the parenthesised command name: state, ppid, ...
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        total += _process_memory(pid, page_size)
+    return total
+
+
+async def _check_health(handle: _BrowserHandle) -> None:
+    """Retire the browser after a crash, ``browser_max_renders`` or ``browser_max_rss_mb``."""
+    settings = get_settings().renderer
+    if not handle.browser.is_connected():
+        _retire(handle, "crash")
+    elif settings.browser_max_renders and handle.renders >= settings.browser_max_renders:
+        _retire(handle, "renders")
+    elif settings.browser_max_rss_mb and not _retiring:
+        # A retiring browser still holds memory; wait until it is gone
+        now = time.monotonic()
+        if now - handle.last_rss_check < _RSS_CHECK_INTERVAL:
+            return
+        handle.last_rss_check = now
+        memory = await asyncio.to_thread(_process_tree_pss)
+        if memory is not None and memory > settings.browser_max_rss_mb * 1024 * 1024:
+            _retire(handle, "rss", memory)
+
+
+async def warm_up() -> None:
+    """Launch the browser and pre-create the page pool. Call on worker start."""
+    handle = await _ensure_handle()
+    await handle.pool.warm()
+
+
+def get_pool_stats() -> PagePoolStats | None:
+    """Return page pool metrics, or None if the browser has not been started."""
+    return _current.pool.stats() if _current is not None else None
+
+
+def get_browser_stats() -> BrowserStats:
+    """Return lifetime metrics of the current browser and its restarts."""
+    handle = _current
+    return BrowserStats(
+        running=handle is not None,
+        uptime_seconds=time.monotonic() - handle.started if handle is not None else 0.0,
+        renders=handle.renders if handle is not None else 0,
+        total_renders=_total_renders,
+        restarts=sum(_restarts.values()),
+        restarts_by_reason=dict(_restarts),
+        retiring=len(_retiring),
+    )
+
+
+def get_render_stats() -> dict[str, RenderLatencyStats]:
+    """Return render latency metrics per wait strategy."""
+    return {
+        strategy: RenderLatencyStats(
+            renders=t.renders,
+            load_seconds=t.load_seconds,
+            screenshot_seconds=t.screenshot_seconds,
+            max_load_seconds=t.max_load_seconds,
+        )
+        for strategy, t in _latency.items()
+    }
+
+
+async def _load(page: Page, html: str) -> _LatencyTimer:
+    """Load HTML and wait until it is ready to screenshot, per ``wait_strategy``."""
+    settings = get_settings().renderer
+    strategy = settings.wait_strategy
+    start = time.perf_counter()
+    if strategy == "networkidle":
         await page.set_content(html, wait_until="networkidle")
+    else:
+        await page.set_content(html, wait_until="domcontentloaded")
+        await page.wait_for_function(_READY_EXPRESSION, timeout=settings.ready_timeout_ms)
+    elapsed = time.perf_counter() - start
+
+    timer = _latency.setdefault(strategy, _LatencyTimer())
+    timer.renders += 1
+    timer.load_seconds += elapsed
+    timer.max_load_seconds = max(timer.max_load_seconds, elapsed)
+    return timer
+
+
+async def _capture(page: Page, clip: FloatRect, *, full_page: bool = False) -> bytes:
+    """Screenshot ``clip`` in the output format.
+
+    Chromium encodes PNG and JPEG itself; WebP is transcoded on the image-ops pool.
+    """
+    output = get_output_format()
+    if output.format == "jpeg":
         return await page.screenshot(
-            type="png",
-            clip={"x": 0, "y": 0, "width": width, "height": height},
+            type="jpeg", quality=output.quality, clip=clip, full_page=full_page
         )
-    finally:
-        await page.close()
+    data = await page.screenshot(type="png", clip=clip, full_page=full_page)
+    if output.format == "webp":
+        return await run_image_op("transcode", transcode, data, output)
+    return data
+
+
+async def _on_page[T](width: int, height: int, fn: Callable[[Page], Awaitable[T]]) -> T:
+    """Run ``fn`` on a pooled page, or a one-off page for a non-standard viewport.
+
+    Renders are counted against the browser that served them. A render that
+    failed because Chromium crashed is retried once on a fresh browser.
+    """
+    global _total_renders  # noqa: PLW0603
+    for attempt in range(2):
+        handle = await _ensure_handle()
+        handle.in_flight += 1
+        try:
+            if (width, height) == (handle.pool.width, handle.pool.height):
+                async with handle.pool.page() as page:
+                    return await fn(page)
+            page = await _open_page(handle.browser, width, height)
+            try:
+                return await fn(page)
+            finally:
+                await page.close()
+        except Exception:
+            if attempt or handle.browser.is_connected():
+                raise
+            logger.warning("Chromium crashed during a render, retrying on a new browser")
+        finally:
+            handle.in_flight -= 1
+            handle.renders += 1
+            _total_renders += 1
+            if handle in _retiring:
+                if handle.in_flight == 0:
+                    _spawn(_close_handle(handle))
+            else:
+                await _check_health(handle)
+    raise AssertionError("unreachable")
+
+
+async def render_html_to_image(
+    html: str,
+    width: int = SLIDE_WIDTH,
+    height: int = SLIDE_HEIGHT,
+) -> bytes:
+    """Render an HTML string to image bytes in the output format via headless Chromium."""
+
+    async def _render(page: Page) -> bytes:
+        timer = await _load(page, html)
+        start = time.perf_counter()
+        image = await _capture(page, {"x": 0, "y": 0, "width": width, "height": height})
+        timer.screenshot_seconds += time.perf_counter() - start
+        return image
+
+    return await _on_page(width, height, _render)
+
+
+async def render_html_sections(
+    html: str,
+    count: int,
+    width: int = SLIDE_WIDTH,
+    height: int = SLIDE_HEIGHT,
+) -> list[bytes]:
+    """Render a document of ``count`` stacked ``width`` x ``height`` sections.
+
+    The document is loaded once and each section is captured by clipping the
+    full-page screenshot, so styles and fonts are parsed once per batch.
+    """
+
+    async def _render(page: Page) -> list[bytes]:
+        timer = await _load(page, html)
+        start = time.perf_counter()
+        shots = [
+            await _capture(
+                page,
+                {"x": 0, "y": i * height, "width": width, "height": height},
+                full_page=True,
+            )
+            for i in range(count)
+        ]
+        timer.screenshot_seconds += time.perf_counter() - start
+        return shots
+
+    return await _on_page(width, height, _render)
 
 
 async def shutdown() -> None:
-    """Close browser and Playwright. Call on worker shutdown."""
-    global _playwright, _browser  # noqa: PLW0603
-    if _browser is not None:
-        await _browser.close()
-        _browser = None
+    """Close page pools, browsers and Playwright. Call on worker shutdown."""
+    global _playwright, _current  # noqa: PLW0603
+    handles = {*_retiring, *([_current] if _current is not None else [])}
+    # Stop pending closes and replacement launches first, so none starts a
+    # browser after this. A close cut short leaves its handle to the loop below.
+    tasks = list(_background)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    handles.update(_retiring)
+    if _current is not None:
+        handles.add(_current)
+    _current = None
+    _retiring.clear()
+    for handle in handles:
+        await handle.pool.close()
+        if handle.browser.is_connected():
+            await handle.browser.close()
     if _playwright is not None:
         await _playwright.stop()
         _playwright = None
-    logger.info("Playwright browser shut down")
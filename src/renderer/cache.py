@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.config.settings import get_settings
+from src.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+_REDIS_KEY_PREFIX = "render:"
+
+
+@dataclass(frozen=True, slots=True)
+class RenderCacheStats:
+    hits: int
+    remote_hits: int
+    misses: int
+    entries: int
+    bytes: int
+    evictions: int
+
+
+def render_cache_key(html: str, width: int, height: int, output_format: str) -> str:
+    """Stable content hash of a render input (HTML, viewport and output format tag)."""
+    digest = hashlib.sha256()
+    digest.update(f"{width}x{height}:{output_format}\n".encode())
+    digest.update(html.encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Content-addressed cache of rendered slide images.
+
+    A process-local LRU bounded by total bytes, optionally backed by Redis so
+    retries on other workers also skip the browser.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        redis: Redis | None = None,
+        ttl: int = 86400,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self._redis = redis
+        self._ttl = ttl
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._remote_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _put_local(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._evictions += 1
+
+    async def get(self, key: str) -> bytes | None:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return data
+
+        if self._redis is not None:
+            try:
+                remote = await self._redis.get(_REDIS_KEY_PREFIX + key)
+            except Exception:
+                logger.debug("Render cache Redis lookup failed", exc_info=True)
+                remote = None
+            if remote is not None:
+                self._remote_hits += 1
+                self._put_local(key, remote)
+                return bytes(remote)
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: str, data: bytes) -> None:
+        self._put_local(key, data)
+        if self._redis is not None:
+            try:
+                await self._redis.set(_REDIS_KEY_PREFIX + key, data, ex=self._ttl)
+            except Exception:
+                logger.debug("Render cache Redis store failed", exc_info=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> RenderCacheStats:
+        return RenderCacheStats(
+            hits=self._hits,
+            remote_hits=self._remote_hits,
+            misses=self._misses,
+            entries=len(self._entries),
+            bytes=self._bytes,
+            evictions=self._evictions,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_render_cache() -> RenderCache | None:
+    """Process-wide render cache, or None when disabled by settings."""
+    settings = get_settings().renderer
+    if settings.render_cache_max_bytes <= 0:
+        return None
+    redis: Redis | None = None
+    if settings.render_cache_redis:
+        redis = get_redis()
+    return RenderCache(
+        max_bytes=settings.render_cache_max_bytes,
+        redis=redis,
+        ttl=settings.render_cache_ttl,
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from src.config.constants import AVAILABLE_STYLES, SLIDE_HEIGHT, SLIDE_WIDTH
+from src.db.redis import get_redis
+from src.renderer.engine import load_cta_image
+from src.renderer.image_ops import normalize_image, run_image_op
+
+logger = logging.getLogger(__name__)
+
+# Bumped by the admin refresh endpoint; workers drop their cached CTA slides
+# when they see a version different from the one they loaded against.
+CTA_VERSION_KEY = "cta:version"
+# Seconds between version checks, so cache hits do not each cost a Redis GET
+VERSION_CHECK_INTERVAL = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class CtaCacheStats:
+    entries: int
+    hits: int
+    loads: int
+    refreshes: int
+    version: int
+
+
+def prepare_cta_image(style_slug: str) -> bytes | None:
+    """Load a style's pre-made CTA asset and encode it as a final slide image.
+
+    Blocking disk and Pillow work: call through ``run_image_op`` from async code.
+    """
+    data = load_cta_image(style_slug)
+    if data is None:
+        return None
+    return normalize_image(data, SLIDE_WIDTH, SLIDE_HEIGHT)
+
+
+class CtaCache:
+    """Per-process memo of final CTA slide bytes, keyed by style slug.
+
+    Missing assets are memoized too, so the warning is logged once per refresh.
+    A refresh is noticed within ``version_check_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        version_check_interval: float = VERSION_CHECK_INTERVAL,
+    ) -> None:
+        self._redis = redis
+        self._version_check_interval = version_check_interval
+        self._version_checked_at = float("-inf")
+        self._images: dict[str, bytes | None] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._version = 0
+        self._hits = 0
+        self._loads = 0
+        self._refreshes = 0
+
+    async def get(self, style_slug: str) -> bytes | None:
+        """Return the final CTA slide for a style, preparing it on first use."""
+        await self._sync_version()
+        if style_slug in self._images:
+            self._hits += 1
+            return self._images[style_slug]
+
+        lock = self._locks.setdefault(style_slug, asyncio.Lock())
+        async with lock:
+            if style_slug in self._images:
+                self._hits += 1
+                return self._images[style_slug]
+            version = self._version
+            image = await run_image_op("cta_prepare", prepare_cta_image, style_slug)
+            self._loads += 1
+            # A refresh during the load may mean the image is from the old assets
+            if self._version == version:
+                self._images[style_slug] = image
+            return image
+
+    async def preload(self, style_slugs: Iterable[str] = AVAILABLE_STYLES) -> None:
+        """Prepare CTA slides for the given styles (all styles by default)."""
+        await asyncio.gather(*(self.get(slug) for slug in style_slugs))
+        logger.info("Preloaded CTA slides for %d styles", len(self._images))
+
+    def clear(self) -> None:
+        self._images.clear()
+        self._refreshes += 1
+
+    async def _sync_version(self) -> None:
+        if self._redis is None:
+            return
+        now = time.monotonic()
+        if now - self._version_checked_at < self._version_check_interval:
+            return
+        self._version_checked_at = now
+        try:
+            raw = await self._redis.get(CTA_VERSION_KEY)
+        except Exception:
+            logger.debug("CTA version lookup failed", exc_info=True)
+            return
+        version = int(raw) if raw is not None else 0
+        if version != self._version:
+            logger.info("CTA assets refreshed (version %d -> %d)", self._version, version)
+            self._version = version
+            self.clear()
+
+    def stats(self) -> CtaCacheStats:
+        return CtaCacheStats(
+            entries=len(self._images),
+            hits=self._hits,
+            loads=self._loads,
+            refreshes=self._refreshes,
+            version=self._version,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_cta_cache() -> CtaCache:
+    """Process-wide CTA slide cache."""
+    return CtaCache(redis=get_redis())
+
+
+async def request_cta_refresh() -> int:
+    """Invalidate cached CTA slides in every process; returns the new version."""
+    return int(await get_redis().incr(CTA_VERSION_KEY))
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import io
+import asyncio
 import logging
+from collections.abc import Awaitable, Sequence
+from contextlib import ExitStack
 from pathlib import Path
 
-from PIL import Image
-
 from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
-from src.renderer.browser import render_html_to_png
+from src.config.settings import get_settings
+from src.renderer.assets import get_asset_store
+from src.renderer.browser import render_html_sections, render_html_to_image
+from src.renderer.cache import get_render_cache, render_cache_key
 from src.renderer.html_builder import (
+    build_batch_html,
     build_comparison_html,
     build_hook_overlay_html,
     build_listing_html,
@@ -17,6 +21,13 @@ from src.renderer.html_builder import (
     build_steps_html,
     build_text_html,
 )
+from src.renderer.image_ops import (
+    GeneratedImage,
+    finalize_image,
+    get_output_format,
+    run_image_op,
+)
+from src.renderer.pillow_engine import can_render, render_slide_image
 from src.renderer.styles import StyleConfig
 from src.schemas.slide import (
     ContentTemplate,
@@ -40,36 +51,47 @@ def load_cta_image(style_slug: str) -> bytes | None:
 
 
 class SlideRenderer:
-    def __init__(self, style: StyleConfig) -> None:
+    def __init__(self, style: StyleConfig, batch: bool | None = None) -> None:
         self.style = style
         self.width = SLIDE_WIDTH
         self.height = SLIDE_HEIGHT
+        settings = get_settings().renderer
+        # Batch mode renders all HTML slides of a carousel in one page
+        self.batch = settings.batch_render if batch is None else batch
+        self._pillow_templates = frozenset(settings.pillow_templates)
+        limit = settings.render_concurrency or settings.page_pool_size
+        self._render_slots = asyncio.Semaphore(max(1, limit))
 
     async def render(
         self,
         slide: SlideContent,
-        generated_image: bytes | None = None,
+        generated_image: GeneratedImage | None = None,
         cta_image: bytes | None = None,
     ) -> bytes:
-        """Render a single slide as PNG bytes.
+        """Render a single slide as image bytes in the configured output format.
 
         Dispatch logic:
-        1. CTA slide + pre-made cta_image -> resize and return (Pillow)
+        1. CTA slide + prepared cta_image (see ``renderer.cta``) -> passthrough
         2. Hook slide + generated_image, no body text -> passthrough
         3. Hook slide + generated_image, with body text -> HTML overlay
-        4. Content slide -> HTML template (text/listing/comparison)
-        5. Fallback -> HTML text template
+        4. Template enabled in ``renderer.pillow_templates`` -> Pillow, no browser
+        5. Content slide -> HTML template (text/listing/comparison)
+        6. Fallback -> HTML text template
         """
-        # CTA slide with pre-made image
-        if slide.slide_type == SlideType.CTA and cta_image is not None:
-            return self._render_cta(cta_image)
+        # CTA slide with pre-made image, hook image without body text
+        final = await self._passthrough(slide, generated_image, cta_image)
+        if final is not None:
+            return final
 
         # Hook slide with Gemini image
         if generated_image is not None:
-            if slide.text_position == TextPosition.NONE or not slide.body_text:
-                return generated_image
             return await self._render_hook_overlay(generated_image, slide)
 
+        # Simple templates drawn directly with Pillow
+        template = self._pillow_template(slide)
+        if template is not None:
+            return await self._render_pillow(slide, template)
+
         # Content slides: dispatch to template renderer
         if slide.slide_type == SlideType.CONTENT:
             return await self._render_content_template(slide)
@@ -77,44 +99,213 @@ class SlideRenderer:
         # Fallback for any other case
         return await self._render_fallback(slide)
 
-    def _render_cta(self, cta_image_bytes: bytes) -> bytes:
-        """Render CTA slide from pre-made image, resizing if needed."""
-        img = Image.open(io.BytesIO(cta_image_bytes)).convert("RGB")
-        if img.size != (self.width, self.height):
-            img = img.resize(
-                (self.width, self.height),
-                Image.LANCZOS,  # type: ignore[attr-defined]
+    async def render_slide(
+        self,
+        slide: SlideContent,
+        hook_image: GeneratedImage | None = None,
+        cta_image: bytes | None = None,
+    ) -> bytes:
+        """Render one carousel slide under the renderer's concurrency cap.
+
+        The hook image is only applied to the hook slide and the CTA image only
+        to the CTA slide. Parallelism is capped by ``renderer.render_concurrency``
+        (defaulting to the browser page pool size).
+        """
+        async with self._render_slots:
+            if slide.slide_type == SlideType.HOOK:
+                return await self.render(slide=slide, generated_image=hook_image)
+            if slide.slide_type == SlideType.CTA:
+                return await self.render(slide=slide, cta_image=cta_image)
+            return await self.render(slide=slide)
+
+    async def render_carousel(
+        self,
+        slides: Sequence[SlideContent],
+        hook_image: GeneratedImage | None = None,
+        cta_image: bytes | None = None,
+    ) -> list[bytes]:
+        """Render all slides of a carousel, returned in input order.
+
+        Slides render concurrently on separate pages, or in one page when the
+        renderer is in batch mode.
+        """
+        if self.batch:
+            async with self._render_slots:
+                return await self._render_batch(slides, hook_image, cta_image)
+        return list(
+            await asyncio.gather(
+                *(self.render_slide(s, hook_image=hook_image, cta_image=cta_image) for s in slides)
             )
-        buf = io.BytesIO()
-        img.save(buf, format="PNG", optimize=True)
-        return buf.getvalue()
+        )
+
+    async def _passthrough(
+        self,
+        slide: SlideContent,
+        generated_image: GeneratedImage | None,
+        cta_image: bytes | None,
+    ) -> bytes | None:
+        """Return the final image of a slide that needs no HTML render, else None.
+
+        A generated image is re-encoded only if its size or format differs
+        from the slide output.
+        """
+        if slide.slide_type == SlideType.CTA and cta_image is not None:
+            return cta_image
+        if generated_image is not None and (
+            slide.text_position == TextPosition.NONE or not slide.body_text
+        ):
+            if generated_image.matches(self.width, self.height, get_output_format()):
+                return generated_image.data
+            return await run_image_op(
+                "finalize_generated", finalize_image, generated_image, self.width, self.height
+            )
+        return None
+
+    async def _render_batch(
+        self,
+        slides: Sequence[SlideContent],
+        hook_image: GeneratedImage | None,
+        cta_image: bytes | None,
+    ) -> list[bytes]:
+        """Render HTML slides as sections of one document; same dispatch as ``render``."""
+        results: list[bytes | None] = []
+        fragments: dict[int, str] = {}
+        drawn: dict[int, Awaitable[bytes]] = {}
+        with ExitStack() as published:
+            for i, slide in enumerate(slides):
+                image = hook_image if slide.slide_type == SlideType.HOOK else None
+                final = await self._passthrough(slide, image, cta_image)
+                results.append(final)
+                if final is not None:
+                    continue
+                if image is not None:
+                    url = published.enter_context(
+                        get_asset_store().published(image.data, image.content_type, image.extension)
+                    )
+                    fragments[i] = build_hook_overlay_html(slide, self.style, url, fragment=True)
+                elif (template := self._pillow_template(slide)) is not None:
+                    drawn[i] = self._render_pillow(slide, template)
+                elif slide.slide_type == SlideType.CONTENT:
+                    fragments[i] = self._content_html(slide, fragment=True)
+                else:
+                    fragments[i] = build_text_html(slide, self.style, fragment=True)
+
+            rendered, pillow_rendered = await asyncio.gather(
+                self._render_fragments(list(fragments.values())),
+                asyncio.gather(*drawn.values()),
+            )
+
+        for i, png_bytes in zip(fragments, rendered, strict=True):
+            results[i] = png_bytes
+        for i, png_bytes in zip(drawn, pillow_rendered, strict=True):
+            results[i] = png_bytes
+        return [r for r in results if r is not None]
+
+    async def _render_fragments(self, fragments: list[str]) -> list[bytes]:
+        """Render slide fragments in one Chromium page, consulting the render cache."""
+        cache = get_render_cache()
+        results: list[bytes | None] = [None] * len(fragments)
+        keys: list[str] = []
+        if cache is not None:
+            head = build_batch_html([], self.style)
+            tag = get_output_format().tag
+            keys = [render_cache_key(head + f, self.width, self.height, tag) for f in fragments]
+            for i, key in enumerate(keys):
+                results[i] = await cache.get(key)
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            html = build_batch_html([fragments[i] for i in missing], self.style)
+            shots = await render_html_sections(html, len(missing), self.width, self.height)
+            for i, image in zip(missing, shots, strict=True):
+                results[i] = image
+                if cache is not None:
+                    await cache.set(keys[i], image)
+        return [r for r in results if r is not None]
+
+    async def _render_html(self, html: str) -> bytes:
+        """Render HTML via Chromium, serving identical inputs from the render cache."""
+        cache = get_render_cache()
+        if cache is None:
+            return await render_html_to_image(html, self.width, self.height)
+
+        key = render_cache_key(html, self.width, self.height, get_output_format().tag)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+        image = await render_html_to_image(html, self.width, self.height)
+        await cache.set(key, image)
+        return image
 
     async def _render_hook_overlay(
         self,
-        image_bytes: bytes,
+        image: GeneratedImage,
         slide: SlideContent,
     ) -> bytes:
-        """Overlay body_text on a generated image via HTML template."""
-        html = build_hook_overlay_html(slide, self.style, image_bytes)
-        return await render_html_to_png(html, self.width, self.height)
+        """Overlay body_text on a generated image via HTML template.
+
+        The provider's bytes are served to Chromium as received; the screenshot
+        is the only encode.
+        """
+        store = get_asset_store()
+        with store.published(image.data, image.content_type, image.extension) as image_url:
+            html = build_hook_overlay_html(slide, self.style, image_url)
+            return await self._render_html(html)
+
+    @staticmethod
+    def _effective_template(slide: SlideContent) -> ContentTemplate:
+        """Template a slide renders with: its own if its data is present, else TEXT."""
+        if slide.slide_type != SlideType.CONTENT:
+            return ContentTemplate.TEXT
+        has_data = {
+            ContentTemplate.LISTING: slide.listing_data,
+            ContentTemplate.COMPARISON: slide.comparison_data,
+            ContentTemplate.QUOTE: slide.quote_data,
+            ContentTemplate.STATS: slide.stats_data,
+            ContentTemplate.STEPS: slide.steps_data,
+        }
+        if has_data.get(slide.content_template):
+            return slide.content_template
+        return ContentTemplate.TEXT
+
+    def _pillow_template(self, slide: SlideContent) -> ContentTemplate | None:
+        """Template to draw with Pillow for this slide, or None to use Chromium."""
+        template = self._effective_template(slide)
+        if template.value in self._pillow_templates and can_render(template, self.style):
+            return template
+        return None
+
+    async def _render_pillow(self, slide: SlideContent, template: ContentTemplate) -> bytes:
+        return await run_image_op(
+            "pillow_render",
+            render_slide_image,
+            slide,
+            self.style,
+            template,
+            self.width,
+            self.height,
+        )
+
+    def _content_html(self, slide: SlideContent, *, fragment: bool = False) -> str:
+        """Build HTML with the appropriate content template."""
+        template = self._effective_template(slide)
+        if template == ContentTemplate.LISTING:
+            return build_listing_html(slide, self.style, fragment=fragment)
+        if template == ContentTemplate.COMPARISON:
+            return build_comparison_html(slide, self.style, fragment=fragment)
+        if template == ContentTemplate.QUOTE:
+            return build_quote_html(slide, self.style, fragment=fragment)
+        if template == ContentTemplate.STATS:
+            return build_stats_html(slide, self.style, fragment=fragment)
+        if template == ContentTemplate.STEPS:
+            return build_steps_html(slide, self.style, fragment=fragment)
+        return build_text_html(slide, self.style, fragment=fragment)
 
     async def _render_content_template(self, slide: SlideContent) -> bytes:
         """Dispatch to the appropriate HTML template."""
-        if slide.content_template == ContentTemplate.LISTING and slide.listing_data:
-            html = build_listing_html(slide, self.style)
-        elif slide.content_template == ContentTemplate.COMPARISON and slide.comparison_data:
-            html = build_comparison_html(slide, self.style)
-        elif slide.content_template == ContentTemplate.QUOTE and slide.quote_data:
-            html = build_quote_html(slide, self.style)
-        elif slide.content_template == ContentTemplate.STATS and slide.stats_data:
-            html = build_stats_html(slide, self.style)
-        elif slide.content_template == ContentTemplate.STEPS and slide.steps_data:
-            html = build_steps_html(slide, self.style)
-        else:
-            html = build_text_html(slide, self.style)
-        return await render_html_to_png(html, self.width, self.height)
+        return await self._render_html(self._content_html(slide))
 
     async def _render_fallback(self, slide: SlideContent) -> bytes:
         """Fallback: render as text template."""
         html = build_text_html(slide, self.style)
-        return await render_html_to_png(html, self.width, self.height)
+        return await self._render_html(html)
@@ -1,26 +1,27 @@
 from __future__ import annotations
 
-import base64
 import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import fields
 from functools import lru_cache
 from pathlib import Path
 
 from mako.lookup import TemplateLookup
 
+from src.config.settings import get_settings
+from src.renderer.assets import get_asset_store
 from src.renderer.styles import StyleConfig
 from src.schemas.slide import SlideContent
 
 logger = logging.getLogger(__name__)
 
-_TEMPLATE_DIR = str(Path(__file__).resolve().parent / "templates")
+_TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
 _FONTS_DIR = Path(__file__).resolve().parent.parent.parent / "assets" / "fonts"
 
-_lookup = TemplateLookup(
-    directories=[_TEMPLATE_DIR],
-    strict_undefined=True,
-    input_encoding="utf-8",
-    default_filters=["str", "h"],
-)
+# Slide templates inherit ``layout``: the full page by default, or the bare
+# slide markup when rendered as a section of a batch document.
+_FRAGMENT_LAYOUT = "fragment.html.mako"
 
 
 def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
@@ -35,7 +36,11 @@ def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
 
 @lru_cache(maxsize=1)
 def _build_font_faces() -> str:
-    """Generate @font-face CSS for .ttf/.otf/.woff2 files in assets/fonts/."""
+    """Generate @font-face CSS for .ttf/.otf/.woff2 files in assets/fonts/.
+
+    Fonts are pinned in the asset store and referenced by URL, so each slide's
+    HTML stays small and Chromium fetches the bytes from memory.
+    """
     if not _FONTS_DIR.exists():
         return ""
     mime_map = {
@@ -43,37 +48,78 @@ def _build_font_faces() -> str:
         ".otf": "font/otf",
         ".woff2": "font/woff2",
     }
+    store = get_asset_store()
     rules: list[str] = []
     for font_file in sorted(_FONTS_DIR.iterdir()):
         suffix = font_file.suffix.lower()
         if suffix in mime_map:
             mime = mime_map[suffix]
-            data = base64.b64encode(font_file.read_bytes()).decode()
+            url = store.put(font_file.read_bytes(), mime, suffix, pinned=True)
             family = font_file.stem.replace("-", " ").replace("_", " ")
-            rules.append(
-                f"@font-face {{ font-family: '{family}'; src: url('data:{mime};base64,{data}'); }}"
-            )
+            rules.append(f"@font-face {{ font-family: '{family}'; src: url('{url}'); }}")
     return "\n".join(rules)
 
 
-def _base_context(style: StyleConfig) -> dict[str, object]:
-    """Build the shared template context from StyleConfig."""
+@lru_cache(maxsize=1)
+def _get_lookup() -> TemplateLookup:
+    cache_dir = get_settings().template_cache_dir
+    return TemplateLookup(
+        directories=[str(_TEMPLATE_DIR)],
+        module_directory=str(Path(cache_dir) / "renderer") if cache_dir else None,
+        strict_undefined=True,
+        input_encoding="utf-8",
+        default_filters=["str", "h"],
+    )
+
+
+def warm_templates() -> int:
+    """Compile every slide template, including the inherited layouts.
+
+    Compiled modules persist in ``template_cache_dir``, so later processes
+    only import them. Call on worker and app start.
+    """
+    lookup = _get_lookup()
+    names = sorted(p.name for p in _TEMPLATE_DIR.glob("*.mako"))
+    for name in names:
+        lookup.get_template(name)
+    logger.debug("Compiled %d renderer templates", len(names))
+    return len(names)
+
+
+# StyleConfig fields that affect rendered output (``extra`` only feeds prompts)
+_STYLE_KEY_FIELDS = tuple(f.name for f in fields(StyleConfig) if f.name != "extra")
+_STYLE_CACHE_SIZE = 32
+
+_style_contexts: OrderedDict[tuple[object, ...], dict[str, object]] = OrderedDict()
+
+
+def _style_key(style: StyleConfig) -> tuple[object, ...]:
+    """Slug plus every rendered field, so an edited config never hits a stale entry."""
+    return tuple(getattr(style, name) for name in _STYLE_KEY_FIELDS)
+
+
+def _build_style_context(style: StyleConfig) -> dict[str, object]:
+    """Template context that depends only on the style, with its stylesheet pre-rendered."""
     accent_rgb = _hex_to_rgb(style.accent_color)
     bg_rgb = _hex_to_rgb(style.bg_color)
+    css = _get_lookup().get_template("style.css.mako")
+    base_css = css.render(
+        bg_color=style.bg_color,
+        text_color=style.text_color,
+        accent_color=style.accent_color,
+        heading_font_size=style.heading_font_size,
+        body_font_size=style.body_font_size,
+        subtitle_font_size=int(style.heading_font_size * 0.55),
+        heading_font=style.heading_font,
+        body_font=style.body_font,
+        padding=style.padding,
+        line_spacing=style.line_spacing,
+        heading_body_gap=style.heading_body_gap,
+        heading_alignment=style.heading_alignment,
+        font_faces=_build_font_faces(),
+    )
     return {
-        "bg_color": style.bg_color,
-        "text_color": style.text_color,
-        "accent_color": style.accent_color,
-        "heading_font_size": style.heading_font_size,
-        "body_font_size": style.body_font_size,
-        "subtitle_font_size": int(style.heading_font_size * 0.55),
-        "heading_font": style.heading_font,
-        "body_font": style.body_font,
-        "padding": style.padding,
-        "line_spacing": style.line_spacing,
-        "heading_body_gap": style.heading_body_gap,
-        "heading_alignment": style.heading_alignment,
-        "font_faces": _build_font_faces(),
+        "base_css": base_css,
         "accent_r": accent_rgb[0],
         "accent_g": accent_rgb[1],
         "accent_b": accent_rgb[2],
@@ -83,120 +129,129 @@ def _base_context(style: StyleConfig) -> dict[str, object]:
     }
 
 
-def build_text_html(slide: SlideContent, style: StyleConfig) -> str:
+def _style_context(style: StyleConfig) -> dict[str, object]:
+    """Memoized ``_build_style_context``; treat the result as read-only."""
+    key = _style_key(style)
+    ctx = _style_contexts.get(key)
+    if ctx is None:
+        ctx = _build_style_context(style)
+        _style_contexts[key] = ctx
+        if len(_style_contexts) > _STYLE_CACHE_SIZE:
+            _style_contexts.popitem(last=False)
+    else:
+        _style_contexts.move_to_end(key)
+    return ctx
+
+
+def warm_style(style: StyleConfig) -> None:
+    """Pre-render a style's context and stylesheet ahead of its first slide."""
+    _style_context(style)
+
+
+def _render(template: str, style: StyleConfig, ctx: dict[str, object], fragment: bool) -> str:
+    """Render slide-specific ``ctx`` on top of the style's memoized context."""
+    if fragment:
+        ctx["layout"] = _FRAGMENT_LAYOUT
+    tmpl = _get_lookup().get_template(template)
+    return tmpl.render(**_style_context(style), **ctx)  # type: ignore[no-any-return]
+
+
+def build_text_html(slide: SlideContent, style: StyleConfig, *, fragment: bool = False) -> str:
     """Render text template HTML."""
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "heading": slide.heading,
-            "subtitle": slide.subtitle,
-            "body_text": slide.body_text,
-            "slide_number": slide.slide_number,
-        }
-    )
-    tmpl = _lookup.get_template("text.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    ctx: dict[str, object] = {
+        "heading": slide.heading,
+        "subtitle": slide.subtitle,
+        "body_text": slide.body_text,
+        "slide_number": slide.slide_number,
+    }
+    return _render("text.html.mako", style, ctx, fragment)
 
 
-def build_listing_html(slide: SlideContent, style: StyleConfig) -> str:
+def build_listing_html(slide: SlideContent, style: StyleConfig, *, fragment: bool = False) -> str:
     """Render listing template HTML."""
     assert slide.listing_data is not None
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "heading": slide.heading,
-            "subtitle": slide.subtitle,
-            "slide_number": slide.slide_number,
-            "listing_items": slide.listing_data.items,
-        }
-    )
-    tmpl = _lookup.get_template("listing.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    ctx: dict[str, object] = {
+        "heading": slide.heading,
+        "subtitle": slide.subtitle,
+        "slide_number": slide.slide_number,
+        "listing_items": slide.listing_data.items,
+    }
+    return _render("listing.html.mako", style, ctx, fragment)
 
 
-def build_comparison_html(slide: SlideContent, style: StyleConfig) -> str:
+def build_comparison_html(
+    slide: SlideContent, style: StyleConfig, *, fragment: bool = False
+) -> str:
     """Render comparison template HTML."""
     assert slide.comparison_data is not None
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "slide_number": slide.slide_number,
-            "top_label": slide.comparison_data.top_block.label,
-            "top_subtitle": slide.comparison_data.top_block.subtitle,
-            "top_items": slide.comparison_data.top_block.items,
-            "bottom_label": slide.comparison_data.bottom_block.label,
-            "bottom_subtitle": slide.comparison_data.bottom_block.subtitle,
-            "bottom_items": slide.comparison_data.bottom_block.items,
-        }
-    )
-    tmpl = _lookup.get_template("comparison.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    ctx: dict[str, object] = {
+        "slide_number": slide.slide_number,
+        "top_label": slide.comparison_data.top_block.label,
+        "top_subtitle": slide.comparison_data.top_block.subtitle,
+        "top_items": slide.comparison_data.top_block.items,
+        "bottom_label": slide.comparison_data.bottom_block.label,
+        "bottom_subtitle": slide.comparison_data.bottom_block.subtitle,
+        "bottom_items": slide.comparison_data.bottom_block.items,
+    }
+    return _render("comparison.html.mako", style, ctx, fragment)
 
 
-def build_quote_html(slide: SlideContent, style: StyleConfig) -> str:
+def build_quote_html(slide: SlideContent, style: StyleConfig, *, fragment: bool = False) -> str:
     """Render quote template HTML."""
     assert slide.quote_data is not None
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "slide_number": slide.slide_number,
-            "quote_text": slide.quote_data.quote_text,
-            "author_name": slide.quote_data.author_name,
-            "author_title": slide.quote_data.author_title,
-        }
-    )
-    tmpl = _lookup.get_template("quote.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    ctx: dict[str, object] = {
+        "slide_number": slide.slide_number,
+        "quote_text": slide.quote_data.quote_text,
+        "author_name": slide.quote_data.author_name,
+        "author_title": slide.quote_data.author_title,
+    }
+    return _render("quote.html.mako", style, ctx, fragment)
 
 
-def build_stats_html(slide: SlideContent, style: StyleConfig) -> str:
+def build_stats_html(slide: SlideContent, style: StyleConfig, *, fragment: bool = False) -> str:
     """Render stats/big-number template HTML."""
     assert slide.stats_data is not None
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "slide_number": slide.slide_number,
-            "heading": slide.heading,
-            "stats_value": slide.stats_data.value,
-            "stats_label": slide.stats_data.label,
-            "stats_context": slide.stats_data.context,
-        }
-    )
-    tmpl = _lookup.get_template("stats.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    ctx: dict[str, object] = {
+        "slide_number": slide.slide_number,
+        "heading": slide.heading,
+        "stats_value": slide.stats_data.value,
+        "stats_label": slide.stats_data.label,
+        "stats_context": slide.stats_data.context,
+    }
+    return _render("stats.html.mako", style, ctx, fragment)
 
 
-def build_steps_html(slide: SlideContent, style: StyleConfig) -> str:
+def build_steps_html(slide: SlideContent, style: StyleConfig, *, fragment: bool = False) -> str:
     """Render steps template HTML."""
     assert slide.steps_data is not None
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "slide_number": slide.slide_number,
-            "heading": slide.heading,
-            "steps_items": slide.steps_data.items,
-        }
-    )
-    tmpl = _lookup.get_template("steps.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    ctx: dict[str, object] = {
+        "slide_number": slide.slide_number,
+        "heading": slide.heading,
+        "steps_items": slide.steps_data.items,
+    }
+    return _render("steps.html.mako", style, ctx, fragment)
 
 
 def build_hook_overlay_html(
     slide: SlideContent,
     style: StyleConfig,
-    image_bytes: bytes,
+    image_url: str,
+    *,
+    fragment: bool = False,
 ) -> str:
-    """Render hook overlay HTML with generated image as background data URI."""
-    b64 = base64.b64encode(image_bytes).decode()
-    image_data_uri = f"data:image/png;base64,{b64}"
-    ctx = _base_context(style)
-    ctx.update(
-        {
-            "body_text": slide.body_text,
-            "text_position": slide.text_position.value,
-            "image_data_uri": image_data_uri,
-            "body_text_bg_opacity": style.body_text_bg_opacity,
-        }
-    )
-    tmpl = _lookup.get_template("hook_overlay.html.mako")
-    return tmpl.render(**ctx)  # type: ignore[no-any-return]
+    """Render hook overlay HTML with the generated image as background.
+
+    ``image_url`` should be published in the asset store (see ``renderer.assets``).
+    """
+    ctx: dict[str, object] = {
+        "body_text": slide.body_text,
+        "text_position": slide.text_position.value,
+        "image_url": image_url,
+        "body_text_bg_opacity": style.body_text_bg_opacity,
+    }
+    return _render("hook_overlay.html.mako", style, ctx, fragment)
+
+
+def build_batch_html(sections: Sequence[str], style: StyleConfig) -> str:
+    """Render one document stacking slide fragments (built with ``fragment=True``)."""
+    return _render("batch.html.mako", style, {"sections": sections}, fragment=False)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+from PIL import Image
+
+from src.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# CPU-bound Pillow work (decode, LANCZOS resize, PNG encode) runs on a small
+# dedicated thread pool so it never blocks the worker's shared event loop.
+# Pillow releases the GIL in its C decoders/encoders, so threads are enough.
+# ---------------------------------------------------------------------------
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_stats_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class ImageOpStats:
+    calls: int
+    run_seconds: float  # time spent executing in the pool
+    wait_seconds: float  # time spent queued for a free pool thread
+    max_run_seconds: float
+
+
+class _OpTimer:
+    __slots__ = ("calls", "max_run_seconds", "run_seconds", "wait_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.run_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.max_run_seconds = 0.0
+
+
+_timers: dict[str, _OpTimer] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor  # noqa: PLW0603
+    if _executor is not None:
+        return _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, get_settings().renderer.image_workers),
+                thread_name_prefix="image-ops",
+            )
+        return _executor
+
+
+def _record(op: str, run_seconds: float, wait_seconds: float) -> None:
+    with _stats_lock:
+        timer = _timers.setdefault(op, _OpTimer())
+        timer.calls += 1
+        timer.run_seconds += run_seconds
+        timer.wait_seconds += wait_seconds
+        timer.max_run_seconds = max(timer.max_run_seconds, run_seconds)
+
+
+async def run_image_op[T](op: str, fn: Callable[..., T], *args: object) -> T:
+    """Run a blocking image function on the image-ops pool, timing it under ``op``."""
+    loop = asyncio.get_running_loop()
+    submitted = time.perf_counter()
+    started = 0.0
+
+    def _call() -> T:
+        nonlocal started
+        started = time.perf_counter()
+        return fn(*args)
+
+    try:
+        return await loop.run_in_executor(_get_executor(), _call)
+    finally:
+        finished = time.perf_counter()
+        if started:
+            _record(op, finished - started, started - submitted)
+
+
+def get_image_op_stats() -> dict[str, ImageOpStats]:
+    """Return per-operation timing metrics."""
+    with _stats_lock:
+        return {
+            op: ImageOpStats(
+                calls=t.calls,
+                run_seconds=t.run_seconds,
+                wait_seconds=t.wait_seconds,
+                max_run_seconds=t.max_run_seconds,
+            )
+            for op, t in _timers.items()
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class OutputFormat:
+    """How slides are encoded: ``format`` plus its quality/compression knobs."""
+
+    format: Literal["png", "jpeg", "webp"] = "png"
+    quality: int = 90
+    compress_level: int = 6
+
+    @property
+    def content_type(self) -> str:
+        return f"image/{self.format}"
+
+    @property
+    def extension(self) -> str:
+        return ".jpg" if self.format == "jpeg" else f".{self.format}"
+
+    @property
+    def tag(self) -> str:
+        """Stable identifier of the encoding, e.g. for cache keys."""
+        return f"{self.format}:{self.quality}:{self.compress_level}"
+
+
+def get_output_format() -> OutputFormat:
+    settings = get_settings().renderer
+    return OutputFormat(
+        format=settings.output_format,
+        quality=settings.output_quality,
+        compress_level=settings.png_compress_level,
+    )
+
+
+def encode_image(img: Image.Image, output: OutputFormat | None = None) -> bytes:
+    """Encode an RGB image in the configured output format."""
+    output = output or get_output_format()
+    buf = io.BytesIO()
+    if output.format == "png":
+        img.save(buf, format="PNG", compress_level=output.compress_level)
+    elif output.format == "jpeg":
+        img.save(buf, format="JPEG", quality=output.quality)
+    else:
+        img.save(buf, format="WEBP", quality=output.quality, method=4)
+    return buf.getvalue()
+
+
+def normalize_image(
+    data: bytes,
+    width: int,
+    height: int,
+    output: OutputFormat | None = None,
+) -> bytes:
+    """Decode an image, convert it to RGB at ``width`` x ``height`` and encode it.
+
+    Raises if ``data`` is not a decodable image.
+    """
+    img: Image.Image = Image.open(io.BytesIO(data))
+    if img.size != (width, height):
+        logger.debug("Resizing image from %s to %dx%d", img.size, width, height)
+        img = img.resize((width, height), Image.LANCZOS)  # type: ignore[attr-defined]
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return encode_image(img, output)
+
+
+def transcode(data: bytes, output: OutputFormat | None = None) -> bytes:
+    """Re-encode an image (e.g. a Chromium PNG screenshot) in the output format."""
+    img: Image.Image = Image.open(io.BytesIO(data))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return encode_image(img, output)
+
+
+# Formats Chromium can decode for the hook overlay; anything else is rejected
+_GENERATED_FORMATS = frozenset({"PNG", "JPEG", "WEBP"})
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratedImage:
+    """Provider image bytes as received, with the metadata read from their header.
+
+    Carried undecoded through the pipeline: Chromium decodes it for the hook
+    overlay, and ``finalize_image`` re-encodes it only if a passthrough slide
+    needs a different size or format.
+    """
+
+    data: bytes
+    format: str  # Pillow format name, e.g. "PNG"
+    width: int
+    height: int
+
+    @property
+    def content_type(self) -> str:
+        return f"image/{self.format.lower()}"
+
+    @property
+    def extension(self) -> str:
+        return ".jpg" if self.format == "JPEG" else f".{self.format.lower()}"
+
+    def matches(self, width: int, height: int, output: OutputFormat) -> bool:
+        """True if the bytes can be used as a final slide without re-encoding."""
+        return (self.width, self.height) == (width, height) and self.format == (
+            output.format.upper()
+        )
+
+
+def probe_image(data: bytes) -> GeneratedImage:
+    """Read format and dimensions from an image header without decoding pixels.
+
+    Raises ValueError for unsupported formats or empty dimensions, and
+    Pillow's errors for data that is not an image.
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        fmt, (width, height) = img.format, img.size
+    if fmt not in _GENERATED_FORMATS:
+        raise ValueError(f"Unsupported image format {fmt!r}")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Invalid image dimensions {width}x{height}")
+    return GeneratedImage(data=data, format=fmt, width=width, height=height)
+
+
+def finalize_image(
+    image: GeneratedImage,
+    width: int,
+    height: int,
+    output: OutputFormat | None = None,
+) -> bytes:
+    """Final slide bytes for a generated image, encoding only if it does not match."""
+    output = output or get_output_format()
+    if image.matches(width, height, output):
+        return image.data
+    return normalize_image(image.data, width, height, output)
@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from src.renderer.image_ops import encode_image
+from src.renderer.styles import StyleConfig
+from src.schemas.slide import ContentTemplate, SlideContent
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Browser-free renderer for the simple templates. Layout mirrors the CSS in
+# base/text/stats/quote.html.mako (padding, flex centring, line-height, gaps)
+# closely enough to stay within visual-diff tolerance of Chromium's output.
+# ---------------------------------------------------------------------------
+
+_FONTS_DIR = Path(__file__).resolve().parent.parent.parent / "assets" / "fonts"
+_FONT_SUFFIXES = (".ttf", ".otf")
+
+PILLOW_TEMPLATES = frozenset({ContentTemplate.TEXT, ContentTemplate.STATS, ContentTemplate.QUOTE})
+
+_BADGE_SIZE = 56
+_BADGE_FONT_SIZE = 28
+_NORMAL_LINE_HEIGHT = 1.2  # CSS "line-height: normal" approximation
+
+RGB = tuple[int, int, int]
+
+
+@lru_cache(maxsize=1)
+def _font_index() -> dict[str, Path]:
+    """Map normalised family names (file stem, '-'/'_' as spaces) to font files."""
+    if not _FONTS_DIR.exists():
+        return {}
+    index: dict[str, Path] = {}
+    for path in sorted(_FONTS_DIR.iterdir()):
+        if path.suffix.lower() in _FONT_SUFFIXES:
+            index[path.stem.replace("-", " ").replace("_", " ").lower()] = path
+    return index
+
+
+def _font_path(family: str, variants: tuple[str, ...] = ()) -> Path | None:
+    index = _font_index()
+    family = family.lower()
+    for variant in (*variants, ""):
+        path = index.get(f"{family} {variant}".strip())
+        if path is not None:
+            return path
+    return None
+
+
+@lru_cache(maxsize=64)
+def _load_font(path: Path, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(path), size)
+
+
+def _font(
+    family: str,
+    size: int,
+    *,
+    bold: bool = False,
+    italic: bool = False,
+) -> ImageFont.FreeTypeFont:
+    variants: tuple[str, ...] = ()
+    if bold and italic:
+        variants = ("bold italic", "bolditalic")
+    elif bold:
+        variants = ("bold", "black", "extrabold")
+    elif italic:
+        variants = ("italic",)
+    path = _font_path(family, variants)
+    if path is None:
+        raise LookupError(f"No font file for family {family!r}")
+    return _load_font(path, size)
+
+
+def can_render(template: ContentTemplate, style: StyleConfig) -> bool:
+    """True if the template is supported and the style's fonts are in assets/fonts."""
+    if template not in PILLOW_TEMPLATES:
+        return False
+    return _font_path(style.heading_font) is not None and _font_path(style.body_font) is not None
+
+
+def _rgb(color: str) -> RGB:
+    r, g, b = ImageColor.getrgb(color)[:3]
+    return (r, g, b)
+
+
+def _blend(fg: RGB, bg: RGB, opacity: float) -> RGB:
+    """Colour of ``fg`` at ``opacity`` over a solid ``bg``."""
+    return (
+        round(bg[0] + (fg[0] - bg[0]) * opacity),
+        round(bg[1] + (fg[1] - bg[1]) * opacity),
+        round(bg[2] + (fg[2] - bg[2]) * opacity),
+    )
+
+
+def _length(text: str, font: ImageFont.FreeTypeFont, letter_spacing: float = 0) -> float:
+    """Advance width of ``text``; CSS adds ``letter-spacing`` after every character."""
+    return font.getlength(text) + letter_spacing * len(text)
+
+
+def _break_chars(
+    text: str, font: ImageFont.FreeTypeFont, max_width: float, letter_spacing: float = 0
+) -> list[str]:
+    lines: list[str] = []
+    current = ""
+    for char in text:
+        if current and _length(current + char, font, letter_spacing) > max_width:
+            lines.append(current.rstrip())
+            current = char.lstrip()
+        else:
+            current += char
+    lines.append(current)
+    return lines
+
+
+def _wrap(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: float,
+    *,
+    break_all: bool = False,
+    letter_spacing: float = 0,
+) -> list[str]:
+    """Greedy line breaking like CSS ``overflow-wrap: break-word``.
+
+    With ``break_all`` lines may break between any characters (``word-break: break-all``).
+    """
+    if break_all:
+        return _break_chars(" ".join(text.split()), font, max_width, letter_spacing)
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if _length(candidate, font, letter_spacing) <= max_width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        if _length(word, font, letter_spacing) <= max_width:
+            current = word
+        else:
+            *full, current = _break_chars(word, font, max_width, letter_spacing)
+            lines.extend(full)
+    if current:
+        lines.append(current)
+    return lines
+
+
+@dataclass(frozen=True, slots=True)
+class _Block:
+    lines: list[str]
+    font: ImageFont.FreeTypeFont
+    color: RGB
+    line_height: float
+    margin_top: float = 0
+    align: str = "left"
+    letter_spacing: float = 0
+
+    @property
+    def height(self) -> float:
+        return len(self.lines) * self.line_height
+
+
+class _Canvas:
+    def __init__(self, style: StyleConfig, width: int, height: int) -> None:
+        self.style = style
+        self.width = width
+        self.height = height
+        self.bg = _rgb(style.bg_color)
+        self.text = _rgb(style.text_color)
+        self.accent = _rgb(style.accent_color)
+        self.image = Image.new("RGB", (width, height), self.bg)
+        self.draw = ImageDraw.Draw(self.image)
+        self.left = style.padding
+        self.inner_width = width - 2 * style.padding
+
+    def block(
+        self,
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        color: RGB,
+        line_height: float,
+        margin_top: float = 0,
+        align: str = "left",
+        break_all: bool = False,
+        letter_spacing: float = 0,
+    ) -> _Block:
+        lines = _wrap(
+            text, font, self.inner_width, break_all=break_all, letter_spacing=letter_spacing
+        )
+        return _Block(lines, font, color, line_height, margin_top, align, letter_spacing)
+
+    def draw_blocks(self, blocks: list[_Block], gap: float = 0) -> None:
+        """Draw blocks stacked and centred vertically in the padded content box."""
+        total = sum(b.margin_top + b.height for b in blocks) + gap * max(0, len(blocks) - 1)
+        top = self.style.padding
+        box_height = self.height - 2 * self.style.padding
+        y = top + (box_height - total) / 2
+        for i, b in enumerate(blocks):
+            y += b.margin_top + (gap if i else 0)
+            ascent, descent = b.font.getmetrics()
+            half_leading = (b.line_height - (ascent + descent)) / 2
+            for line in b.lines:
+                x: float = self.left
+                width = _length(line, b.font, b.letter_spacing)
+                if b.align == "center":
+                    x += (self.inner_width - width) / 2
+                elif b.align == "right":
+                    x += self.inner_width - width
+                self._line(x, y + half_leading + ascent, line, b)
+                y += b.line_height
+
+    def _line(self, x: float, baseline: float, line: str, b: _Block) -> None:
+        if not b.letter_spacing:
+            self.draw.text((x, baseline), line, font=b.font, fill=b.color, anchor="ls")
+            return
+        # Pillow has no letter-spacing: place each character at its spaced advance
+        for char in line:
+            self.draw.text((x, baseline), char, font=b.font, fill=b.color, anchor="ls")
+            x += b.font.getlength(char) + b.letter_spacing
+
+    def slide_number(self, number: int | None) -> None:
+        if number is None:
+            return
+        right = self.width - self.style.padding
+        top = self.style.padding
+        self.draw.ellipse((right - _BADGE_SIZE, top, right, top + _BADGE_SIZE), fill=self.accent)
+        font = _font(self.style.heading_font, _BADGE_FONT_SIZE, bold=True)
+        center = (right - _BADGE_SIZE / 2, top + _BADGE_SIZE / 2)
+        self.draw.text(center, f"{number:02d}", font=font, fill=self.bg, anchor="mm")
+
+    def encode(self) -> bytes:
+        return encode_image(self.image)
+
+
+def _text_blocks(c: _Canvas, slide: SlideContent) -> list[_Block]:
+    s = c.style
+    subtitle_size = int(s.heading_font_size * 0.55)
+    blocks = [
+        c.block(
+            slide.heading,
+            _font(s.heading_font, s.heading_font_size),
+            c.accent,
+            s.heading_font_size * s.line_spacing,
+            align=s.heading_alignment,
+        )
+    ]
+    if slide.subtitle:
+        blocks.append(
+            c.block(
+                slide.subtitle,
+                _font(s.body_font, subtitle_size),
+                c.text,
+                subtitle_size * s.line_spacing,
+                margin_top=s.heading_body_gap / 2,
+                align=s.heading_alignment,
+            )
+        )
+    if slide.body_text:
+        blocks.append(
+            c.block(
+                slide.body_text,
+                _font(s.body_font, s.body_font_size),
+                c.text,
+                s.body_font_size * s.line_spacing,
+                margin_top=s.heading_body_gap,
+            )
+        )
+    return blocks
+
+
+def _stats_blocks(c: _Canvas, slide: SlideContent) -> list[_Block]:
+    assert slide.stats_data is not None
+    s = c.style
+    data = slide.stats_data
+    label_size = int(s.body_font_size * 1.2)
+    context_size = int(s.body_font_size * 0.85)
+    blocks = [
+        c.block(
+            slide.heading.upper(),
+            _font(s.body_font, s.body_font_size),
+            _blend(c.text, c.bg, 0.7),
+            s.body_font_size * _NORMAL_LINE_HEIGHT,
+            align="center",
+            letter_spacing=2,
+        ),
+        c.block(
+            data.value,
+            _font(s.heading_font, 120, bold=True),
+            c.accent,
+            120 * 1.1,
+            align="center",
+            break_all=True,
+        ),
+        c.block(
+            data.label,
+            _font(s.body_font, label_size),
+            c.text,
+            label_size * s.line_spacing,
+            align="center",
+        ),
+    ]
+    if data.context:
+        blocks.append(
+            c.block(
+                data.context,
+                _font(s.body_font, context_size),
+                _blend(c.text, c.bg, 0.5),
+                context_size * s.line_spacing,
+                margin_top=8,
+                align="center",
+            )
+        )
+    return blocks
+
+
+def _quote_blocks(c: _Canvas, slide: SlideContent) -> list[_Block]:
+    assert slide.quote_data is not None
+    s = c.style
+    data = slide.quote_data
+    mark_path = _font_path("Georgia")
+    mark_font = _load_font(mark_path, 120) if mark_path else _font(s.heading_font, 120)
+    title_size = int(s.body_font_size * 0.85)
+    blocks = [
+        _Block(["“"], mark_font, _blend(c.accent, c.bg, 0.6), 120 * 0.8),
+        c.block(
+            data.quote_text,
+            _font(s.heading_font, s.heading_font_size, italic=True),
+            c.text,
+            s.heading_font_size * s.line_spacing,
+            margin_top=20,
+        ),
+        c.block(
+            f"— {data.author_name}",
+            _font(s.body_font, s.body_font_size, bold=True),
+            c.accent,
+            s.body_font_size * _NORMAL_LINE_HEIGHT,
+            margin_top=s.heading_body_gap,
+        ),
+    ]
+    if data.author_title:
+        blocks.append(
+            c.block(
+                data.author_title,
+                _font(s.body_font, title_size),
+                _blend(c.text, c.bg, 0.6),
+                title_size * _NORMAL_LINE_HEIGHT,
+                margin_top=8,
+            )
+        )
+    return blocks
+
+
+def render_slide_image(
+    slide: SlideContent,
+    style: StyleConfig,
+    template: ContentTemplate,
+    width: int,
+    height: int,
+) -> bytes:
+    """Draw a TEXT, STATS or QUOTE slide with Pillow, encoded in the output format.
+
+    Blocking: call through ``run_image_op`` from async code. Check
+    ``can_render`` first; raises LookupError if a needed font is missing.
+    """
+    canvas = _Canvas(style, width, height)
+    canvas.slide_number(slide.slide_number)
+    if template == ContentTemplate.STATS:
+        canvas.draw_blocks(_stats_blocks(canvas, slide), gap=16)
+    elif template == ContentTemplate.QUOTE:
+        canvas.draw_blocks(_quote_blocks(canvas, slide))
+    elif template == ContentTemplate.TEXT:
+        canvas.draw_blocks(_text_blocks(canvas, slide))
+    else:
+        raise ValueError(f"Pillow engine does not support template {template}")
+    return canvas.encode()
@@ -0,0 +1,14 @@
+<%inherit file="base.html.mako"/>
+## All slides of a carousel stacked as 1080x1350 sections sharing one stylesheet.
+<style>
+  html, body { height: auto; overflow: visible; }
+  .batch-section {
+    width: 1080px;
+    height: 1350px;
+    overflow: hidden;
+    position: relative;
+  }
+</style>
+% for section in sections:
+<section class="batch-section">${section | n}</section>
+% endfor
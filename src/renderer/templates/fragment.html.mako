@@ -0,0 +1,2 @@
+## Layout for a slide rendered as one section of batch.html.mako: body only.
+${self.body()}
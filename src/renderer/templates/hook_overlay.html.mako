@@ -1,11 +1,11 @@
-<%inherit file="base.html.mako"/>
+<%inherit file="${context.get('layout', 'base.html.mako')}"/>
 
 <%block name="extra_styles">
 <style>
   .slide-overlay {
     width: 1080px;
     height: 1350px;
-    background-image: url('${image_data_uri}');
+    background-image: url('${image_url}');
     background-size: cover;
     background-position: center;
     position: relative;
@@ -1,4 +1,4 @@
-<%inherit file="base.html.mako"/>
+<%inherit file="${context.get('layout', 'base.html.mako')}"/>
 
 <%block name="extra_styles">
 <style>
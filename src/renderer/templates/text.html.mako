@@ -1,4 +1,4 @@
-<%inherit file="base.html.mako"/>
+<%inherit file="${context.get('layout', 'base.html.mako')}"/>
 
 <div class="slide">
   % if slide_number is not None:
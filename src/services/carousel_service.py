@@ -3,17 +3,27 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing, asynccontextmanager
 
 import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.ai.anthropic_provider import AnthropicCopywriter
+from src.ai.base import ImageProviderOverloadedError, TokenUsage
+from src.ai.concurrency import SlotOutcome, get_image_limiter
 from src.ai.gemini_provider import GeminiImageProvider
+from src.ai.hedging import HedgePolicy, get_hook_hedge_policy
+from src.ai.rate_limit import RateLimitTimeoutError
 from src.config.constants import (
     AVAILABLE_STYLES,
     CREDITS_PER_CAROUSEL,
     IMAGE_GEN_MAX_RETRIES,
     IMAGE_GEN_RETRY_BACKOFF,
+    IMAGE_GEN_RETRY_BACKOFF_MAX,
     MAX_INPUT_TEXT_LENGTH,
     MAX_SLIDES_PER_CAROUSEL,
     MIN_SLIDES_PER_CAROUSEL,
@@ -23,11 +33,13 @@ from src.config.settings import get_settings
 from src.db.session import get_session_factory
 from src.models.carousel import CarouselGeneration, GenerationStatus
 from src.models.slide import Slide
-from src.renderer.engine import SlideRenderer, load_cta_image
+from src.renderer.cta import get_cta_cache
+from src.renderer.engine import SlideRenderer
+from src.renderer.image_ops import GeneratedImage, get_output_format, probe_image
 from src.renderer.styles import StyleConfig, load_style_config
 from src.schemas.slide import SlideContent, SlideType
 from src.services.credit_service import refund_credits
-from src.storage.s3 import S3Client
+from src.storage.s3 import get_s3_client
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +57,40 @@ class _ProgressCounter:
         return self.completed
 
 
+def _same_hook(a: SlideContent, b: SlideContent) -> bool:
+    """True if both hook slides would produce the same Gemini image prompt."""
+    return (a.heading, a.subtitle, a.image_description, a.text_position) == (
+        b.heading,
+        b.subtitle,
+        b.image_description,
+        b.text_position,
+    )
+
+
+def _dump_slides(slides: list[SlideContent]) -> str:
+    return json.dumps([slide.model_dump(mode="json") for slide in slides])
+
+
+async def _noop() -> None:
+    return None
+
+
+def _record_copy_usage(generation: CarouselGeneration, usage: TokenUsage) -> None:
+    """Store copywriting token counts (including prompt cache hits) on the generation."""
+    generation.copy_input_tokens = usage.input_tokens
+    generation.copy_output_tokens = usage.output_tokens
+    generation.copy_cache_read_tokens = usage.cache_read_tokens
+    generation.copy_cache_write_tokens = usage.cache_write_tokens
+    logger.info(
+        "Generation %d copy tokens: input=%d output=%d cache_read=%d cache_write=%d",
+        generation.id,
+        usage.input_tokens,
+        usage.output_tokens,
+        usage.cache_read_tokens,
+        usage.cache_write_tokens,
+    )
+
+
 class TelegramNotifier:
     """Edits a Telegram status message with progress updates."""
 
@@ -79,7 +125,7 @@ class CarouselService:
     def __init__(self) -> None:
         self.copywriter = AnthropicCopywriter()
         self.image_provider = GeminiImageProvider()
-        self.s3 = S3Client()
+        self.s3 = get_s3_client()
 
     async def _generate_slide_image_with_retry(
         self,
@@ -89,33 +135,354 @@ class CarouselService:
         notifier: TelegramNotifier,
         total: int,
         progress: _ProgressCounter,
-    ) -> bytes | None:
-        """Generate a single slide image with retries and concurrency limiting."""
+        deadline: float | None = None,
+        hedge: HedgePolicy | None = None,
+    ) -> GeneratedImage | None:
+        """Generate a single slide image with retries and concurrency limiting.
+
+        ``semaphore`` bounds the carousel's calls and the process-wide adaptive
+        limiter bounds all of them; a call takes its limiter slot only once the
+        provider's shared rate limits admit it. Retries back off exponentially with full
+        jitter and stop once the next one would start after ``deadline``
+        (``time.monotonic()`` based). With a ``hedge`` policy a slow attempt
+        is raced against a second identical request, which takes its own
+        permit and limiter slot and is skipped when either is taken or the
+        limiter has cut its limit below the initial one.
+        """
+        limiter = get_image_limiter()
+
+        def _call() -> Awaitable[GeneratedImage | None]:
+            return self.image_provider.generate_slide_image(
+                slide=slide,
+                style_config=style_config,
+            )
+
+        @asynccontextmanager
+        async def _hedge_slot() -> AsyncIterator[SlotOutcome | None]:
+            if (
+                semaphore.locked()
+                or limiter.limit < limiter.initial
+                or limiter.stats().in_flight >= limiter.limit
+            ):
+                yield None
+                return
+            async with semaphore, self.image_provider.admit(), limiter.try_slot() as outcome:
+                yield outcome
+
         async with semaphore:
             for attempt in range(IMAGE_GEN_MAX_RETRIES + 1):
-                result = await self.image_provider.generate_slide_image(
-                    slide=slide,
-                    style_config=style_config,
-                )
+                try:
+                    async with self.image_provider.admit(), limiter.slot() as outcome:
+                        result = await (_call() if hedge is None else hedge.run(_call, _hedge_slot))
+                        outcome.report(result)
+                except RateLimitTimeoutError as e:
+                    logger.warning("Slide %d image gen not admitted: %s", slide.position, e)
+                    result = None
+                except ImageProviderOverloadedError as e:
+                    logger.warning("Slide %d image gen overloaded: %s", slide.position, e)
+                    result = None
                 if result is not None:
                     count = progress.increment()
                     await notifier.update(f"Generating slide images... ({count}/{total} ready)")
                     return result
 
                 if attempt < IMAGE_GEN_MAX_RETRIES:
+                    delay = random.uniform(
+                        0, min(IMAGE_GEN_RETRY_BACKOFF_MAX, IMAGE_GEN_RETRY_BACKOFF * 2**attempt)
+                    )
+                    if deadline is not None and time.monotonic() + delay >= deadline:
+                        logger.warning(
+                            "Slide %d image gen out of time after %d attempts",
+                            slide.position,
+                            attempt + 1,
+                        )
+                        break
                     logger.warning(
-                        "Slide %d image gen failed (attempt %d/%d), retrying...",
+                        "Slide %d image gen failed (attempt %d/%d), retrying in %.1f s...",
                         slide.position,
                         attempt + 1,
                         IMAGE_GEN_MAX_RETRIES + 1,
+                        delay,
                     )
-                    await asyncio.sleep(IMAGE_GEN_RETRY_BACKOFF * (attempt + 1))
-
-            logger.warning("All retries exhausted for slide %d image generation", slide.position)
+                    await asyncio.sleep(delay)
+            else:
+                logger.warning(
+                    "All retries exhausted for slide %d image generation", slide.position
+                )
             count = progress.increment()
             await notifier.update(f"Generating slide images... ({count}/{total} ready)")
             return None
 
+    async def _stream_copy(
+        self,
+        input_text: str,
+        style_slug: str,
+        slide_count: int,
+        renderer: SlideRenderer,
+        cta_image: bytes | None,
+        early_renders: dict[int, asyncio.Task[bytes]],
+        on_hook: Callable[[SlideContent], None] | None = None,
+        usage: TokenUsage | None = None,
+    ) -> list[SlideContent]:
+        """Collect streamed slides, starting renders for slides that need no hook image.
+
+        Early renders are skipped when the renderer batches the whole carousel.
+        Render tasks are stored in ``early_renders`` keyed by slide index.
+        ``on_hook`` is called as soon as the hook slide arrives.
+        """
+        slides: list[SlideContent] = []
+        stream = self.copywriter.stream_slides(
+            input_text=input_text,
+            style_slug=style_slug,
+            slide_count=slide_count,
+            usage=usage,
+        )
+        async with aclosing(stream):
+            async for slide in stream:
+                if len(slides) >= MAX_SLIDES_PER_CAROUSEL:
+                    break
+                if slide.slide_type != SlideType.HOOK and not renderer.batch:
+                    early_renders[len(slides)] = asyncio.create_task(
+                        renderer.render_slide(slide, cta_image=cta_image)
+                    )
+                elif on_hook is not None:
+                    on_hook(slide)
+                slides.append(slide)
+        return slides
+
+    async def _hook_image(
+        self,
+        slide: SlideContent,
+        style_config: StyleConfig,
+        semaphore: asyncio.Semaphore,
+        notifier: TelegramNotifier,
+        deadline: float | None = None,
+    ) -> tuple[SlideContent, GeneratedImage | None]:
+        """Generate the hook image, returning it with the slide it was made for."""
+        image = await self._generate_slide_image_with_retry(
+            slide=slide,
+            style_config=style_config,
+            semaphore=semaphore,
+            notifier=notifier,
+            total=1,
+            progress=_ProgressCounter(),
+            deadline=deadline,
+            hedge=get_hook_hedge_policy() if get_settings().pipeline.hedge_hook_image else None,
+        )
+        return slide, image
+
+    async def _speculate_hook(
+        self,
+        input_text: str,
+        style_slug: str,
+        slide_count: int,
+        style_config: StyleConfig,
+        semaphore: asyncio.Semaphore,
+        notifier: TelegramNotifier,
+        usage: TokenUsage | None = None,
+        deadline: float | None = None,
+    ) -> tuple[SlideContent, GeneratedImage | None]:
+        """Write the hook slide with a cheap early call and generate its image."""
+        hook = await self.copywriter.generate_hook(
+            input_text=input_text,
+            style_slug=style_slug,
+            slide_count=slide_count,
+            usage=usage,
+        )
+        return await self._hook_image(hook, style_config, semaphore, notifier, deadline)
+
+    async def _resolve_hook_image(
+        self,
+        slides: list[SlideContent],
+        speculation: asyncio.Task[tuple[SlideContent, GeneratedImage | None]] | None,
+        style_config: StyleConfig,
+        semaphore: asyncio.Semaphore,
+        notifier: TelegramNotifier,
+        deadline: float | None = None,
+    ) -> GeneratedImage | None:
+        """Return the hook image, reconciling a speculative one with the final hook.
+
+        On a mismatch the ``adopt`` policy replaces ``slides[0]`` with the
+        speculative hook (whose text is baked into the image); ``regenerate``
+        discards the speculative image. A speculation that produced no image is
+        never adopted.
+        """
+        if speculation is not None:
+            try:
+                speculative_hook, image = await speculation
+            except Exception:
+                logger.warning("Speculative hook generation failed", exc_info=True)
+            else:
+                if _same_hook(speculative_hook, slides[0]):
+                    return image
+                if image is not None and get_settings().pipeline.hook_mismatch_policy == "adopt":
+                    logger.info("Final hook differs from speculative hook, adopting speculative")
+                    slides[0] = speculative_hook.model_copy(update={"position": slides[0].position})
+                    return image
+                logger.info("Final hook differs from speculative hook, regenerating image")
+
+        _, image = await self._hook_image(slides[0], style_config, semaphore, notifier, deadline)
+        return image
+
+    async def _archive_slides(
+        self,
+        session: AsyncSession,
+        generation: CarouselGeneration,
+        user_id: int,
+        slides_content: list[SlideContent],
+        rendered_slides: list[bytes],
+    ) -> None:
+        """Upload rendered slides to S3 and persist their ``Slide`` rows."""
+        ts = int(time.time())
+        gen_id = generation.id
+        output = get_output_format()
+        s3_keys = await self.s3.upload_many(
+            [
+                (f"{S3_CAROUSEL_PREFIX}/{user_id}/{gen_id}/{ts}_slide_{i}{output.extension}", image)
+                for i, image in enumerate(rendered_slides)
+            ],
+            content_type=output.content_type,
+        )
+
+        for sc, s3_key in zip(slides_content, s3_keys, strict=True):
+            # Serialize template-specific data as JSON
+            template_data_json = None
+            if sc.listing_data:
+                template_data_json = sc.listing_data.model_dump_json()
+            elif sc.comparison_data:
+                template_data_json = sc.comparison_data.model_dump_json()
+
+            slide = Slide(
+                carousel_id=generation.id,
+                position=sc.position,
+                heading=sc.heading,
+                subtitle=sc.subtitle,
+                body_text=sc.body_text,
+                text_position=sc.text_position.value,
+                slide_type=sc.slide_type.value,
+                content_template=sc.content_template.value,
+                template_data=template_data_json,
+                rendered_s3_key=s3_key,
+                image_s3_key=(
+                    generation.hook_image_s3_key if sc.slide_type == SlideType.HOOK else None
+                ),
+            )
+            session.add(slide)
+
+        await session.commit()
+
+    async def _send_media_group(
+        self,
+        bot_token: str,
+        telegram_chat_id: int,
+        status_message_id: int,
+        rendered_slides: list[bytes],
+    ) -> None:
+        """Send the rendered slides as an album and remove the status message."""
+        output = get_output_format()
+        async with httpx.AsyncClient() as http:
+            media = []
+            files = {}
+            for i, image_bytes in enumerate(rendered_slides):
+                attach_name = f"slide_{i}"
+                media.append(
+                    {
+                        "type": "photo",
+                        "media": f"attach://{attach_name}",
+                    }
+                )
+                files[attach_name] = (
+                    f"{attach_name}{output.extension}",
+                    image_bytes,
+                    output.content_type,
+                )
+
+            resp = await http.post(
+                f"https://api.telegram.org/bot{bot_token}/sendMediaGroup",
+                data={
+                    "chat_id": telegram_chat_id,
+                    "media": json.dumps(media),
+                },
+                files=files,
+                timeout=60,
+            )
+            resp_data = resp.json()
+            if resp.status_code != 200 or not resp_data.get("ok"):
+                desc = resp_data.get("description", "")
+                raise RuntimeError(f"sendMediaGroup failed: {resp.status_code} {desc}")
+
+            # Delete status message
+            await http.post(
+                f"https://api.telegram.org/bot{bot_token}/deleteMessage",
+                json={
+                    "chat_id": telegram_chat_id,
+                    "message_id": status_message_id,
+                },
+                timeout=10,
+            )
+
+    async def _load_or_create_generation(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        input_text: str,
+        style_slug: str,
+        celery_task_id: str | None,
+    ) -> tuple[CarouselGeneration, bool]:
+        """Return the unfinished generation of a retried task, or a new one.
+
+        The second element is True if an earlier attempt is being resumed.
+        """
+        if celery_task_id is not None:
+            previous = (
+                await session.execute(
+                    select(CarouselGeneration)
+                    .where(
+                        CarouselGeneration.celery_task_id == celery_task_id,
+                        CarouselGeneration.status.not_in(
+                            [GenerationStatus.COMPLETED, GenerationStatus.FAILED]
+                        ),
+                    )
+                    .order_by(CarouselGeneration.id.desc())
+                    .limit(1)
+                )
+            ).scalar_one_or_none()
+            if previous is not None:
+                return previous, True
+
+        generation = CarouselGeneration(
+            user_id=user_id,
+            input_text=input_text,
+            style_slug=style_slug,
+            status=GenerationStatus.PENDING,
+            celery_task_id=celery_task_id,
+        )
+        session.add(generation)
+        await session.commit()
+        return generation, False
+
+    async def _checkpoint_hook_image(
+        self,
+        generation: CarouselGeneration,
+        user_id: int,
+        image: GeneratedImage | None,
+    ) -> None:
+        """Persist the hook image to S3 so a retry does not pay for it again."""
+        if image is None:
+            generation.hook_image_s3_key = None
+            return
+        key = f"{S3_CAROUSEL_PREFIX}/{user_id}/{generation.id}/{int(time.time())}_hook"
+        generation.hook_image_s3_key = await self.s3.upload_bytes_async(
+            f"{key}{image.extension}", image.data, image.content_type
+        )
+
+    async def _restore_hook_image(self, generation: CarouselGeneration) -> GeneratedImage | None:
+        key = generation.hook_image_s3_key
+        if key is None:
+            return None
+        [data] = await self.s3.download_many([key])
+        return probe_image(data)
+
     async def generate_and_send(
         self,
         user_id: int,
@@ -124,7 +491,15 @@ class CarouselService:
         style_slug: str,
         status_message_id: int,
         celery_task_id: str | None = None,
+        final_attempt: bool = True,
     ) -> None:
+        """Run the pipeline, resuming a previous attempt of the same task if there is one.
+
+        Every stage persists its output (slides JSON, hook image, rendered slide
+        keys) before the status advances, so a retry skips completed stages.
+        Only a failure on the ``final_attempt`` marks the generation FAILED and
+        refunds; earlier failures leave it resumable.
+        """
         if len(input_text) > MAX_INPUT_TEXT_LENGTH:
             raise ValueError(f"Input text exceeds maximum length of {MAX_INPUT_TEXT_LENGTH}")
         if style_slug not in AVAILABLE_STYLES:
@@ -139,163 +514,220 @@ class CarouselService:
 
         try:
             async with factory() as session:
-                generation = CarouselGeneration(
-                    user_id=user_id,
-                    input_text=input_text,
-                    style_slug=style_slug,
-                    status=GenerationStatus.PENDING,
-                    celery_task_id=celery_task_id,
+                generation, resumed = await self._load_or_create_generation(
+                    session, user_id, input_text, style_slug, celery_task_id
                 )
-                session.add(generation)
-                await session.commit()
-
-                try:
-                    # Step 1: AI Copywriting
-                    generation.status = GenerationStatus.COPYWRITING
-                    await session.commit()
-                    await notifier.update("Writing carousel copy...")
-
-                    slide_count = min(
-                        max(MIN_SLIDES_PER_CAROUSEL, len(input_text) // 500 + 3),
-                        MAX_SLIDES_PER_CAROUSEL,
-                    )
-                    slides_content = await self.copywriter.generate_slides(
-                        input_text=input_text,
-                        style_slug=style_slug,
-                        slide_count=slide_count,
+                slides_content: list[SlideContent] | None = None
+                archived_keys: list[str | None] = []
+                if resumed:
+                    logger.info(
+                        "Resuming generation %d from stage %s",
+                        generation.id,
+                        generation.status.value,
                     )
-                    slides_content = slides_content[:MAX_SLIDES_PER_CAROUSEL]
-                    generation.slide_count = len(slides_content)
-
-                    # Step 2: Image generation — only for hook slide (slide 1)
-                    generation.status = GenerationStatus.IMAGE_GENERATION
-                    await session.commit()
-                    await notifier.update("Generating hook slide image...")
-
+                    if generation.slides_data is not None:
+                        slides_content = [
+                            SlideContent.model_validate(data)
+                            for data in json.loads(generation.slides_data)
+                        ]
+                    archived_keys = [s.rendered_s3_key for s in generation.slides]
+
+                # Set once Telegram accepted the album: later errors are archival only
+                delivered = False
+                early_renders: dict[int, asyncio.Task[bytes]] = {}
+                speculation: asyncio.Task[tuple[SlideContent, GeneratedImage | None]] | None = None
+                checkpoint: asyncio.Task[None] | None = None
+                rendering: asyncio.Task[list[bytes]] | None = None
+                try:
                     style_config = load_style_config(style_slug)
+                    renderer = SlideRenderer(style_config)
                     semaphore = asyncio.Semaphore(max_concurrency)
-                    progress = _ProgressCounter()
-
-                    hook_slide = slides_content[0]
-                    hook_image = await self._generate_slide_image_with_retry(
-                        slide=hook_slide,
-                        style_config=style_config,
-                        semaphore=semaphore,
-                        notifier=notifier,
-                        total=1,
-                        progress=progress,
-                    )
+                    image_deadline: float | None = None
 
-                    # Load pre-made CTA image for this style
-                    cta_image_bytes = load_cta_image(style_slug)
+                    def _image_deadline() -> float:
+                        # Image calls and their retries share one time budget per
+                        # carousel, counted from when image generation starts
+                        nonlocal image_deadline
+                        if image_deadline is None:
+                            image_deadline = time.monotonic() + settings.gemini.retry_deadline
+                        return image_deadline
 
-                    # Step 3: Rendering
-                    generation.status = GenerationStatus.RENDERING
-                    await session.commit()
-                    await notifier.update(f"Rendering {len(slides_content)} slides...")
+                    # Final CTA slide for this style (memoized per process)
+                    cta_image_bytes = await get_cta_cache().get(style_slug)
+                    usage: TokenUsage | None = None
 
-                    renderer = SlideRenderer(style_config)
-                    rendered_slides: list[bytes] = []
+                    # Step 1: AI Copywriting
+                    if slides_content is None:
+                        generation.status = GenerationStatus.COPYWRITING
+                        await session.commit()
+                        await notifier.update("Writing carousel copy...")
 
-                    for sc in slides_content:
-                        if sc.slide_type == SlideType.HOOK:
-                            png_bytes = await renderer.render(
-                                slide=sc,
-                                generated_image=hook_image,
-                            )
-                        elif sc.slide_type == SlideType.CTA:
-                            png_bytes = await renderer.render(
-                                slide=sc,
+                        slide_count = min(
+                            max(MIN_SLIDES_PER_CAROUSEL, len(input_text) // 500 + 3),
+                            MAX_SLIDES_PER_CAROUSEL,
+                        )
+                        usage = TokenUsage()
+                        speculative = settings.pipeline.speculative_hook
+                        if settings.anthropic.streaming:
+
+                            def _on_hook(hook: SlideContent) -> None:
+                                nonlocal speculation
+                                speculation = asyncio.create_task(
+                                    self._hook_image(
+                                        hook, style_config, semaphore, notifier, _image_deadline()
+                                    )
+                                )
+
+                            slides_content = await self._stream_copy(
+                                input_text=input_text,
+                                style_slug=style_slug,
+                                slide_count=slide_count,
+                                renderer=renderer,
                                 cta_image=cta_image_bytes,
+                                early_renders=early_renders,
+                                on_hook=_on_hook if speculative else None,
+                                usage=usage,
                             )
                         else:
-                            png_bytes = await renderer.render(slide=sc)
-                        rendered_slides.append(png_bytes)
-
-                    # Step 4: Upload to S3
-                    generation.status = GenerationStatus.UPLOADING
-                    await session.commit()
+                            if speculative:
+                                speculation = asyncio.create_task(
+                                    self._speculate_hook(
+                                        input_text=input_text,
+                                        style_slug=style_slug,
+                                        slide_count=slide_count,
+                                        style_config=style_config,
+                                        semaphore=semaphore,
+                                        notifier=notifier,
+                                        usage=usage,
+                                        deadline=_image_deadline(),
+                                    )
+                                )
+                            slides_content = await self.copywriter.generate_slides(
+                                input_text=input_text,
+                                style_slug=style_slug,
+                                slide_count=slide_count,
+                                usage=usage,
+                            )
+                        slides_content = slides_content[:MAX_SLIDES_PER_CAROUSEL]
+                        generation.slide_count = len(slides_content)
+                        generation.slides_data = _dump_slides(slides_content)
+                        generation.status = GenerationStatus.IMAGE_GENERATION
+                        await session.commit()
 
-                    ts = int(time.time())
-                    for i, (sc, png_bytes) in enumerate(
-                        zip(slides_content, rendered_slides, strict=True)
-                    ):
-                        gen_id = generation.id
-                        s3_key = f"{S3_CAROUSEL_PREFIX}/{user_id}/{gen_id}/{ts}_slide_{i}.png"
-                        self.s3.upload_bytes(s3_key, png_bytes)
-
-                        # Serialize template-specific data as JSON
-                        template_data_json = None
-                        if sc.listing_data:
-                            template_data_json = sc.listing_data.model_dump_json()
-                        elif sc.comparison_data:
-                            template_data_json = sc.comparison_data.model_dump_json()
-
-                        slide = Slide(
-                            carousel_id=generation.id,
-                            position=sc.position,
-                            heading=sc.heading,
-                            subtitle=sc.subtitle,
-                            body_text=sc.body_text,
-                            text_position=sc.text_position.value,
-                            slide_type=sc.slide_type.value,
-                            content_template=sc.content_template.value,
-                            template_data=template_data_json,
-                            rendered_s3_key=s3_key,
+                    # Step 2: Image generation — only for hook slide (slide 1)
+                    hook_image: GeneratedImage | None = None
+                    hook_resolved = generation.status == GenerationStatus.IMAGE_GENERATION
+                    if hook_resolved:
+                        await notifier.update("Generating hook slide image...")
+
+                        hook_image = await self._resolve_hook_image(
+                            slides_content,
+                            speculation=speculation,
+                            style_config=style_config,
+                            semaphore=semaphore,
+                            notifier=notifier,
+                            deadline=_image_deadline(),
                         )
-                        session.add(slide)
-
-                    await session.commit()
 
-                    # Step 5: Send to Telegram
-                    generation.status = GenerationStatus.SENDING
-                    await session.commit()
-                    await notifier.update("Sending carousel...")
+                        if usage is not None:
+                            _record_copy_usage(generation, usage)
+                        # The adopt policy may have replaced the hook slide
+                        generation.slides_data = _dump_slides(slides_content)
+                        # Uploaded while the slides render; committed with RENDERING
+                        checkpoint = asyncio.create_task(
+                            self._checkpoint_hook_image(generation, user_id, hook_image)
+                        )
 
-                    async with httpx.AsyncClient() as http:
-                        media = []
-                        files = {}
-                        for i, png_bytes in enumerate(rendered_slides):
-                            attach_name = f"slide_{i}"
-                            media.append(
-                                {
-                                    "type": "photo",
-                                    "media": f"attach://{attach_name}",
-                                }
+                    # Step 3: Rendering (slides streamed earlier may already be done).
+                    # Slides archived by a previous attempt are downloaded instead.
+                    archived = len(archived_keys) == len(slides_content) and all(archived_keys)
+                    # UPLOADING: a previous attempt sent the carousel but failed to archive it
+                    sent = generation.status == GenerationStatus.UPLOADING
+                    delivered = sent
+                    rendered_slides: list[bytes] = []
+                    if archived and not sent:
+                        rendered_slides = await self.s3.download_many(
+                            [key for key in archived_keys if key is not None]
+                        )
+                    elif not archived:
+                        if not hook_resolved:
+                            hook_image = await self._restore_hook_image(generation)
+                        await notifier.update(f"Rendering {len(slides_content)} slides...")
+                        rendering = asyncio.create_task(
+                            self._render_slides(
+                                renderer, slides_content, early_renders, hook_image, cta_image_bytes
                             )
-                            files[attach_name] = (f"{attach_name}.png", png_bytes, "image/png")
-
-                        resp = await http.post(
-                            f"https://api.telegram.org/bot{bot_token}/sendMediaGroup",
-                            data={
-                                "chat_id": telegram_chat_id,
-                                "media": json.dumps(media),
-                            },
-                            files=files,
-                            timeout=60,
                         )
-                        resp_data = resp.json()
-                        if resp.status_code != 200 or not resp_data.get("ok"):
-                            desc = resp_data.get("description", "")
-                            raise RuntimeError(f"sendMediaGroup failed: {resp.status_code} {desc}")
-
-                        # Delete status message
-                        await http.post(
-                            f"https://api.telegram.org/bot{bot_token}/deleteMessage",
-                            json={
-                                "chat_id": telegram_chat_id,
-                                "message_id": status_message_id,
-                            },
-                            timeout=10,
+                        if checkpoint is not None:
+                            await checkpoint
+                        if not sent:
+                            generation.status = GenerationStatus.RENDERING
+                            await session.commit()
+                        rendered_slides = await rendering
+
+                    # Step 4: Send to Telegram while archiving to S3 and the DB.
+                    # The send only needs the rendered bytes, so the user does not
+                    # wait on archival. Only a failed send fails the carousel.
+                    if sent:
+                        if not archived:
+                            try:
+                                await self._archive_slides(
+                                    session, generation, user_id, slides_content, rendered_slides
+                                )
+                            except Exception as e:
+                                await self._record_archival_failure(session, generation, e)
+                                raise
+                    else:
+                        generation.status = GenerationStatus.SENDING
+                        await session.commit()
+                        await notifier.update("Sending carousel...")
+
+                        send_result, archive_result = await asyncio.gather(
+                            self._send_media_group(
+                                bot_token, telegram_chat_id, status_message_id, rendered_slides
+                            ),
+                            _noop()
+                            if archived
+                            else self._archive_slides(
+                                session, generation, user_id, slides_content, rendered_slides
+                            ),
+                            return_exceptions=True,
                         )
+                        if isinstance(send_result, BaseException):
+                            raise send_result
+                        delivered = True
+                        if isinstance(archive_result, BaseException):
+                            # Never send the carousel twice: a retry only archives
+                            await self._record_archival_failure(session, generation, archive_result)
+                            raise archive_result
 
                     generation.status = GenerationStatus.COMPLETED
                     await session.commit()
                     logger.info("Carousel %d completed for user %d", generation.id, user_id)
 
                 except Exception as e:
-                    generation.status = GenerationStatus.FAILED
+                    for task in early_renders.values():
+                        task.cancel()
+                    for pending in (speculation, checkpoint, rendering):
+                        if pending is not None:
+                            pending.cancel()
+                    if delivered:
+                        # The user has the carousel: no refund, no failure message
+                        raise
+
                     generation.error_message = str(e)[:500]
+                    if not final_attempt:
+                        # Keep the generation at its stage so the retry resumes it
+                        await session.commit()
+                        await notifier.update("Something went wrong, retrying...")
+                        logger.warning(
+                            "Generation %d failed at stage %s, will resume on retry",
+                            generation.id,
+                            generation.status.value,
+                        )
+                        raise
+
+                    generation.status = GenerationStatus.FAILED
                     await session.commit()
 
                     try:
@@ -325,3 +757,41 @@ class CarouselService:
                     raise
         finally:
             await notifier.close()
+
+    @staticmethod
+    async def _record_archival_failure(
+        session: AsyncSession, generation: CarouselGeneration, error: BaseException
+    ) -> None:
+        """Leave a delivered carousel in UPLOADING so retries only archive it.
+
+        Even after the final attempt it is not FAILED: the user has the carousel.
+        """
+        generation_id = generation.id
+        await session.rollback()
+        logger.error("Carousel %d delivered but archival failed", generation_id, exc_info=error)
+        generation.error_message = f"Archival failed: {error}"[:500]
+        generation.status = GenerationStatus.UPLOADING
+        await session.commit()
+
+    @staticmethod
+    async def _render_slides(
+        renderer: SlideRenderer,
+        slides_content: list[SlideContent],
+        early_renders: dict[int, asyncio.Task[bytes]],
+        hook_image: GeneratedImage | None,
+        cta_image: bytes | None,
+    ) -> list[bytes]:
+        """Render every slide, reusing renders started while the copy streamed."""
+        if renderer.batch:
+            return await renderer.render_carousel(
+                slides_content, hook_image=hook_image, cta_image=cta_image
+            )
+        pending_renders: list[Awaitable[bytes]] = []
+        for i, sc in enumerate(slides_content):
+            early = early_renders.get(i)
+            pending_renders.append(
+                early
+                if early is not None
+                else renderer.render_slide(sc, hook_image=hook_image, cta_image=cta_image)
+            )
+        return list(await asyncio.gather(*pending_renders))
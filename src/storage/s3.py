@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from src.config.settings import get_settings
@@ -10,6 +18,15 @@ from src.config.settings import get_settings
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class S3UploadStats:
+    uploads: int
+    failures: int
+    bytes: int
+    total_seconds: float
+    max_seconds: float
+
+
 class S3Client:
     def __init__(self) -> None:
         settings = get_settings()
@@ -21,7 +38,19 @@ class S3Client:
             aws_access_key_id=settings.s3.access_key.get_secret_value(),
             aws_secret_access_key=settings.s3.secret_key.get_secret_value(),
             region_name=self.region,
+            config=Config(max_pool_connections=settings.s3.max_pool_connections),
         )
+        # boto3 clients are thread-safe; blocking PUTs run here, off the event loop.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.s3.upload_concurrency),
+            thread_name_prefix="s3-upload",
+        )
+        self._stats_lock = threading.Lock()
+        self._uploads = 0
+        self._failures = 0
+        self._bytes = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
         self._ensure_bucket()
 
     def _ensure_bucket(self) -> None:
@@ -51,6 +80,67 @@ class S3Client:
         logger.debug("Uploaded %s (%d bytes)", key, len(data))
         return key
 
+    def _timed_upload(self, key: str, data: bytes, content_type: str) -> str:
+        start = time.perf_counter()
+        try:
+            self.upload_bytes(key, data, content_type)
+        except Exception:
+            with self._stats_lock:
+                self._failures += 1
+            raise
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self._uploads += 1
+            self._bytes += len(data)
+            self._total_seconds += elapsed
+            self._max_seconds = max(self._max_seconds, elapsed)
+        logger.debug("PUT %s took %.3fs", key, elapsed)
+        return key
+
+    async def upload_bytes_async(
+        self, key: str, data: bytes, content_type: str = "image/png"
+    ) -> str:
+        """Upload on the client's thread pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._timed_upload, key, data, content_type
+        )
+
+    async def upload_many(
+        self,
+        items: Sequence[tuple[str, bytes]],
+        content_type: str = "image/png",
+    ) -> list[str]:
+        """Upload ``(key, data)`` pairs concurrently; keys are returned in input order."""
+        return list(
+            await asyncio.gather(
+                *(self.upload_bytes_async(key, data, content_type) for key, data in items)
+            )
+        )
+
+    def download_bytes(self, key: str) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket, Key=key)
+        return response["Body"].read()  # type: ignore[no-any-return]
+
+    async def download_many(self, keys: Sequence[str]) -> list[bytes]:
+        """Download objects concurrently on the client's thread pool, in input order."""
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(self._executor, self.download_bytes, key) for key in keys)
+            )
+        )
+
+    def stats(self) -> S3UploadStats:
+        with self._stats_lock:
+            return S3UploadStats(
+                uploads=self._uploads,
+                failures=self._failures,
+                bytes=self._bytes,
+                total_seconds=self._total_seconds,
+                max_seconds=self._max_seconds,
+            )
+
     def get_presigned_url(self, key: str, expires_in: int = 3600) -> str:
         return self.client.generate_presigned_url(  # type: ignore[no-any-return]
             "get_object",
@@ -69,3 +159,9 @@ class S3Client:
             for obj in page.get("Contents", []):
                 keys.append(obj["Key"])
         return keys
+
+
+@lru_cache(maxsize=1)
+def get_s3_client() -> S3Client:
+    """Process-wide S3 client sharing one connection pool and upload executor."""
+    return S3Client()
@@ -5,15 +5,22 @@ import logging
 
 from celery import Celery
 from celery.schedules import crontab
-from celery.signals import worker_shutdown
+from celery.signals import (
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
 
 from src.config.settings import get_settings
+from src.worker.loop import current_worker_loop
 
 logger = logging.getLogger(__name__)
 
 
 def create_celery_app() -> Celery:
     settings = get_settings()
+    worker = settings.worker
 
     app = Celery(
         "carouselmaker",
@@ -29,7 +36,11 @@ def create_celery_app() -> Celery:
         enable_utc=True,
         task_track_started=True,
         task_acks_late=True,
+        # With one prefetched task per slot, a worker at its in-flight limit
+        # leaves further tasks on the broker for other workers
         worker_prefetch_multiplier=1,
+        worker_pool=worker.pool,
+        worker_concurrency=worker.max_in_flight if worker.pool == "threads" else worker.concurrency,
         beat_schedule={
             "cleanup-old-files": {
                 "task": "src.worker.tasks.cleanup.cleanup_old_files",
@@ -48,17 +59,42 @@ def create_celery_app() -> Celery:
 celery_app = create_celery_app()
 
 
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _on_worker_process_init(**kwargs: object) -> None:
+    """Warm the process (loop, templates, styles, browser, CTA) before its first task."""
+    from src.worker.startup import warm_start
+
+    warm_start()
+
+
+@worker_init.connect  # type: ignore[untyped-decorator]
+def _on_worker_init(**kwargs: object) -> None:
+    """Clear stale readiness files; warm the main process when it runs tasks (threads pool).
+
+    For prefork only the imports are done here: the loop thread and browser
+    would not survive the fork.
+    """
+    from src.worker.startup import prepare_worker, warm_start
+
+    pool = get_settings().worker.pool
+    prepare_worker(pool)
+    if pool == "threads":
+        warm_start()
+
+
 @worker_shutdown.connect  # type: ignore[untyped-decorator]
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
 def _on_worker_shutdown(**kwargs: object) -> None:
     """Shut down Playwright browser on Celery worker exit."""
     from src.renderer.browser import shutdown
+    from src.worker.startup import clear_readiness
 
+    clear_readiness()
+    loop = current_worker_loop()
+    if loop is None:
+        return
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(shutdown(), loop)
-            future.result(timeout=10)
-        else:
-            asyncio.run(shutdown())
+        future = asyncio.run_coroutine_threadsafe(shutdown(), loop)
+        future.result(timeout=10)
     except Exception:
         logger.debug("Failed to shut down Playwright browser", exc_info=True)
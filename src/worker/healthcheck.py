@@ -0,0 +1,68 @@
+"""Worker container healthcheck: healthy once a live worker process finished warm start.
+
+Usage: python -m src.worker.healthcheck
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from src.config.settings import get_settings
+
+_HEALTHY_STATES = frozenset({"ready", "degraded"})
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def process_start_time(pid: int) -> int | None:
+    """Start time of ``pid`` in clock ticks since boot, or None without /proc.
+
+    Together with the pid it identifies a process, so a reused pid is told apart.
+    """
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    # Fields after the command name, which may itself contain spaces and parentheses
+    fields = stat[stat.rindex(")") + 2 :].split()
+    return int(fields[19])
+
+
+def check(ready_dir: Path) -> bool:
+    """True if any live worker process reports it has finished warming up."""
+    for path in ready_dir.glob("*.json"):
+        if not path.stem.isdigit() or not _alive(int(path.stem)):
+            continue
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        # A file left by an earlier process whose pid was since reused
+        if data.get("process_start") != process_start_time(int(path.stem)):
+            continue
+        if data.get("state") in _HEALTHY_STATES:
+            return True
+    return False
+
+
+def main() -> int:
+    ready_dir = Path(get_settings().worker.ready_dir)
+    if check(ready_dir):
+        return 0
+    print(f"No ready worker process in {ready_dir}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
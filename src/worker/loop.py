@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+# ---------------------------------------------------------------------------
+# Persistent event loop shared across all tasks in this worker process.
+# Celery runs synchronous tasks, so we maintain a single background thread
+# with its own event loop instead of calling asyncio.run() per task (which
+# creates/destroys a loop every time and breaks asyncpg connection pooling).
+# ---------------------------------------------------------------------------
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker's shared event loop, starting it on first use."""
+    global _loop  # noqa: PLW0603
+    if _loop is not None and _loop.is_running():
+        return _loop
+    with _loop_lock:
+        if _loop is not None and _loop.is_running():
+            return _loop
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        _loop = loop
+        return _loop
+
+
+def current_worker_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the shared event loop if it is running, without starting it."""
+    if _loop is not None and _loop.is_running():
+        return _loop
+    return None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Worker metrics: in-process counters such as the adaptive image concurrency
+# limit, provider rate limit waits, hook image hedging and the Chromium browser
+# and its page pool live in each worker process, out of reach of the API's admin
+# stats, so every process logs them as one JSON line at a fixed interval.
+# ---------------------------------------------------------------------------
+
+
+def collect_stats() -> dict[str, object]:
+    """Return this process's counters, keyed by component."""
+    from src.ai.concurrency import get_image_concurrency_stats
+    from src.ai.hedging import get_hedge_stats
+    from src.ai.rate_limit import get_rate_limit_stats
+    from src.renderer.browser import get_browser_stats, get_pool_stats
+
+    pool = get_pool_stats()
+    return {
+        "image_concurrency": asdict(get_image_concurrency_stats()),
+        "rate_limits": {
+            provider: asdict(stats) for provider, stats in get_rate_limit_stats().items()
+        },
+        "hook_hedging": asdict(get_hedge_stats()),
+        "browser": asdict(get_browser_stats()),
+        "page_pool": asdict(pool) if pool is not None else None,
+    }
+
+
+async def log_stats(interval: float) -> None:
+    """Log collect_stats() as JSON every ``interval`` seconds, until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            logger.info("Worker stats %s", json.dumps(collect_stats()))
+        except Exception:
+            logger.warning("Failed to collect worker stats", exc_info=True)
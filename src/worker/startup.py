@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from src.config.settings import get_settings
+from src.worker.healthcheck import process_start_time
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Warm start for worker processes: everything the first task would otherwise
+# pay for (event loop thread, template compilation, style configs, Chromium
+# launch, CTA slides) runs on worker_process_init. Progress is published to a
+# per-process readiness file that the container healthcheck reads.
+# ---------------------------------------------------------------------------
+
+ReadinessState = Literal["starting", "ready", "degraded"]
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerReadiness:
+    state: ReadinessState
+    cold_start_seconds: float | None  # until every warm-up step finished
+    steps: dict[str, float] = field(default_factory=dict)  # seconds per step
+    failed: tuple[str, ...] = ()
+
+
+_lock = threading.Lock()
+_readiness = WorkerReadiness(state="starting", cold_start_seconds=None)
+
+
+def get_readiness() -> WorkerReadiness:
+    """Return this process's warm-up state."""
+    return _readiness
+
+
+def _ready_file(pid: int | None = None) -> Path:
+    return Path(get_settings().worker.ready_dir) / f"{pid or os.getpid()}.json"
+
+
+def _publish(readiness: WorkerReadiness) -> None:
+    global _readiness  # noqa: PLW0603
+    with _lock:
+        _readiness = readiness
+        path = _ready_file()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps(
+                    {
+                        "process_start": process_start_time(os.getpid()),
+                        "state": readiness.state,
+                        "cold_start_seconds": readiness.cold_start_seconds,
+                        "steps": readiness.steps,
+                        "failed": list(readiness.failed),
+                    }
+                )
+            )
+            tmp.replace(path)
+        except OSError:
+            logger.warning("Failed to write readiness file %s", path, exc_info=True)
+
+
+def clear_readiness() -> None:
+    """Remove this process's readiness file. Call on worker process shutdown."""
+    _ready_file().unlink(missing_ok=True)
+
+
+def prepare_worker(pool: str) -> None:
+    """Prepare the main worker process before any task process starts. Call on worker_init.
+
+    Readiness files left by an earlier run (the container restarted, or a
+    process was killed) are removed. For prefork the pipeline is imported
+    here, so every forked process inherits it instead of importing it again.
+    """
+    ready_dir = Path(get_settings().worker.ready_dir)
+    for path in (*ready_dir.glob("*.json"), *ready_dir.glob("*.tmp")):
+        path.unlink(missing_ok=True)
+    if pool != "threads":
+        _import_pipeline()
+
+
+def warm_templates() -> None:
+    """Compile renderer and prompt templates."""
+    from src.ai import template_loader
+    from src.renderer import html_builder
+
+    html_builder.warm_templates()
+    template_loader.warm_templates()
+
+
+def preload_styles() -> None:
+    """Load every style config and pre-render its template context."""
+    from src.config.constants import AVAILABLE_STYLES
+    from src.renderer.html_builder import warm_style
+    from src.renderer.styles import load_style_config
+
+    for slug in AVAILABLE_STYLES:
+        warm_style(load_style_config(slug))
+
+
+def _import_pipeline() -> None:
+    # Heavy imports (AI SDKs, SQLAlchemy models) the task would otherwise do lazily
+    import src.services.carousel_service  # noqa: F401
+
+
+class _WarmStart:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.steps: dict[str, float] = {}
+        self.failed: list[str] = []
+
+    def run(self, name: str, fn: Callable[[], object]) -> None:
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception:
+            logger.warning("Warm start step %r failed", name, exc_info=True)
+            self.failed.append(name)
+        self.steps[name] = time.perf_counter() - start
+
+    async def run_async(self, name: str, make: Callable[[], Awaitable[object]]) -> None:
+        start = time.perf_counter()
+        try:
+            await make()
+        except Exception:
+            logger.warning("Warm start step %r failed", name, exc_info=True)
+            self.failed.append(name)
+        self.steps[name] = time.perf_counter() - start
+
+    async def finish_async(self) -> None:
+        from src.renderer.browser import warm_up
+        from src.renderer.cta import get_cta_cache
+
+        await asyncio.gather(
+            self.run_async("browser", warm_up),
+            self.run_async("cta", get_cta_cache().preload),
+        )
+        elapsed = time.perf_counter() - self.started
+        state: ReadinessState = "degraded" if self.failed else "ready"
+        _publish(
+            WorkerReadiness(
+                state=state,
+                cold_start_seconds=elapsed,
+                steps=dict(self.steps),
+                failed=tuple(self.failed),
+            )
+        )
+        steps = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.steps.items())
+        logger.info("Worker process %s in %.2f s (%s)", state, elapsed, steps)
+
+
+def warm_start() -> None:
+    """Warm a worker process before its first task. Call on worker_process_init.
+
+    Synchronous steps run inline; the browser launch and CTA preload are
+    scheduled on the shared loop without waiting, because Celery bounds how
+    long process init may block. Readiness flips once both have finished.
+    Periodic stats logging starts on the same loop.
+    """
+    from src.storage.s3 import get_s3_client
+    from src.worker.loop import get_worker_loop
+    from src.worker.metrics import log_stats
+
+    _publish(WorkerReadiness(state="starting", cold_start_seconds=None))
+    warm = _WarmStart()
+    warm.run("event_loop", get_worker_loop)
+    warm.run("templates", warm_templates)
+    warm.run("styles", preload_styles)
+    warm.run("imports", _import_pipeline)
+    warm.run("s3_client", get_s3_client)
+    asyncio.run_coroutine_threadsafe(warm.finish_async(), get_worker_loop())
+    interval = get_settings().worker.stats_log_interval
+    if interval > 0:
+        asyncio.run_coroutine_threadsafe(log_stats(interval), get_worker_loop())
@@ -8,6 +8,7 @@ from sqlalchemy import update
 
 from src.config.constants import S3_CAROUSEL_PREFIX, S3_CLEANUP_DAYS
 from src.db.session import get_session_factory
+from src.models.carousel import CarouselGeneration
 from src.models.slide import Slide
 from src.storage.s3 import S3Client
 from src.worker.celery_app import celery_app
@@ -16,13 +17,21 @@ logger = logging.getLogger(__name__)
 
 
 async def _null_out_s3_keys(s3_keys: list[str]) -> None:
-    """Null out rendered_s3_key for deleted S3 files in the database."""
+    """Null out S3 keys of deleted files (rendered slides, hook images) in the database."""
     if not s3_keys:
         return
     factory = get_session_factory()
     async with factory() as session:
         stmt = update(Slide).where(Slide.rendered_s3_key.in_(s3_keys)).values(rendered_s3_key=None)
         await session.execute(stmt)
+        stmt = update(Slide).where(Slide.image_s3_key.in_(s3_keys)).values(image_s3_key=None)
+        await session.execute(stmt)
+        stmt = (
+            update(CarouselGeneration)
+            .where(CarouselGeneration.hook_image_s3_key.in_(s3_keys))
+            .values(hook_image_s3_key=None)
+        )
+        await session.execute(stmt)
         await session.commit()
 
 
@@ -40,7 +49,7 @@ def cleanup_old_files() -> dict[str, int]:
 
     keys = s3.list_objects(prefix=S3_CAROUSEL_PREFIX)
     for key in keys:
-        # Keys are formatted as: carousels/{user_id}/{carousel_id}/{timestamp}_slide_{n}.png
+        # Keys are formatted as: carousels/{user_id}/{carousel_id}/{timestamp}_{name}.{ext}
         try:
             parts = key.split("/")
             if len(parts) < 4:
@@ -2,35 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import threading
 
 from src.worker.celery_app import celery_app
+from src.worker.loop import get_worker_loop
 
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Persistent event loop shared across all tasks in this worker process.
-# Celery runs synchronous tasks, so we maintain a single background thread
-# with its own event loop instead of calling asyncio.run() per task (which
-# creates/destroys a loop every time and breaks asyncpg connection pooling).
-# ---------------------------------------------------------------------------
-_loop: asyncio.AbstractEventLoop | None = None
-_loop_lock = threading.Lock()
-
-
-def _get_event_loop() -> asyncio.AbstractEventLoop:
-    global _loop  # noqa: PLW0603
-    if _loop is not None and _loop.is_running():
-        return _loop
-    with _loop_lock:
-        if _loop is not None and _loop.is_running():
-            return _loop
-        loop = asyncio.new_event_loop()
-        thread = threading.Thread(target=loop.run_forever, daemon=True)
-        thread.start()
-        _loop = loop
-        return _loop
-
 
 async def _generate_carousel(
     user_id: int,
@@ -39,8 +16,13 @@ async def _generate_carousel(
     style_slug: str,
     status_message_id: int,
     celery_task_id: str,
+    final_attempt: bool = True,
 ) -> None:
-    """Async pipeline: AI copy -> AI image -> render -> S3 -> send to Telegram."""
+    """Async pipeline: AI copy -> AI image -> render -> S3 -> send to Telegram.
+
+    A retry resumes the generation the failed attempt left behind; only the
+    ``final_attempt`` marks it FAILED and refunds the credits.
+    """
     from sqlalchemy import select
 
     from src.db.session import get_session_factory
@@ -74,6 +56,7 @@ async def _generate_carousel(
         style_slug=style_slug,
         status_message_id=status_message_id,
         celery_task_id=celery_task_id,
+        final_attempt=final_attempt,
     )
 
 
@@ -94,7 +77,7 @@ def generate_carousel_task(  # type: ignore[no-untyped-def]
     """Sync Celery task wrapping the async pipeline."""
     logger.info("Starting carousel generation for user %d", user_id)
     try:
-        loop = _get_event_loop()
+        loop = get_worker_loop()
         future = asyncio.run_coroutine_threadsafe(
             _generate_carousel(
                 user_id=user_id,
@@ -103,6 +86,7 @@ def generate_carousel_task(  # type: ignore[no-untyped-def]
                 style_slug=style_slug,
                 status_message_id=status_message_id,
                 celery_task_id=self.request.id,
+                final_attempt=self.request.retries >= self.max_retries,
             ),
             loop,
         )
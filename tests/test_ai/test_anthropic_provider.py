@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from anthropic.types import Usage
+
+from src.ai.anthropic_provider import AnthropicCopywriter, _system_prompt
+from src.ai.base import TokenUsage
+
+
+def _make_copywriter(slides: list[dict[str, object]]) -> AnthropicCopywriter:
+    response = MagicMock()
+    response.content = [MagicMock(text=json.dumps(slides))]
+    response.usage = Usage(
+        input_tokens=200,
+        output_tokens=800,
+        cache_read_input_tokens=1400,
+        cache_creation_input_tokens=0,
+    )
+    copywriter = AnthropicCopywriter.__new__(AnthropicCopywriter)
+    copywriter.client = MagicMock()
+    copywriter.client.messages.create = AsyncMock(return_value=response)
+    copywriter.model = "test"
+    copywriter.max_tokens = 100
+    return copywriter
+
+
+class TestPromptCaching:
+    async def test_system_prompt_marked_for_caching(self) -> None:
+        copywriter = _make_copywriter([{"position": 0, "heading": "Hook"}])
+        await copywriter.generate_slides("input", "tech", 3)
+
+        system = copywriter.client.messages.create.call_args.kwargs["system"]
+        assert system == [
+            {
+                "type": "text",
+                "text": _system_prompt(),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    def test_system_prompt_rendered_once(self) -> None:
+        assert _system_prompt() is _system_prompt()
+
+    async def test_usage_accumulates_across_calls(self) -> None:
+        copywriter = _make_copywriter([{"position": 0, "heading": "Hook"}])
+        usage = TokenUsage()
+
+        await copywriter.generate_hook("input", "tech", 3, usage=usage)
+        await copywriter.generate_slides("input", "tech", 3, usage=usage)
+
+        assert usage == TokenUsage(
+            input_tokens=400,
+            output_tokens=1600,
+            cache_read_tokens=2800,
+            cache_write_tokens=0,
+        )
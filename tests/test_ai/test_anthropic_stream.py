@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from contextlib import aclosing, asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from anthropic.types import Usage
+
+from src.ai.anthropic_provider import AnthropicCopywriter, _SlideArrayParser
+from src.ai.base import TokenUsage
+from src.schemas.slide import ContentTemplate, SlideType
+
+_SLIDES = [
+    {"position": 0, "heading": "Hook {with} braces", "content_template": "listing"},
+    {
+        "position": 1,
+        "heading": 'Say "hi"',
+        "content_template": "listing",
+        "listing_items": ["a", "b]"],
+    },
+    {"position": 2, "heading": "Middle", "body_text": "text"},
+    {"position": 3, "heading": "Follow"},
+]
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _make_copywriter(chunks: list[str]) -> tuple[AnthropicCopywriter, dict[str, int]]:
+    """Copywriter streaming the given chunks, plus a counter of chunks consumed."""
+    counter = {"n": 0}
+
+    async def text_stream() -> AsyncIterator[str]:
+        for chunk in chunks:
+            counter["n"] += 1
+            yield chunk
+
+    @asynccontextmanager
+    async def stream(**kwargs: Any) -> AsyncIterator[Any]:
+        s = MagicMock()
+        s.text_stream = text_stream()
+        s.get_final_message = AsyncMock(
+            return_value=MagicMock(
+                usage=Usage(
+                    input_tokens=10,
+                    output_tokens=20,
+                    cache_read_input_tokens=1500,
+                    cache_creation_input_tokens=0,
+                )
+            )
+        )
+        # What the SDK has accumulated before message_delta reports the final output count
+        s.current_message_snapshot = MagicMock(
+            usage=Usage(
+                input_tokens=10,
+                output_tokens=1,
+                cache_read_input_tokens=1500,
+                cache_creation_input_tokens=0,
+            )
+        )
+        yield s
+
+    copywriter = AnthropicCopywriter.__new__(AnthropicCopywriter)
+    copywriter.client = MagicMock()
+    copywriter.client.messages.stream = stream
+    copywriter.model = "test"
+    copywriter.max_tokens = 100
+    return copywriter, counter
+
+
+class TestSlideArrayParser:
+    def test_extracts_objects_across_chunks(self) -> None:
+        text = "```json\n" + json.dumps(_SLIDES) + "\n```"
+        parser = _SlideArrayParser()
+        objects: list[dict[str, object]] = []
+        for chunk in _chunks(text, 7):
+            objects.extend(parser.feed(chunk))
+
+        assert objects == _SLIDES
+        assert parser.finished
+        assert not parser.in_object
+
+    def test_reports_open_object(self) -> None:
+        parser = _SlideArrayParser()
+        assert parser.feed('[{"position": 0, "heading": "a"}, {"posi') == [
+            {"position": 0, "heading": "a"}
+        ]
+        assert parser.in_object
+
+    def test_invalid_object_raises(self) -> None:
+        parser = _SlideArrayParser()
+        with pytest.raises(ValueError, match="invalid JSON"):
+            parser.feed('[{"position": 0, heading}]')
+
+
+class TestStreamSlides:
+    async def test_matches_batch_rules_and_yields_early(self) -> None:
+        text = json.dumps(_SLIDES)
+        chunks = _chunks(text, 5)
+        copywriter, consumed = _make_copywriter(chunks)
+
+        slides = []
+        consumed_at_yield = []
+        usage = TokenUsage()
+        async for slide in copywriter.stream_slides("input", "tech", 4, usage=usage):
+            slides.append(slide)
+            consumed_at_yield.append(consumed["n"])
+
+        assert [s.slide_type for s in slides] == [
+            SlideType.HOOK,
+            SlideType.CONTENT,
+            SlideType.CONTENT,
+            SlideType.CTA,
+        ]
+        assert [s.slide_number for s in slides] == [None, 1, 2, None]
+        # Hook is forced to the text template, listing content slide keeps its data
+        assert slides[0].content_template == ContentTemplate.TEXT
+        assert slides[1].listing_data is not None
+        # The hook slide is yielded long before the stream finishes
+        assert consumed_at_yield[0] < len(chunks)
+        assert usage.cache_read_tokens == 1500
+        assert usage.output_tokens == 20
+
+    async def test_empty_array_raises(self) -> None:
+        copywriter, _ = _make_copywriter(["[", "]"])
+        with pytest.raises(ValueError, match="no slides"):
+            async for _ in copywriter.stream_slides("input", "tech", 3):
+                pass
+
+    async def test_records_usage_when_closed_early(self) -> None:
+        copywriter, _ = _make_copywriter(_chunks(json.dumps(_SLIDES), 5))
+        usage = TokenUsage()
+
+        stream = copywriter.stream_slides("input", "tech", 4, usage=usage)
+        async with aclosing(stream):
+            async for _ in stream:
+                break
+
+        assert usage.input_tokens == 10
+        assert usage.cache_read_tokens == 1500
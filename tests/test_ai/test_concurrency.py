@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.ai.base import ImageProviderOverloadedError
+from src.ai.concurrency import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter:
+    async def test_additive_increase_on_stable_latency(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=4)
+
+        for _ in range(4):
+            async with limiter.slot() as outcome:
+                outcome.report(b"image")
+
+        # +1/limit per success: two successes per step at limit 2
+        assert limiter.limit == 3
+        assert limiter.stats().increases == 4
+
+    async def test_never_exceeds_max_limit(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=2)
+
+        for _ in range(10):
+            async with limiter.slot() as outcome:
+                outcome.report(b"image")
+
+        assert limiter.limit == 2
+        assert limiter.stats().increases == 0
+
+    async def test_multiplicative_decrease_on_overload(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=8, max_limit=8)
+
+        with pytest.raises(ImageProviderOverloadedError):
+            async with limiter.slot():
+                raise ImageProviderOverloadedError("429")
+
+        assert limiter.limit == 4
+        assert limiter.stats().decreases == 1
+
+    async def test_burst_of_overloads_cuts_once_per_latency_window(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=8, max_limit=8)
+        limiter._latency = 60.0
+
+        for _ in range(3):
+            with pytest.raises(ImageProviderOverloadedError):
+                async with limiter.slot():
+                    raise ImageProviderOverloadedError("429")
+
+        assert limiter.limit == 4
+        assert limiter.stats().overloads == 3
+
+    async def test_does_not_drop_below_min_limit(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=1, max_limit=4)
+
+        with pytest.raises(ImageProviderOverloadedError):
+            async with limiter.slot():
+                raise ImageProviderOverloadedError("503")
+
+        assert limiter.limit == 1
+
+    async def test_slow_call_does_not_raise_limit(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=4)
+        limiter._latency = 1.0
+
+        with patch("src.ai.concurrency.time.monotonic", side_effect=[0.0, 5.0]):
+            async with limiter.slot() as outcome:
+                outcome.report(b"image")
+
+        assert limiter.stats().increases == 0
+        assert limiter.stats().latency_seconds == pytest.approx(1.8)
+
+    async def test_none_result_leaves_limit_unchanged(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=4)
+
+        for _ in range(4):
+            async with limiter.slot() as outcome:
+                outcome.report(None)
+
+        assert limiter.limit == 2
+        assert limiter.stats().increases == 0
+        assert limiter.stats().latency_seconds is None
+
+    async def test_other_errors_leave_limit_unchanged(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=4)
+
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("bad image")
+
+        assert limiter.limit == 2
+        assert limiter.stats().increases == 0
+        assert limiter.stats().in_flight == 0
+
+    async def test_waits_for_a_free_slot(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=1, max_limit=1)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def first() -> None:
+            async with limiter.slot():
+                order.append("first")
+                await release.wait()
+
+        async def second() -> None:
+            async with limiter.slot():
+                order.append("second")
+
+        tasks = [asyncio.create_task(first()), asyncio.create_task(second())]
+        await asyncio.sleep(0)
+        assert order == ["first"]
+        assert limiter.stats().in_flight == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert order == ["first", "second"]
+
+    async def test_try_slot_does_not_wait(self) -> None:
+        limiter = AdaptiveLimiter("test", initial=1, max_limit=1)
+
+        async with limiter.slot(), limiter.try_slot() as outcome:
+            assert outcome is None
+            assert limiter.stats().in_flight == 1
+
+        async with limiter.try_slot() as outcome:
+            assert outcome is not None
+            assert limiter.stats().in_flight == 1
+        assert limiter.stats().in_flight == 0
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import io
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
+import pytest
+from google.genai import errors
 from PIL import Image
 
+from src.ai.base import ImageProviderOverloadedError
+from src.ai.gemini_provider import GeminiImageProvider
 from src.ai.template_loader import render_prompt
 from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
 from src.renderer.styles import StyleConfig
@@ -99,8 +105,6 @@ class TestImageValidation:
     """Test the _validate_image static logic (extracted for unit testing)."""
 
     def test_valid_png_passes_through(self) -> None:
-        from src.ai.gemini_provider import GeminiImageProvider
-
         provider = GeminiImageProvider.__new__(GeminiImageProvider)
         img = Image.new("RGB", (SLIDE_WIDTH, SLIDE_HEIGHT), (0, 0, 0))
         buf = io.BytesIO()
@@ -109,40 +113,59 @@ class TestImageValidation:
 
         result = provider._validate_image(data, 0)
         assert result is not None
-        validated = Image.open(io.BytesIO(result))
-        assert validated.size == (SLIDE_WIDTH, SLIDE_HEIGHT)
-
-    def test_wrong_dimensions_get_resized(self) -> None:
-        from src.ai.gemini_provider import GeminiImageProvider
+        assert result.data is data
+        assert (result.format, result.width, result.height) == ("PNG", SLIDE_WIDTH, SLIDE_HEIGHT)
 
+    def test_wrong_dimensions_are_reported_not_resized(self) -> None:
         provider = GeminiImageProvider.__new__(GeminiImageProvider)
         img = Image.new("RGB", (800, 600), (255, 0, 0))
         buf = io.BytesIO()
-        img.save(buf, format="PNG")
+        img.save(buf, format="JPEG")
         data = buf.getvalue()
 
         result = provider._validate_image(data, 0)
         assert result is not None
-        validated = Image.open(io.BytesIO(result))
-        assert validated.size == (SLIDE_WIDTH, SLIDE_HEIGHT)
-
-    def test_rgba_converted_to_rgb(self) -> None:
-        from src.ai.gemini_provider import GeminiImageProvider
+        assert result.data is data
+        assert (result.format, result.width, result.height) == ("JPEG", 800, 600)
 
+    def test_unsupported_format_returns_none(self) -> None:
         provider = GeminiImageProvider.__new__(GeminiImageProvider)
-        img = Image.new("RGBA", (SLIDE_WIDTH, SLIDE_HEIGHT), (0, 0, 0, 128))
         buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        data = buf.getvalue()
-
-        result = provider._validate_image(data, 0)
-        assert result is not None
-        validated = Image.open(io.BytesIO(result))
-        assert validated.mode == "RGB"
+        Image.new("RGB", (SLIDE_WIDTH, SLIDE_HEIGHT)).save(buf, format="BMP")
+        assert provider._validate_image(buf.getvalue(), 0) is None
 
     def test_invalid_data_returns_none(self) -> None:
-        from src.ai.gemini_provider import GeminiImageProvider
-
         provider = GeminiImageProvider.__new__(GeminiImageProvider)
         result = provider._validate_image(b"not an image", 0)
         assert result is None
+
+
+class TestOverloadClassification:
+    @staticmethod
+    def _provider(error: Exception) -> GeminiImageProvider:
+        provider = GeminiImageProvider.__new__(GeminiImageProvider)
+        provider.model = "gemini-test"
+        provider.client = MagicMock()
+        provider.client.aio.models.generate_content = AsyncMock(side_effect=error)
+        return provider
+
+    @pytest.mark.parametrize("code", [429, 503])
+    async def test_overload_status_raises(self, code: int) -> None:
+        provider = self._provider(errors.APIError(code, {"error": {"message": "busy"}}))
+        slide = SlideContent(position=0, heading="H", slide_type=SlideType.HOOK)
+
+        with pytest.raises(ImageProviderOverloadedError):
+            await provider.generate_slide_image(slide, _make_style())
+
+    async def test_timeout_raises(self) -> None:
+        provider = self._provider(httpx.ReadTimeout("slow"))
+        slide = SlideContent(position=0, heading="H", slide_type=SlideType.HOOK)
+
+        with pytest.raises(ImageProviderOverloadedError):
+            await provider.generate_slide_image(slide, _make_style())
+
+    async def test_bad_request_returns_none(self) -> None:
+        provider = self._provider(errors.APIError(400, {"error": {"message": "bad"}}))
+        slide = SlideContent(position=0, heading="H", slide_type=SlideType.HOOK)
+
+        assert await provider.generate_slide_image(slide, _make_style()) is None
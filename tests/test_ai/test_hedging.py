@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.ai.concurrency import AdaptiveLimiter, SlotOutcome
+from src.ai.hedging import HedgePolicy
+
+
+def _warm(policy: HedgePolicy, latency: float = 0.01, requests: int = 20) -> None:
+    for _ in range(20):
+        policy.record(latency)
+    policy._requests = requests
+
+
+class TestHedgePolicy:
+    def test_no_delay_until_enough_samples(self) -> None:
+        policy = HedgePolicy(budget=0.1)
+        for _ in range(19):
+            policy.record(1.0)
+        assert policy.delay() is None
+
+    def test_delay_is_p90(self) -> None:
+        policy = HedgePolicy(budget=0.1)
+        for i in range(1, 101):
+            policy.record(float(i))
+        assert policy.delay() == 90.0
+
+    async def test_fast_call_is_not_hedged(self) -> None:
+        policy = HedgePolicy(budget=1.0)
+        _warm(policy)
+        calls = 0
+
+        async def call() -> bytes:
+            nonlocal calls
+            calls += 1
+            return b"image"
+
+        assert await policy.run(call) == b"image"
+        assert calls == 1
+        assert policy.stats().hedged == 0
+
+    async def test_failed_calls_do_not_move_the_delay(self) -> None:
+        policy = HedgePolicy(budget=0.0)
+        _warm(policy)
+
+        async def call() -> bytes | None:
+            await asyncio.sleep(0.02)
+            return None
+
+        for _ in range(20):
+            assert await policy.run(call) is None
+        assert policy.delay() == 0.01
+
+    async def test_slow_call_is_hedged_and_loser_cancelled(self) -> None:
+        policy = HedgePolicy(budget=1.0)
+        _warm(policy)
+        started: list[asyncio.Event] = []
+        cancelled: list[int] = []
+
+        async def call() -> bytes:
+            index = len(started)
+            started.append(asyncio.Event())
+            try:
+                # The first call hangs; the hedge answers at once
+                if index == 0:
+                    await asyncio.sleep(10)
+                return f"call-{index}".encode()
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+
+        assert await policy.run(call) == b"call-1"
+        await asyncio.sleep(0)
+        assert cancelled == [0]
+        stats = policy.stats()
+        assert (stats.requests, stats.hedged, stats.hedge_wins) == (21, 1, 1)
+
+    async def test_budget_bounds_hedges(self) -> None:
+        policy = HedgePolicy(budget=0.1)
+        _warm(policy, requests=0)
+        calls = 0
+
+        async def call() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return b"image"
+
+        assert await policy.run(call) == b"image"
+        assert calls == 1
+        assert policy.stats().hedged == 0
+
+    async def test_failed_primary_falls_back_to_hedge(self) -> None:
+        policy = HedgePolicy(budget=1.0)
+        _warm(policy)
+        attempts = 0
+
+        async def call() -> bytes | None:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(0.05)
+                return None
+            await asyncio.sleep(0.1)
+            return b"hedge"
+
+        assert await policy.run(call) == b"hedge"
+
+    async def test_raises_primary_error_when_both_fail(self) -> None:
+        policy = HedgePolicy(budget=1.0)
+        _warm(policy)
+        attempts = 0
+
+        async def call() -> bytes | None:
+            nonlocal attempts
+            attempts += 1
+            index = attempts
+            await asyncio.sleep(0.05)
+            if index == 1:
+                raise RuntimeError("primary")
+            return None
+
+        with pytest.raises(RuntimeError, match="primary"):
+            await policy.run(call)
+
+    async def test_hedge_skipped_without_a_free_slot(self) -> None:
+        policy = HedgePolicy(budget=1.0)
+        _warm(policy)
+        calls = 0
+
+        @asynccontextmanager
+        async def no_slot() -> AsyncIterator[SlotOutcome | None]:
+            yield None
+
+        async def call() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return b"image"
+
+        assert await policy.run(call, no_slot) == b"image"
+        assert calls == 1
+        assert policy.stats().hedged == 0
+
+    async def test_hedge_stays_under_the_in_flight_cap(self) -> None:
+        policy = HedgePolicy(budget=1.0)
+        _warm(policy)
+        limiter = AdaptiveLimiter("test", initial=2, max_limit=2)
+        in_flight = 0
+        peak = 0
+
+        async def call() -> bytes:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.05)
+                return b"image"
+            finally:
+                in_flight -= 1
+
+        async def request() -> bytes | None:
+            async with limiter.slot():
+                return await policy.run(call, limiter.try_slot)
+
+        # Two slow calls fill the limit, so neither may hedge
+        assert await asyncio.gather(request(), request()) == [b"image", b"image"]
+        assert peak == 2
+        assert policy.stats().hedged == 0
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.ai.rate_limit import RateLimiter, RateLimitTimeoutError
+
+
+def _redis(bucket: AsyncMock | None = None, slot: AsyncMock | None = None) -> MagicMock:
+    redis = MagicMock()
+    redis.register_script.side_effect = [
+        bucket or AsyncMock(return_value=0),
+        slot or AsyncMock(return_value=1),
+    ]
+    redis.zrem = AsyncMock()
+    return redis
+
+
+class TestRateLimiter:
+    async def test_disabled_without_limits(self) -> None:
+        redis = MagicMock()
+        limiter = RateLimiter("gemini", redis)
+
+        async with limiter.acquire(100):
+            pass
+
+        assert not limiter.enabled
+        redis.register_script.assert_not_called()
+
+    async def test_takes_request_and_token_buckets_together(self) -> None:
+        bucket = AsyncMock(return_value=0)
+        limiter = RateLimiter("anthropic", _redis(bucket=bucket), rpm=60, tpm=6000)
+
+        async with limiter.acquire(500):
+            pass
+
+        keys = bucket.call_args.kwargs["keys"]
+        args = bucket.call_args.kwargs["args"]
+        assert keys == ["ratelimit:anthropic:rpm", "ratelimit:anthropic:tpm"]
+        assert args == [60, 0.001, 1, 6000, 0.1, 500, 0]
+        assert limiter.stats().acquired == 1
+
+    async def test_waits_for_bucket_refill(self) -> None:
+        bucket = AsyncMock(side_effect=[250, 0])
+        limiter = RateLimiter("gemini", _redis(bucket=bucket), rpm=10)
+
+        with patch("src.ai.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with limiter.acquire():
+                pass
+
+        assert bucket.await_count == 2
+        assert 0.25 <= sleep.call_args.args[0] <= 0.375
+
+    async def test_times_out_when_no_capacity(self) -> None:
+        bucket = AsyncMock(return_value=60_000)
+        limiter = RateLimiter("gemini", _redis(bucket=bucket), rpm=1, queue_timeout=0)
+
+        with pytest.raises(RateLimitTimeoutError):
+            async with limiter.acquire():
+                pass
+
+        assert limiter.stats().timeouts == 1
+        assert limiter.stats().acquired == 0
+        # Nothing was taken, so nothing is refunded
+        bucket.assert_awaited_once()
+
+    async def test_refunds_buckets_when_no_slot_frees_up(self) -> None:
+        bucket = AsyncMock(return_value=0)
+        redis = _redis(bucket=bucket, slot=AsyncMock(return_value=0))
+        limiter = RateLimiter(
+            "anthropic", redis, rpm=60, tpm=6000, max_in_flight=1, queue_timeout=0
+        )
+
+        with pytest.raises(RateLimitTimeoutError):
+            async with limiter.acquire(500):
+                pass
+
+        assert bucket.await_count == 2
+        keys = bucket.call_args.kwargs["keys"]
+        args = bucket.call_args.kwargs["args"]
+        assert keys == ["ratelimit:anthropic:rpm", "ratelimit:anthropic:tpm"]
+        assert args == [60, 0.001, -1, 6000, 0.1, -500, 1]
+        assert limiter.stats().timeouts == 1
+
+    async def test_slot_is_held_for_the_call_and_released(self) -> None:
+        slot = AsyncMock(side_effect=[0, 1])
+        redis = _redis(slot=slot)
+        limiter = RateLimiter("gemini", redis, max_in_flight=2)
+
+        with patch("src.ai.rate_limit.asyncio.sleep", new=AsyncMock()):
+            async with limiter.acquire():
+                assert limiter.stats().in_flight == 1
+                redis.zrem.assert_not_called()
+
+        lease_id = slot.call_args.kwargs["args"][1]
+        redis.zrem.assert_awaited_once_with("ratelimit:gemini:slots", lease_id)
+        assert limiter.stats().in_flight == 0
+
+    async def test_slot_released_when_call_fails(self) -> None:
+        redis = _redis()
+        limiter = RateLimiter("gemini", redis, max_in_flight=1)
+
+        with pytest.raises(RuntimeError):
+            async with limiter.acquire():
+                raise RuntimeError("provider down")
+
+        redis.zrem.assert_awaited_once()
+
+    async def test_fails_open_when_redis_is_down(self) -> None:
+        bucket = AsyncMock(side_effect=ConnectionError("down"))
+        limiter = RateLimiter("gemini", _redis(bucket=bucket), rpm=10)
+
+        async with limiter.acquire():
+            pass
+
+        assert limiter.stats().redis_errors == 1
+        assert limiter.stats().acquired == 1
+
+    async def test_settle_charges_the_estimate_difference(self) -> None:
+        bucket = AsyncMock(return_value=0)
+        limiter = RateLimiter("anthropic", _redis(bucket=bucket), tpm=6000)
+
+        async with limiter.acquire(1000) as lease:
+            await lease.settle(400)
+
+        key = bucket.call_args.kwargs["keys"]
+        args = bucket.call_args.kwargs["args"]
+        assert key == ["ratelimit:anthropic:tpm"]
+        assert args == [6000, 0.1, -600, 1]
+
+    async def test_reservation_is_capped_to_the_budget(self) -> None:
+        bucket = AsyncMock(return_value=0)
+        limiter = RateLimiter("anthropic", _redis(bucket=bucket), tpm=1000)
+
+        async with limiter.acquire(5000) as lease:
+            pass
+
+        assert bucket.call_args.kwargs["args"][2] == 1000
+        assert lease.estimated_tokens == 1000
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from src.ai.template_loader import render_prompt
+from src.ai.template_loader import _get_lookup, render_prompt, warm_templates
 from src.schemas.slide import SlideType, TextPosition
 
 
@@ -23,6 +26,17 @@ class TestRenderPrompt:
         assert "Number of slides: 5" in result
         assert "Hello world" in result
 
+    def test_copywriter_hook_substitution(self) -> None:
+        result = render_prompt(
+            "copywriter_hook.mako",
+            style_slug="nano_banana",
+            slide_count=5,
+            input_text="Hello world",
+        )
+        assert "hook" in result
+        assert "exactly one" in result
+        assert "Hello world" in result
+
     def test_missing_variable_raises(self) -> None:
         with pytest.raises(NameError):
             render_prompt("copywriter_user.mako", style_slug="x")
@@ -98,3 +112,17 @@ class TestSlideImageTemplate:
         for tp in TextPosition:
             result = self._render(text_position=tp.value)
             assert len(result) > 100
+
+
+class TestWarmTemplates:
+    def test_compiles_all_templates_into_module_directory(self, tmp_path: Path) -> None:
+        settings = MagicMock(template_cache_dir=str(tmp_path))
+        _get_lookup.cache_clear()
+        try:
+            with patch("src.ai.template_loader.get_settings", return_value=settings):
+                count = warm_templates()
+        finally:
+            _get_lookup.cache_clear()
+
+        modules = list((tmp_path / "prompts").rglob("*.mako.py"))
+        assert count == len(modules) > 0
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.renderer.assets import ASSET_ORIGIN, AssetStore
+from src.renderer.html_builder import build_hook_overlay_html
+from src.renderer.styles import StyleConfig
+from src.schemas.slide import SlideContent, SlideType, TextPosition
+
+
+def _route(url: str) -> MagicMock:
+    route = MagicMock()
+    route.request.url = url
+    route.fulfill = AsyncMock()
+    return route
+
+
+class TestAssetStore:
+    async def test_serves_published_asset_from_memory(self) -> None:
+        store = AssetStore()
+        with store.published(b"png-bytes", "image/png", ".png") as url:
+            assert url.startswith(ASSET_ORIGIN)
+            route = _route(url)
+            await store.handle_route(route)
+
+        kwargs = route.fulfill.call_args.kwargs
+        assert kwargs["status"] == 200
+        assert kwargs["body"] == b"png-bytes"
+        assert kwargs["content_type"] == "image/png"
+        assert kwargs["headers"]["Access-Control-Allow-Origin"] == "*"
+
+    async def test_released_asset_is_dropped(self) -> None:
+        store = AssetStore()
+        with store.published(b"png-bytes", "image/png", ".png") as url:
+            pass
+
+        route = _route(url)
+        await store.handle_route(route)
+
+        assert route.fulfill.call_args.kwargs["status"] == 404
+        assert store.stats().entries == 0
+        assert store.stats().missing == 1
+
+    def test_identical_content_shares_one_entry(self) -> None:
+        store = AssetStore()
+        first = store.put(b"data", "image/png", ".png")
+        second = store.put(b"data", "image/png", ".png")
+        assert first == second
+
+        store.release(first)
+        assert store.stats().entries == 1
+        store.release(second)
+        assert store.stats().entries == 0
+
+    def test_pinned_assets_survive_release(self) -> None:
+        store = AssetStore()
+        url = store.put(b"font", "font/woff2", ".woff2", pinned=True)
+        store.release(url)
+        assert store.stats().entries == 1
+
+
+class TestHookOverlayHtml:
+    def test_references_image_by_url(self) -> None:
+        slide = SlideContent(
+            position=0,
+            heading="Hook",
+            body_text="Body",
+            text_position=TextPosition.BOTTOM,
+            slide_type=SlideType.HOOK,
+        )
+        url = f"{ASSET_ORIGIN}/abc.png"
+        html = build_hook_overlay_html(slide, StyleConfig(slug="test", name="Test"), url)
+        assert url in html
+        assert "base64" not in html
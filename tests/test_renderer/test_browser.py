@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.renderer import browser as browser_module
+from src.renderer.assets import ASSET_ROUTE_PATTERN
+from src.renderer.browser import (
+    PagePool,
+    _BrowserHandle,
+    _load,
+    _on_page,
+    _process_tree_pss,
+    get_browser_stats,
+    get_render_stats,
+    shutdown,
+)
+
+
+def _make_page() -> MagicMock:
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.goto = AsyncMock()
+    page.close = AsyncMock()
+    page.route = AsyncMock()
+    return page
+
+
+def _make_browser() -> MagicMock:
+    browser = MagicMock()
+    browser.new_page = AsyncMock(side_effect=lambda **kwargs: _make_page())
+    browser.is_connected.return_value = True
+
+    async def close() -> None:
+        browser.is_connected.return_value = False
+
+    browser.close = AsyncMock(side_effect=close)
+    return browser
+
+
+class TestPagePool:
+    async def test_reuses_released_page(self) -> None:
+        browser = _make_browser()
+        pool = PagePool(browser, size=2, max_uses=10)
+
+        async with pool.page() as first:
+            pass
+        async with pool.page() as second:
+            pass
+
+        assert first is second
+        assert browser.new_page.call_count == 1
+        first.goto.assert_awaited_with("about:blank")
+        stats = pool.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.idle == 1
+        assert stats.in_use == 0
+        first.route.assert_awaited_once()
+        assert first.route.call_args.args[0] == ASSET_ROUTE_PATTERN
+
+    async def test_warm_fills_pool(self) -> None:
+        browser = _make_browser()
+        pool = PagePool(browser, size=3, max_uses=10)
+
+        await pool.warm()
+        async with pool.page():
+            pass
+
+        assert browser.new_page.call_count == 3
+        assert pool.stats().hits == 1
+        assert pool.stats().misses == 0
+
+    async def test_waits_when_exhausted(self) -> None:
+        pool = PagePool(_make_browser(), size=1, max_uses=10)
+        page = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert pool.stats().waiters == 1
+
+        await pool.release(page)
+        second = await waiter
+        assert second is page
+        assert pool.stats().waiters == 0
+        await pool.release(second)
+
+    async def test_recycles_after_max_uses(self) -> None:
+        browser = _make_browser()
+        pool = PagePool(browser, size=1, max_uses=2)
+
+        for _ in range(3):
+            async with pool.page():
+                pass
+
+        assert pool.stats().recycles == 1
+        assert browser.new_page.call_count == 2
+
+    async def test_discards_page_when_render_fails(self) -> None:
+        pool = PagePool(_make_browser(), size=1, max_uses=10)
+
+        with pytest.raises(RuntimeError):
+            async with pool.page() as page:
+                raise RuntimeError("boom")
+
+        page.close.assert_awaited_once()
+        stats = pool.stats()
+        assert stats.recycles == 1
+        assert stats.idle == 0
+        assert stats.in_use == 0
+
+
+def _renderer_settings(strategy: str) -> MagicMock:
+    settings = MagicMock()
+    settings.renderer.wait_strategy = strategy
+    settings.renderer.ready_timeout_ms = 5000
+    return settings
+
+
+class TestLoad:
+    async def test_ready_strategy_waits_for_sentinel(self) -> None:
+        page = _make_page()
+        page.set_content = AsyncMock()
+        page.wait_for_function = AsyncMock()
+
+        with patch("src.renderer.browser.get_settings", return_value=_renderer_settings("ready")):
+            await _load(page, "<html></html>")
+
+        page.set_content.assert_awaited_once_with("<html></html>", wait_until="domcontentloaded")
+        page.wait_for_function.assert_awaited_once()
+        assert "__slideReady" in page.wait_for_function.call_args.args[0]
+        assert page.wait_for_function.call_args.kwargs["timeout"] == 5000
+
+    async def test_networkidle_strategy_and_stats_per_strategy(self) -> None:
+        page = _make_page()
+        page.set_content = AsyncMock()
+        page.wait_for_function = AsyncMock()
+        before = get_render_stats().get("networkidle")
+
+        with patch(
+            "src.renderer.browser.get_settings", return_value=_renderer_settings("networkidle")
+        ):
+            await _load(page, "<html></html>")
+
+        page.set_content.assert_awaited_once_with("<html></html>", wait_until="networkidle")
+        page.wait_for_function.assert_not_awaited()
+        after = get_render_stats()["networkidle"]
+        assert after.renders == (before.renders if before else 0) + 1
+
+
+def _supervisor_settings(max_renders: int = 0) -> MagicMock:
+    settings = MagicMock()
+    settings.renderer.browser_max_renders = max_renders
+    settings.renderer.browser_max_rss_mb = 0
+    settings.renderer.page_pool_size = 1
+    settings.renderer.page_max_uses = 100
+    return settings
+
+
+@pytest.fixture
+def launches() -> Iterator[list[MagicMock]]:
+    """Fresh supervisor state; each launch creates a fake browser recorded here."""
+    browsers: list[MagicMock] = []
+
+    async def fake_launch() -> _BrowserHandle:
+        browser = _make_browser()
+        browsers.append(browser)
+        return _BrowserHandle(browser, PagePool(browser, size=1, max_uses=100))
+
+    with (
+        patch.object(browser_module, "_current", None),
+        patch.object(browser_module, "_retiring", set()),
+        patch.object(browser_module, "_background", set()),
+        patch.object(browser_module, "_restarts", {}),
+        patch.object(browser_module, "_total_renders", 0),
+        patch.object(browser_module, "_launch", side_effect=fake_launch),
+    ):
+        yield browsers
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestBrowserSupervisor:
+    async def test_recycles_after_max_renders(self, launches: list[MagicMock]) -> None:
+        with patch("src.renderer.browser.get_settings", return_value=_supervisor_settings(2)):
+            for _ in range(3):
+                await _on_page(1080, 1350, AsyncMock(return_value=b"png"))
+            await _settle()
+
+        assert len(launches) == 2
+        launches[0].close.assert_awaited_once()
+        stats = get_browser_stats()
+        assert stats.restarts_by_reason == {"renders": 1}
+        assert stats.total_renders == 3
+        assert stats.renders == 1
+        assert stats.retiring == 0
+
+    async def test_in_flight_render_finishes_on_retired_browser(
+        self, launches: list[MagicMock]
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow(page: MagicMock) -> bytes:
+            await release.wait()
+            return b"slow"
+
+        with patch("src.renderer.browser.get_settings", return_value=_supervisor_settings(1)):
+            slow_render = asyncio.create_task(_on_page(1080, 1350, slow))
+            await _settle()
+            old = browser_module._current
+            assert old is not None
+            browser_module._retire(old, "rss")
+            await _settle()
+            launches[0].close.assert_not_awaited()
+
+            release.set()
+            assert await slow_render == b"slow"
+            await _settle()
+
+        launches[0].close.assert_awaited_once()
+        assert len(launches) == 2
+
+    async def test_retries_once_after_crash(self, launches: list[MagicMock]) -> None:
+        calls = 0
+
+        async def crashy(page: MagicMock) -> bytes:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                launches[0].is_connected.return_value = False
+                raise RuntimeError("Target closed")
+            return b"png"
+
+        with patch("src.renderer.browser.get_settings", return_value=_supervisor_settings()):
+            assert await _on_page(1080, 1350, crashy) == b"png"
+            await _settle()
+
+        assert len(launches) == 2
+        assert get_browser_stats().restarts_by_reason == {"crash": 1}
+
+    async def test_shutdown_stops_pending_replacement_launch(
+        self, launches: list[MagicMock]
+    ) -> None:
+        with patch("src.renderer.browser.get_settings", return_value=_supervisor_settings()):
+            await _on_page(1080, 1350, AsyncMock(return_value=b"png"))
+            old = browser_module._current
+            assert old is not None
+            # Schedules closing the old browser and launching its replacement
+            browser_module._retire(old, "rss")
+            await shutdown()
+            await _settle()
+
+        assert len(launches) == 1
+        launches[0].close.assert_awaited_once()
+        assert browser_module._current is None
+        assert not browser_module._background
+
+    async def test_recycle_log_reports_memory_and_page_pool(
+        self, launches: list[MagicMock], caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with patch("src.renderer.browser.get_settings", return_value=_supervisor_settings()):
+            await _on_page(1080, 1350, AsyncMock(return_value=b"png"))
+            old = browser_module._current
+            assert old is not None
+            with caplog.at_level("INFO", logger="src.renderer.browser"):
+                browser_module._retire(old, "rss", 600 * 1024 * 1024)
+            await shutdown()
+
+        [message] = [r.getMessage() for r in caplog.records if "Recycling" in r.getMessage()]
+        assert "(rss) after 1 renders" in message
+        assert "600 MB PSS" in message
+        assert "page pool: 0 hits, 1 misses, 0 recycles" in message
+
+
+@pytest.mark.skipif(not Path("/proc/self/smaps_rollup").exists(), reason="needs Linux /proc")
+class TestProcessTreeMemory:
+    def test_counts_children_by_pss(self) -> None:
+        child = subprocess.Popen(["sleep", "10"])
+        try:
+            total = _process_tree_pss()
+            rss = int(Path(f"/proc/{child.pid}/statm").read_text().split()[1])
+            rss *= os.sysconf("SC_PAGE_SIZE")
+        finally:
+            child.kill()
+            child.wait()
+
+        assert total is not None
+        # Shared pages (libc, the binary) are split with other processes
+        assert 0 < total < rss
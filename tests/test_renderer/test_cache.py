@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from src.renderer.cache import RenderCache, render_cache_key
+from src.renderer.engine import SlideRenderer
+from src.renderer.styles import StyleConfig
+from src.schemas.slide import SlideContent, SlideType
+
+
+class TestRenderCacheKey:
+    def test_stable_for_same_input(self) -> None:
+        key = render_cache_key("<p>a</p>", 1080, 1350, "png")
+        assert render_cache_key("<p>a</p>", 1080, 1350, "png") == key
+
+    def test_differs_by_html_and_viewport(self) -> None:
+        base = render_cache_key("<p>a</p>", 1080, 1350, "png")
+        assert render_cache_key("<p>b</p>", 1080, 1350, "png") != base
+        assert render_cache_key("<p>a</p>", 1080, 1080, "png") != base
+
+    def test_differs_by_output_format(self) -> None:
+        base = render_cache_key("<p>a</p>", 1080, 1350, "png")
+        assert render_cache_key("<p>a</p>", 1080, 1350, "jpeg:90:6") != base
+
+
+class TestRenderCache:
+    async def test_hit_and_miss_counters(self) -> None:
+        cache = RenderCache(max_bytes=1024)
+        assert await cache.get("k") is None
+        await cache.set("k", b"png")
+        assert await cache.get("k") == b"png"
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.bytes == 3
+
+    async def test_evicts_least_recently_used_over_budget(self) -> None:
+        cache = RenderCache(max_bytes=10)
+        await cache.set("a", b"12345")
+        await cache.set("b", b"12345")
+        await cache.get("a")  # "b" becomes least recently used
+        await cache.set("c", b"12345")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == b"12345"
+        assert cache.stats().evictions == 1
+
+    async def test_skips_entries_larger_than_budget(self) -> None:
+        cache = RenderCache(max_bytes=4)
+        await cache.set("big", b"12345")
+        assert cache.stats().entries == 0
+
+    async def test_remote_tier_hit_populates_local(self) -> None:
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=b"remote")
+        cache = RenderCache(max_bytes=1024, redis=redis)
+
+        assert await cache.get("k") == b"remote"
+        assert await cache.get("k") == b"remote"
+
+        redis.get.assert_awaited_once_with("render:k")
+        stats = cache.stats()
+        assert stats.remote_hits == 1
+        assert stats.hits == 1
+
+    async def test_remote_errors_are_treated_as_miss(self) -> None:
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = RenderCache(max_bytes=1024, redis=redis)
+
+        assert await cache.get("k") is None
+        await cache.set("k", b"png")
+        assert await cache.get("k") == b"png"
+
+
+class TestRendererUsesCache:
+    async def test_identical_slide_skips_browser(self) -> None:
+        renderer = SlideRenderer(StyleConfig(slug="test", name="Test Style"))
+        slide = SlideContent(position=1, heading="Cached", slide_type=SlideType.CONTENT)
+        cache = RenderCache(max_bytes=1024)
+
+        with (
+            patch("src.renderer.engine.get_render_cache", return_value=cache),
+            patch(
+                "src.renderer.engine.render_html_to_image",
+                new=AsyncMock(return_value=b"png"),
+            ) as render_mock,
+        ):
+            first = await renderer.render(slide=slide)
+            second = await renderer.render(slide=slide)
+
+        assert first == second == b"png"
+        assert render_mock.await_count == 1
+        assert cache.stats().hits == 1
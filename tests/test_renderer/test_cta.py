@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from PIL import Image
+
+from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
+from src.renderer.cta import CtaCache, prepare_cta_image
+from src.renderer.engine import SlideRenderer
+from src.renderer.styles import StyleConfig
+from src.schemas.slide import SlideContent, SlideType
+
+
+def _asset(size: tuple[int, int] = (540, 675)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGBA", size, (10, 20, 30, 255)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestPrepareCtaImage:
+    def test_resizes_asset_to_slide(self) -> None:
+        with patch("src.renderer.cta.load_cta_image", return_value=_asset()):
+            result = prepare_cta_image("tech")
+        assert result is not None
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (SLIDE_WIDTH, SLIDE_HEIGHT)
+        assert img.mode == "RGB"
+
+    def test_missing_asset_returns_none(self) -> None:
+        with patch("src.renderer.cta.load_cta_image", return_value=None):
+            assert prepare_cta_image("tech") is None
+
+
+class TestCtaCache:
+    async def test_prepares_each_style_once(self) -> None:
+        cache = CtaCache()
+        with patch("src.renderer.cta.load_cta_image", return_value=_asset()) as load:
+            first = await cache.get("tech")
+            second = await cache.get("tech")
+
+        assert first is not None
+        assert first is second
+        load.assert_called_once_with("tech")
+        assert cache.stats().hits == 1
+
+    async def test_memoizes_missing_assets(self) -> None:
+        cache = CtaCache()
+        with patch("src.renderer.cta.load_cta_image", return_value=None) as load:
+            assert await cache.get("tech") is None
+            assert await cache.get("tech") is None
+        load.assert_called_once()
+
+    async def test_preload_prepares_all_styles(self) -> None:
+        cache = CtaCache()
+        with patch("src.renderer.cta.load_cta_image", return_value=_asset()) as load:
+            await cache.preload(["tech", "minimal"])
+        assert load.call_count == 2
+        assert cache.stats().entries == 2
+
+    async def test_version_bump_reloads(self) -> None:
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=[None, None, b"1"])
+        cache = CtaCache(redis=redis, version_check_interval=0)
+        with patch("src.renderer.cta.load_cta_image", return_value=_asset()) as load:
+            await cache.get("tech")
+            await cache.get("tech")
+            await cache.get("tech")
+
+        assert load.call_count == 2
+        stats = cache.stats()
+        assert stats.version == 1
+        assert stats.refreshes == 1
+
+    async def test_version_checks_are_throttled(self) -> None:
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=None)
+        cache = CtaCache(redis=redis)
+        with patch("src.renderer.cta.load_cta_image", return_value=_asset()):
+            for _ in range(5):
+                await cache.get("tech")
+
+        redis.get.assert_awaited_once()
+
+    async def test_load_during_refresh_is_not_cached(self) -> None:
+        cache = CtaCache()
+
+        def load(style_slug: str) -> bytes:
+            cache._version += 1  # refresh lands while the old asset is being prepared
+            return _asset()
+
+        with patch("src.renderer.cta.load_cta_image", side_effect=load) as mock_load:
+            assert await cache.get("tech") is not None
+            assert cache.stats().entries == 0
+            await cache.get("tech")
+
+        assert mock_load.call_count == 2
+
+    async def test_redis_errors_keep_cached_images(self) -> None:
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        cache = CtaCache(redis=redis)
+        with patch("src.renderer.cta.load_cta_image", return_value=_asset()) as load:
+            assert await cache.get("tech") is not None
+            assert await cache.get("tech") is not None
+        load.assert_called_once()
+
+
+class TestRendererCtaPassthrough:
+    async def test_prepared_cta_returned_unchanged(self) -> None:
+        renderer = SlideRenderer(StyleConfig(slug="test", name="Test Style"))
+        slide = SlideContent(position=5, heading="Follow", slide_type=SlideType.CTA)
+        assert await renderer.render(slide=slide, cta_image=b"final") == b"final"
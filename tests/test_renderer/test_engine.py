@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import io
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from PIL import Image
 
 from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
 from src.renderer.engine import SlideRenderer
+from src.renderer.image_ops import GeneratedImage, probe_image
 from src.renderer.styles import StyleConfig
 from src.schemas.slide import (
     ComparisonBlock,
@@ -35,6 +38,10 @@ def _make_png(width: int = SLIDE_WIDTH, height: int = SLIDE_HEIGHT) -> bytes:
     return buf.getvalue()
 
 
+def _hook(data: bytes = b"hook") -> GeneratedImage:
+    return GeneratedImage(data=data, format="PNG", width=SLIDE_WIDTH, height=SLIDE_HEIGHT)
+
+
 def _png_dimensions(data: bytes) -> tuple[int, int]:
     img = Image.open(io.BytesIO(data))
     return img.size
@@ -60,9 +67,9 @@ class TestPassthrough:
             text_position=TextPosition.NONE,
             slide_type=SlideType.HOOK,
         )
-        gen_image = _make_png()
+        gen_image = probe_image(_make_png())
         result = await renderer.render(slide=slide, generated_image=gen_image)
-        assert result == gen_image
+        assert result == gen_image.data
 
     async def test_returns_image_as_is_when_text_position_none(self) -> None:
         renderer = SlideRenderer(_make_style())
@@ -74,10 +81,17 @@ class TestPassthrough:
             text_position=TextPosition.NONE,
             slide_type=SlideType.CONTENT,
         )
-        gen_image = _make_png()
+        gen_image = probe_image(_make_png())
         result = await renderer.render(slide=slide, generated_image=gen_image)
         # text_position=none means passthrough even if body_text exists
-        assert result == gen_image
+        assert result == gen_image.data
+
+    async def test_mismatched_image_is_encoded_once_at_slide_size(self) -> None:
+        renderer = SlideRenderer(_make_style())
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+        gen_image = probe_image(_make_png(800, 600))
+        result = await renderer.render(slide=slide, generated_image=gen_image)
+        assert _png_dimensions(result) == (SLIDE_WIDTH, SLIDE_HEIGHT)
 
 
 class TestOverlay:
@@ -91,13 +105,13 @@ class TestOverlay:
             text_position=TextPosition.CENTER,
             slide_type=SlideType.CONTENT,
         )
-        gen_image = _make_png()
+        gen_image = probe_image(_make_png())
         result = await renderer.render(
             slide=slide,
             generated_image=gen_image,
         )
         # Result should be different from input (overlay was applied)
-        assert result != gen_image
+        assert result != gen_image.data
         # Result should be a valid PNG with correct dimensions
         assert _png_dimensions(result) == (SLIDE_WIDTH, SLIDE_HEIGHT)
 
@@ -111,7 +125,7 @@ class TestOverlay:
             text_position=TextPosition.BOTTOM,
             slide_type=SlideType.CONTENT,
         )
-        gen_image = _make_png()
+        gen_image = probe_image(_make_png())
         result = await renderer.render(
             slide=slide,
             generated_image=gen_image,
@@ -279,3 +293,92 @@ class TestFallback:
             generated_image=None,
         )
         assert _png_dimensions(result) == (SLIDE_WIDTH, SLIDE_HEIGHT)
+
+
+class TestRenderCarousel:
+    async def test_results_in_position_order_and_concurrent(self) -> None:
+        renderer = SlideRenderer(_make_style())
+        slides = [
+            SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK),
+            SlideContent(position=1, heading="A", slide_type=SlideType.CONTENT),
+            SlideContent(position=2, heading="B", slide_type=SlideType.CONTENT),
+            SlideContent(position=3, heading="CTA", slide_type=SlideType.CTA),
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def fake_render(
+            slide: SlideContent,
+            generated_image: GeneratedImage | None = None,
+            cta_image: bytes | None = None,
+        ) -> bytes:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier slides finish last to prove ordering is by position
+            await asyncio.sleep(0.01 * (len(slides) - slide.position))
+            in_flight -= 1
+            hook = generated_image.data if generated_image else None
+            return f"{slide.position}:{hook!r}:{cta_image!r}".encode()
+
+        with patch.object(renderer, "render", side_effect=fake_render):
+            result = await renderer.render_carousel(slides, hook_image=_hook(), cta_image=b"cta")
+
+        assert result == [
+            b"0:b'hook':None",
+            b"1:None:None",
+            b"2:None:None",
+            b"3:None:b'cta'",
+        ]
+        assert peak > 1
+
+
+class TestRenderCarouselBatch:
+    async def test_one_document_for_html_slides(self) -> None:
+        renderer = SlideRenderer(_make_style(), batch=True)
+        slides = [
+            SlideContent(
+                position=0,
+                heading="Hook",
+                body_text="Overlay",
+                text_position=TextPosition.BOTTOM,
+                slide_type=SlideType.HOOK,
+            ),
+            SlideContent(position=1, heading="A", slide_type=SlideType.CONTENT),
+            SlideContent(position=2, heading="B", slide_type=SlideType.CONTENT),
+            SlideContent(position=3, heading="CTA", slide_type=SlideType.CTA),
+        ]
+
+        async def fake_sections(html: str, count: int, width: int, height: int) -> list[bytes]:
+            assert html.count('class="batch-section"') == count
+            assert html.count("<!DOCTYPE html>") == 1
+            return [f"shot{i}".encode() for i in range(count)]
+
+        with (
+            patch("src.renderer.engine.get_render_cache", return_value=None),
+            patch(
+                "src.renderer.engine.render_html_sections", side_effect=fake_sections
+            ) as sections_mock,
+        ):
+            result = await renderer.render_carousel(slides, hook_image=_hook(), cta_image=b"cta")
+
+        assert result == [b"shot0", b"shot1", b"shot2", b"cta"]
+        assert sections_mock.call_count == 1
+
+    async def test_bare_hook_image_passes_through(self) -> None:
+        renderer = SlideRenderer(_make_style(), batch=True)
+        slides = [
+            SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK),
+            SlideContent(position=1, heading="A", slide_type=SlideType.CONTENT),
+        ]
+
+        with (
+            patch("src.renderer.engine.get_render_cache", return_value=None),
+            patch(
+                "src.renderer.engine.render_html_sections",
+                new=AsyncMock(return_value=[b"shot0"]),
+            ),
+        ):
+            result = await renderer.render_carousel(slides, hook_image=_hook())
+
+        assert result == [b"hook", b"shot0"]
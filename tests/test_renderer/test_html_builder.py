@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 from src.renderer.html_builder import (
+    _get_lookup,
+    _style_context,
+    build_batch_html,
     build_comparison_html,
     build_listing_html,
     build_quote_html,
     build_stats_html,
     build_steps_html,
     build_text_html,
+    warm_templates,
 )
 from src.renderer.styles import StyleConfig
 from src.schemas.slide import (
@@ -283,6 +290,48 @@ class TestBuildStepsHtml:
         assert "05" in html
 
 
+class TestBuildBatchHtml:
+    def test_fragment_has_no_document_wrapper(self) -> None:
+        slide = SlideContent(position=1, heading="Fragment")
+        html = build_text_html(slide, _make_style(), fragment=True)
+        assert "Fragment" in html
+        assert "<!DOCTYPE html>" not in html
+        assert "--bg-color" not in html
+
+    def test_sections_share_one_stylesheet(self) -> None:
+        style = _make_style()
+        sections = [
+            build_text_html(SlideContent(position=i, heading=f"Slide {i}"), style, fragment=True)
+            for i in range(3)
+        ]
+        html = build_batch_html(sections, style)
+        assert html.count("<!DOCTYPE html>") == 1
+        assert html.count("--bg-color:") == 1
+        assert html.count('class="batch-section"') == 3
+        assert "Slide 2" in html
+
+
+class TestStyleContext:
+    def test_memoized_per_style_config(self) -> None:
+        style = _make_style()
+        assert _style_context(style) is _style_context(_make_style())
+
+    def test_config_change_rebuilds_css(self) -> None:
+        style = _make_style()
+        before = _style_context(style)
+        style.accent_color = "#00FF00"
+        after = _style_context(style)
+        assert after is not before
+        assert "--accent-color: #00FF00" in str(after["base_css"])
+
+    def test_font_faces_are_not_html_escaped(self) -> None:
+        faces = "@font-face { font-family: 'Test'; src: url('x.ttf'); }"
+        style = StyleConfig(slug="faces", name="Faces")
+        with patch("src.renderer.html_builder._build_font_faces", return_value=faces):
+            html = build_text_html(SlideContent(position=1, heading="H"), style)
+        assert faces in html
+
+
 class TestQuoteDataModel:
     def test_quote_data_creation(self) -> None:
         q = QuoteData(quote_text="Stay hungry", author_name="Steve Jobs", author_title="Apple CEO")
@@ -320,3 +369,22 @@ class TestStepsDataModel:
     def test_step_item_optional_description(self) -> None:
         item = StepItem(title="Just a title")
         assert item.description == ""
+
+
+class TestWarmTemplates:
+    def test_compiles_slide_templates_and_layouts(self, tmp_path: Path) -> None:
+        settings = MagicMock(template_cache_dir=str(tmp_path))
+        _get_lookup.cache_clear()
+        try:
+            with patch("src.renderer.html_builder.get_settings", return_value=settings):
+                count = warm_templates()
+                html = build_text_html(
+                    SlideContent(position=1, heading="Warm"), StyleConfig(slug="test", name="Test")
+                )
+        finally:
+            _get_lookup.cache_clear()
+
+        modules = {p.name for p in (tmp_path / "renderer").rglob("*.mako.py")}
+        assert count == len(modules)
+        assert {"base.html.mako.py", "text.html.mako.py"} <= modules
+        assert "Warm" in html
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import threading
+
+import pytest
+from PIL import Image
+
+from src.renderer.image_ops import (
+    OutputFormat,
+    encode_image,
+    finalize_image,
+    get_image_op_stats,
+    normalize_image,
+    probe_image,
+    run_image_op,
+    transcode,
+)
+
+
+def _make_image(size: tuple[int, int], mode: str = "RGB") -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestNormalizeImage:
+    def test_resizes_and_converts_to_rgb(self) -> None:
+        result = normalize_image(_make_image((200, 100), mode="RGBA"), 108, 135)
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (108, 135)
+        assert img.mode == "RGB"
+        assert img.format == "PNG"
+
+    def test_invalid_data_raises(self) -> None:
+        with pytest.raises(Exception):  # noqa: B017
+            normalize_image(b"not an image", 108, 135)
+
+
+class TestEncodeImage:
+    @pytest.mark.parametrize(
+        ("fmt", "pil_format", "content_type", "extension"),
+        [
+            ("png", "PNG", "image/png", ".png"),
+            ("jpeg", "JPEG", "image/jpeg", ".jpg"),
+            ("webp", "WEBP", "image/webp", ".webp"),
+        ],
+    )
+    def test_encodes_in_requested_format(
+        self, fmt: str, pil_format: str, content_type: str, extension: str
+    ) -> None:
+        output = OutputFormat(format=fmt, quality=80, compress_level=1)
+        result = encode_image(Image.new("RGB", (20, 10), "red"), output)
+        img = Image.open(io.BytesIO(result))
+        assert img.format == pil_format
+        assert img.size == (20, 10)
+        assert output.content_type == content_type
+        assert output.extension == extension
+
+    def test_png_compress_level_trades_size(self) -> None:
+        img = Image.linear_gradient("L").convert("RGB")
+        fast = encode_image(img, OutputFormat(format="png", quality=90, compress_level=0))
+        small = encode_image(img, OutputFormat(format="png", quality=90, compress_level=9))
+        assert len(small) < len(fast)
+
+    def test_transcode_and_normalize_follow_output(self) -> None:
+        output = OutputFormat(format="webp", quality=80, compress_level=6)
+        assert Image.open(io.BytesIO(transcode(_make_image((10, 10)), output))).format == "WEBP"
+        result = normalize_image(_make_image((10, 10)), 20, 20, output)
+        assert Image.open(io.BytesIO(result)).format == "WEBP"
+
+
+class TestFinalizeImage:
+    def test_matching_image_is_returned_without_encoding(self) -> None:
+        data = _make_image((20, 10))
+        output = OutputFormat(format="png")
+        assert finalize_image(probe_image(data), 20, 10, output) is data
+
+    def test_mismatched_image_is_resized_and_encoded(self) -> None:
+        image = probe_image(_make_image((20, 10), mode="RGBA"))
+        result = finalize_image(image, 10, 10, OutputFormat(format="jpeg"))
+        img = Image.open(io.BytesIO(result))
+        assert (img.format, img.size, img.mode) == ("JPEG", (10, 10), "RGB")
+
+
+class TestRunImageOp:
+    async def test_runs_off_the_event_loop_thread(self) -> None:
+        loop_thread = threading.current_thread().name
+        worker_thread = await run_image_op("test_thread", lambda: threading.current_thread().name)
+        assert worker_thread != loop_thread
+        assert worker_thread.startswith("image-ops")
+
+    async def test_records_timing_per_operation(self) -> None:
+        data = _make_image((10, 10))
+        await run_image_op("test_timing", normalize_image, data, 20, 20)
+        await run_image_op("test_timing", normalize_image, data, 20, 20)
+
+        stats = get_image_op_stats()["test_timing"]
+        assert stats.calls == 2
+        assert stats.run_seconds > 0
+        assert stats.max_run_seconds <= stats.run_seconds
+
+    async def test_propagates_exceptions(self) -> None:
+        def boom() -> None:
+            raise ValueError("bad image")
+
+        with pytest.raises(ValueError, match="bad image"):
+            await run_image_op("test_error", boom)
+        assert get_image_op_stats()["test_error"].calls == 1
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import io
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from PIL import Image, ImageChops, ImageFont, ImageStat
+
+from src.config.constants import SLIDE_HEIGHT, SLIDE_WIDTH
+from src.renderer.engine import SlideRenderer
+from src.renderer.html_builder import (
+    _build_font_faces,
+    build_quote_html,
+    build_stats_html,
+    build_text_html,
+)
+from src.renderer.pillow_engine import (
+    _font_index,
+    _load_font,
+    _wrap,
+    can_render,
+    render_slide_image,
+)
+from src.renderer.styles import StyleConfig
+from src.schemas.slide import (
+    ContentTemplate,
+    QuoteData,
+    SlideContent,
+    StatsData,
+)
+
+# Mean per-channel absolute difference (0-255) allowed between engines
+_VISUAL_TOLERANCE = 3.0
+
+# Lato Regular (SIL Open Font License, see OFL.txt), so the diff runs without assets/fonts
+_FIXTURE_FONTS = Path(__file__).resolve().parent.parent / "fixtures" / "fonts"
+
+_SLIDES = {
+    ContentTemplate.TEXT: SlideContent(
+        position=1,
+        heading="Lead with the outcome",
+        subtitle="Not the process",
+        body_text="People scroll past process. Show the result on slide one.",
+        slide_number=1,
+    ),
+    ContentTemplate.STATS: SlideContent(
+        position=2,
+        heading="Saves",
+        content_template=ContentTemplate.STATS,
+        stats_data=StatsData(value="3x", label="more saves", context="vs. single images"),
+        slide_number=2,
+    ),
+    ContentTemplate.QUOTE: SlideContent(
+        position=3,
+        heading="Quote",
+        content_template=ContentTemplate.QUOTE,
+        quote_data=QuoteData(
+            quote_text="Clarity beats cleverness.",
+            author_name="Editor",
+            author_title="Newsletter",
+        ),
+        slide_number=3,
+    ),
+}
+
+_HTML_BUILDERS = {
+    ContentTemplate.TEXT: build_text_html,
+    ContentTemplate.STATS: build_stats_html,
+    ContentTemplate.QUOTE: build_quote_html,
+}
+
+
+@pytest.fixture
+def default_font() -> Iterator[None]:
+    """Resolve every family to Pillow's bundled font (assets/fonts is not in git)."""
+    with (
+        patch("src.renderer.pillow_engine._font_path", return_value=Path("default.ttf")),
+        patch(
+            "src.renderer.pillow_engine._load_font",
+            side_effect=lambda path, size: ImageFont.load_default(size),
+        ),
+    ):
+        yield
+
+
+def _clear_font_caches() -> None:
+    _font_index.cache_clear()
+    _load_font.cache_clear()
+    _build_font_faces.cache_clear()
+
+
+@pytest.fixture
+def fixture_fonts() -> Iterator[None]:
+    """Point both engines at the bundled test font instead of assets/fonts."""
+    _clear_font_caches()
+    with (
+        patch("src.renderer.pillow_engine._FONTS_DIR", _FIXTURE_FONTS),
+        patch("src.renderer.html_builder._FONTS_DIR", _FIXTURE_FONTS),
+    ):
+        yield
+    _clear_font_caches()
+
+
+def _style() -> StyleConfig:
+    return StyleConfig(slug="test", name="Test Style", bg_color="#102030")
+
+
+class TestWrap:
+    def test_wraps_on_word_boundaries(self) -> None:
+        font = ImageFont.load_default(40)
+        lines = _wrap("one two three four five six", font, font.getlength("one two three"))
+        assert lines[0] == "one two three"
+        assert " ".join(lines) == "one two three four five six"
+
+    def test_breaks_words_longer_than_line(self) -> None:
+        font = ImageFont.load_default(40)
+        max_width = font.getlength("abcde")
+        lines = _wrap("abcdefghijkl", font, max_width)
+        assert len(lines) > 1
+        assert "".join(lines) == "abcdefghijkl"
+        assert all(font.getlength(line) <= max_width for line in lines)
+
+    def test_letter_spacing_counts_toward_width(self) -> None:
+        font = ImageFont.load_default(40)
+        max_width = font.getlength("one two")
+        assert _wrap("one two", font, max_width) == ["one two"]
+        assert _wrap("one two", font, max_width, letter_spacing=2) == ["one", "two"]
+
+
+class TestCanRender:
+    def test_unsupported_template(self, default_font: None) -> None:
+        assert not can_render(ContentTemplate.LISTING, _style())
+
+    def test_requires_style_fonts(self) -> None:
+        with patch("src.renderer.pillow_engine._font_index", return_value={}):
+            assert not can_render(ContentTemplate.TEXT, _style())
+
+
+class TestRenderSlideImage:
+    @pytest.mark.parametrize("template", list(_SLIDES))
+    def test_draws_full_size_slide(self, default_font: None, template: ContentTemplate) -> None:
+        result = render_slide_image(
+            _SLIDES[template], _style(), template, SLIDE_WIDTH, SLIDE_HEIGHT
+        )
+
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (SLIDE_WIDTH, SLIDE_HEIGHT)
+        assert img.getpixel((0, 0)) == (0x10, 0x20, 0x30)
+        # Something was drawn besides the background
+        assert len(img.getcolors(maxcolors=1 << 16) or []) > 2
+
+
+class TestRendererDispatch:
+    async def test_enabled_template_skips_browser(self, default_font: None) -> None:
+        renderer = SlideRenderer(_style())
+
+        with (
+            patch.object(renderer, "_pillow_templates", frozenset({"text"})),
+            patch("src.renderer.engine.render_html_to_image", new=AsyncMock()) as browser,
+        ):
+            result = await renderer.render(slide=_SLIDES[ContentTemplate.TEXT])
+
+        browser.assert_not_awaited()
+        assert Image.open(io.BytesIO(result)).size == (SLIDE_WIDTH, SLIDE_HEIGHT)
+
+    async def test_disabled_template_uses_browser(self, default_font: None) -> None:
+        renderer = SlideRenderer(_style())
+
+        with (
+            patch.object(renderer, "_pillow_templates", frozenset({"text"})),
+            patch("src.renderer.engine.get_render_cache", return_value=None),
+            patch(
+                "src.renderer.engine.render_html_to_image", new=AsyncMock(return_value=b"html")
+            ) as browser,
+        ):
+            result = await renderer.render(slide=_SLIDES[ContentTemplate.STATS])
+
+        browser.assert_awaited_once()
+        assert result == b"html"
+
+
+class TestVisualDiff:
+    @pytest.fixture(autouse=True)
+    async def _cleanup_browser(self) -> AsyncIterator[None]:
+        """Each test runs on its own event loop, so shut the browser down after it."""
+        yield
+        from src.renderer.browser import shutdown
+
+        await shutdown()
+
+    @pytest.mark.parametrize("template", list(_SLIDES))
+    async def test_matches_html_template(
+        self, fixture_fonts: None, template: ContentTemplate
+    ) -> None:
+        from src.renderer.browser import render_html_to_image
+
+        style = StyleConfig(slug="test", name="Test Style", heading_font="Lato", body_font="Lato")
+        assert can_render(template, style)
+        slide = _SLIDES[template]
+        try:
+            html_png = await render_html_to_image(_HTML_BUILDERS[template](slide, style))
+        except Exception as exc:
+            pytest.skip(f"Chromium unavailable: {exc}")
+        pillow_png = render_slide_image(slide, style, template, SLIDE_WIDTH, SLIDE_HEIGHT)
+
+        html_img = Image.open(io.BytesIO(html_png)).convert("RGB")
+        pillow_img = Image.open(io.BytesIO(pillow_png)).convert("RGB")
+        diff = ImageStat.Stat(ImageChops.difference(html_img, pillow_img)).mean
+        assert sum(diff) / len(diff) < _VISUAL_TOLERANCE
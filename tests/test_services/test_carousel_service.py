@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.ai.base import ImageProviderOverloadedError
+from src.ai.concurrency import AdaptiveLimiter
+from src.ai.hedging import HedgePolicy
+from src.ai.rate_limit import RateLimitTimeoutError
+from src.config.constants import STYLE_MINIMALIST
+from src.models.carousel import CarouselGeneration, GenerationStatus
+from src.models.slide import Slide
 from src.schemas.slide import SlideContent, SlideType, TextPosition
-from src.services.carousel_service import CarouselService, TelegramNotifier, _ProgressCounter
+from src.services.carousel_service import (
+    CarouselService,
+    TelegramNotifier,
+    _dump_slides,
+    _ProgressCounter,
+)
 
 
 class TestTelegramNotifier:
@@ -124,3 +139,621 @@ class TestGenerateSlideImageWithRetry:
         assert result is None
         # 1 initial + 2 retries = 3 total attempts
         assert service.image_provider.generate_slide_image.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retries_after_overload(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        service.image_provider.generate_slide_image = AsyncMock(
+            side_effect=[ImageProviderOverloadedError("429"), b"png_data"]
+        )
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+        limiter = AdaptiveLimiter("test", initial=4, max_limit=4)
+
+        with (
+            patch("src.services.carousel_service.get_image_limiter", return_value=limiter),
+            patch("src.services.carousel_service.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            result = await service._generate_slide_image_with_retry(
+                slide=slide,
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(3),
+                notifier=AsyncMock(spec=TelegramNotifier),
+                total=1,
+                progress=_ProgressCounter(),
+            )
+
+        assert result == b"png_data"
+        assert limiter.limit == 2
+        # Full jitter: first retry waits at most the base backoff
+        assert 0 <= sleep.call_args.args[0] <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_only_images_raise_the_limit(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        service.image_provider.generate_slide_image = AsyncMock(side_effect=[None, b"png_data"])
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+        limiter = AdaptiveLimiter("test", initial=1, max_limit=4)
+
+        with (
+            patch("src.services.carousel_service.get_image_limiter", return_value=limiter),
+            patch("src.services.carousel_service.asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await service._generate_slide_image_with_retry(
+                slide=slide,
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(3),
+                notifier=AsyncMock(spec=TelegramNotifier),
+                total=1,
+                progress=_ProgressCounter(),
+            )
+
+        assert result == b"png_data"
+        # The attempt that returned None leaves the limit alone
+        assert limiter.stats().increases == 1
+
+    @pytest.mark.asyncio
+    async def test_admission_is_awaited_before_taking_a_slot(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        service.image_provider.generate_slide_image = AsyncMock(return_value=b"png_data")
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+        limiter = AdaptiveLimiter("test", initial=1, max_limit=1)
+        admissions = 0
+
+        @asynccontextmanager
+        async def admit() -> AsyncIterator[None]:
+            nonlocal admissions
+            admissions += 1
+            # Queued calls do not hold the limiter slot
+            assert limiter.stats().in_flight == 0
+            if admissions == 1:
+                raise RateLimitTimeoutError("queue full")
+            yield
+
+        service.image_provider.admit = admit
+        with (
+            patch("src.services.carousel_service.get_image_limiter", return_value=limiter),
+            patch("src.services.carousel_service.asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await service._generate_slide_image_with_retry(
+                slide=slide,
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(3),
+                notifier=AsyncMock(spec=TelegramNotifier),
+                total=1,
+                progress=_ProgressCounter(),
+            )
+
+        assert result == b"png_data"
+        assert admissions == 2
+        # The rejected admission is not counted as an overload
+        assert limiter.stats().overloads == 0
+
+    @pytest.mark.asyncio
+    async def test_stops_retrying_at_deadline(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        service.image_provider.generate_slide_image = AsyncMock(return_value=None)
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+
+        with patch("src.services.carousel_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await service._generate_slide_image_with_retry(
+                slide=slide,
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(3),
+                notifier=AsyncMock(spec=TelegramNotifier),
+                total=1,
+                progress=_ProgressCounter(),
+                deadline=time.monotonic(),
+            )
+
+        assert result is None
+        assert service.image_provider.generate_slide_image.call_count == 1
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hook_image_is_hedged_when_enabled(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        service.image_provider.generate_slide_image = AsyncMock(return_value=b"png_data")
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+        policy = HedgePolicy(budget=0.1)
+
+        with (
+            patch("src.services.carousel_service.get_settings") as mock_settings,
+            patch("src.services.carousel_service.get_hook_hedge_policy", return_value=policy),
+        ):
+            mock_settings.return_value.pipeline.hedge_hook_image = True
+            _, result = await service._hook_image(
+                slide, MagicMock(), asyncio.Semaphore(1), AsyncMock(spec=TelegramNotifier)
+            )
+
+        assert result == b"png_data"
+        assert policy.stats().requests == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_while_limit_is_cut(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        calls = 0
+
+        async def generate(**kwargs: object) -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return b"png_data"
+
+        service.image_provider.generate_slide_image = generate
+        slide = SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK)
+        policy = HedgePolicy(budget=1.0)
+        for _ in range(20):
+            policy.record(0.01)
+        policy._requests = 20
+        limiter = AdaptiveLimiter("test", initial=4, max_limit=4)
+        limiter._limit = 2.0  # cut by an earlier overload
+
+        with (
+            patch("src.services.carousel_service.get_settings") as mock_settings,
+            patch("src.services.carousel_service.get_hook_hedge_policy", return_value=policy),
+            patch("src.services.carousel_service.get_image_limiter", return_value=limiter),
+        ):
+            mock_settings.return_value.pipeline.hedge_hook_image = True
+            _, result = await service._hook_image(
+                slide, MagicMock(), asyncio.Semaphore(2), AsyncMock(spec=TelegramNotifier)
+            )
+
+        assert result == b"png_data"
+        assert calls == 1
+        assert policy.stats().hedged == 0
+
+
+class TestStreamCopy:
+    @pytest.mark.asyncio
+    async def test_starts_renders_for_non_hook_slides_while_streaming(self) -> None:
+        slides = [
+            SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK),
+            SlideContent(position=1, heading="Body", slide_type=SlideType.CONTENT),
+            SlideContent(position=2, heading="CTA", slide_type=SlideType.CTA),
+        ]
+        started: list[int] = []
+
+        async def stream_slides(**kwargs: object) -> AsyncGenerator[SlideContent]:
+            for slide in slides:
+                yield slide
+                # Renders for already-yielded slides start before the stream ends
+                await asyncio.sleep(0)
+
+        async def render_slide(
+            slide: SlideContent,
+            hook_image: bytes | None = None,
+            cta_image: bytes | None = None,
+        ) -> bytes:
+            started.append(slide.position)
+            return f"{slide.position}:{cta_image!r}".encode()
+
+        service = CarouselService.__new__(CarouselService)
+        service.copywriter = MagicMock()
+        service.copywriter.stream_slides = stream_slides
+        renderer = MagicMock()
+        renderer.render_slide = render_slide
+        renderer.batch = False
+
+        early: dict[int, asyncio.Task[bytes]] = {}
+        result = await service._stream_copy(
+            input_text="text",
+            style_slug="tech",
+            slide_count=3,
+            renderer=renderer,
+            cta_image=b"cta",
+            early_renders=early,
+        )
+
+        assert result == slides
+        assert sorted(early) == [1, 2]
+        assert started[0] == 1
+        assert await early[2] == b"2:b'cta'"
+
+    @pytest.mark.asyncio
+    async def test_batch_renderer_skips_early_renders(self) -> None:
+        slides = [
+            SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK),
+            SlideContent(position=1, heading="Body", slide_type=SlideType.CONTENT),
+        ]
+
+        async def stream_slides(**kwargs: object) -> AsyncGenerator[SlideContent]:
+            for slide in slides:
+                yield slide
+
+        service = CarouselService.__new__(CarouselService)
+        service.copywriter = MagicMock()
+        service.copywriter.stream_slides = stream_slides
+        renderer = MagicMock()
+        renderer.batch = True
+
+        early: dict[int, asyncio.Task[bytes]] = {}
+        result = await service._stream_copy(
+            input_text="text",
+            style_slug="tech",
+            slide_count=2,
+            renderer=renderer,
+            cta_image=None,
+            early_renders=early,
+        )
+
+        assert result == slides
+        assert early == {}
+
+
+class TestResolveHookImage:
+    @staticmethod
+    def _service() -> CarouselService:
+        service = CarouselService.__new__(CarouselService)
+        service.image_provider = MagicMock()
+        service.image_provider.generate_slide_image = AsyncMock(return_value=b"fresh")
+        return service
+
+    @staticmethod
+    async def _speculation(
+        slide: SlideContent, image: bytes | None
+    ) -> tuple[SlideContent, bytes | None]:
+        return slide, image
+
+    @pytest.mark.asyncio
+    async def test_uses_speculative_image_when_hook_matches(self) -> None:
+        service = self._service()
+        hook = SlideContent(position=0, heading="Same", slide_type=SlideType.HOOK)
+        slides = [hook.model_copy()]
+
+        result = await service._resolve_hook_image(
+            slides,
+            speculation=asyncio.create_task(self._speculation(hook, b"speculative")),
+            style_config=MagicMock(),
+            semaphore=asyncio.Semaphore(1),
+            notifier=AsyncMock(spec=TelegramNotifier),
+        )
+
+        assert result == b"speculative"
+        service.image_provider.generate_slide_image.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_adopts_speculative_hook_on_mismatch(self) -> None:
+        service = self._service()
+        speculative = SlideContent(position=0, heading="Early", slide_type=SlideType.HOOK)
+        slides = [SlideContent(position=0, heading="Final", slide_type=SlideType.HOOK)]
+
+        with patch("src.services.carousel_service.get_settings") as mock_settings:
+            mock_settings.return_value.pipeline.hook_mismatch_policy = "adopt"
+            result = await service._resolve_hook_image(
+                slides,
+                speculation=asyncio.create_task(self._speculation(speculative, b"speculative")),
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(1),
+                notifier=AsyncMock(spec=TelegramNotifier),
+            )
+
+        assert result == b"speculative"
+        assert slides[0].heading == "Early"
+        service.image_provider.generate_slide_image.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_does_not_adopt_speculation_without_image(self) -> None:
+        service = self._service()
+        speculative = SlideContent(position=0, heading="Early", slide_type=SlideType.HOOK)
+        slides = [SlideContent(position=0, heading="Final", slide_type=SlideType.HOOK)]
+
+        with patch("src.services.carousel_service.get_settings") as mock_settings:
+            mock_settings.return_value.pipeline.hook_mismatch_policy = "adopt"
+            mock_settings.return_value.pipeline.hedge_hook_image = False
+            result = await service._resolve_hook_image(
+                slides,
+                speculation=asyncio.create_task(self._speculation(speculative, None)),
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(1),
+                notifier=AsyncMock(spec=TelegramNotifier),
+            )
+
+        assert result == b"fresh"
+        assert slides[0].heading == "Final"
+        service.image_provider.generate_slide_image.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_regenerates_on_mismatch(self) -> None:
+        service = self._service()
+        speculative = SlideContent(position=0, heading="Early", slide_type=SlideType.HOOK)
+        slides = [SlideContent(position=0, heading="Final", slide_type=SlideType.HOOK)]
+
+        with patch("src.services.carousel_service.get_settings") as mock_settings:
+            mock_settings.return_value.pipeline.hook_mismatch_policy = "regenerate"
+            result = await service._resolve_hook_image(
+                slides,
+                speculation=asyncio.create_task(self._speculation(speculative, b"speculative")),
+                style_config=MagicMock(),
+                semaphore=asyncio.Semaphore(1),
+                notifier=AsyncMock(spec=TelegramNotifier),
+            )
+
+        assert result == b"fresh"
+        assert slides[0].heading == "Final"
+        service.image_provider.generate_slide_image.assert_awaited_once()
+
+
+class TestArchiveSlides:
+    async def test_uploads_and_persists_rows_in_order(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        service.s3 = MagicMock()
+        service.s3.upload_many = AsyncMock(side_effect=lambda items, **_: [k for k, _ in items])
+        session = MagicMock()
+        session.commit = AsyncMock()
+        generation = MagicMock(id=7, hook_image_s3_key="carousels/42/7/1_hook.png")
+        slides = [
+            SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK),
+            SlideContent(position=1, heading="Body", slide_type=SlideType.CONTENT),
+        ]
+
+        await service._archive_slides(session, generation, 42, slides, [b"a", b"b"])
+
+        items = service.s3.upload_many.call_args.args[0]
+        assert [data for _, data in items] == [b"a", b"b"]
+        assert service.s3.upload_many.call_args.kwargs["content_type"] == "image/png"
+        assert all(key.endswith(".png") for key, _ in items)
+        rows = [call.args[0] for call in session.add.call_args_list]
+        assert [r.position for r in rows] == [0, 1]
+        assert [r.rendered_s3_key for r in rows] == [k for k, _ in items]
+        assert [r.image_s3_key for r in rows] == ["carousels/42/7/1_hook.png", None]
+        session.commit.assert_awaited_once()
+
+
+class TestSendMediaGroup:
+    async def test_raises_when_telegram_rejects(self) -> None:
+        service = CarouselService.__new__(CarouselService)
+        with patch("src.services.carousel_service.httpx.AsyncClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client.post = AsyncMock(
+                return_value=MagicMock(status_code=400, json=MagicMock(return_value={"ok": False}))
+            )
+
+            with pytest.raises(RuntimeError, match="sendMediaGroup failed"):
+                await service._send_media_group("token", 1, 2, [b"a"])
+            # Status message is only deleted after a successful send
+            assert mock_client.post.await_count == 1
+
+
+class TestResumeGeneration:
+    """A retry of the same task resumes the generation its previous attempt left."""
+
+    SLIDES = [
+        SlideContent(position=0, heading="Hook", slide_type=SlideType.HOOK),
+        SlideContent(position=1, heading="Body", slide_type=SlideType.CONTENT),
+    ]
+
+    @staticmethod
+    def _generation(status: GenerationStatus, **kwargs: object) -> CarouselGeneration:
+        return CarouselGeneration(
+            id=7,
+            user_id=42,
+            input_text="text",
+            style_slug=STYLE_MINIMALIST,
+            status=status,
+            celery_task_id="task-1",
+            slides_data=_dump_slides(TestResumeGeneration.SLIDES),
+            **kwargs,
+        )
+
+    @staticmethod
+    def _service() -> CarouselService:
+        service = CarouselService.__new__(CarouselService)
+        service.copywriter = MagicMock()
+        service.copywriter.generate_slides = AsyncMock()
+        service.image_provider = MagicMock()
+        service.s3 = MagicMock()
+        service.s3.download_many = AsyncMock(return_value=[b"archived-0", b"archived-1"])
+        service._send_media_group = AsyncMock()  # type: ignore[method-assign]
+        service._archive_slides = AsyncMock()  # type: ignore[method-assign]
+        service._resolve_hook_image = AsyncMock(return_value=None)  # type: ignore[method-assign]
+        return service
+
+    @staticmethod
+    async def _run(
+        service: CarouselService,
+        generation: CarouselGeneration,
+        *,
+        final_attempt: bool = True,
+        refund: AsyncMock | None = None,
+        cta_get: AsyncMock | None = None,
+        render_slide: AsyncMock | None = None,
+    ) -> MagicMock:
+        session = MagicMock()
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        session.execute = AsyncMock(
+            return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=generation))
+        )
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        renderer = MagicMock(batch=False)
+        renderer.render_slide = render_slide or AsyncMock(
+            side_effect=lambda sc, **_: f"render-{sc.position}".encode()
+        )
+        with (
+            patch("src.services.carousel_service.get_settings") as mock_settings,
+            patch("src.services.carousel_service.get_session_factory", return_value=factory),
+            patch("src.services.carousel_service.TelegramNotifier", return_value=AsyncMock()),
+            patch("src.services.carousel_service.load_style_config"),
+            patch("src.services.carousel_service.SlideRenderer", return_value=renderer),
+            patch("src.services.carousel_service.get_cta_cache") as mock_cta,
+            patch("src.services.carousel_service.refund_credits", refund or AsyncMock()),
+            patch("src.services.carousel_service.httpx.AsyncClient"),
+        ):
+            mock_settings.return_value.gemini.max_concurrency = 2
+            mock_settings.return_value.gemini.retry_deadline = 60.0
+            mock_cta.return_value.get = cta_get or AsyncMock(return_value=None)
+            await service.generate_and_send(
+                user_id=42,
+                telegram_chat_id=1,
+                input_text="text",
+                style_slug=STYLE_MINIMALIST,
+                status_message_id=2,
+                celery_task_id="task-1",
+                final_attempt=final_attempt,
+            )
+        return renderer
+
+    async def test_resumes_rendering_without_rewriting_copy(self) -> None:
+        service = self._service()
+        generation = self._generation(GenerationStatus.RENDERING)
+
+        renderer = await self._run(service, generation)
+
+        service.copywriter.generate_slides.assert_not_called()
+        service._resolve_hook_image.assert_not_called()
+        assert renderer.render_slide.await_count == 2
+        sent = service._send_media_group.call_args.args[3]
+        assert sent == [b"render-0", b"render-1"]
+        service._archive_slides.assert_awaited_once()
+        assert generation.status == GenerationStatus.COMPLETED
+
+    async def test_resumes_image_generation_from_saved_slides(self) -> None:
+        service = self._service()
+        generation = self._generation(GenerationStatus.IMAGE_GENERATION)
+
+        await self._run(service, generation)
+
+        service.copywriter.generate_slides.assert_not_called()
+        service._resolve_hook_image.assert_awaited_once()
+        assert generation.hook_image_s3_key is None
+        assert generation.status == GenerationStatus.COMPLETED
+
+    async def test_hook_image_is_uploaded_while_slides_render(self) -> None:
+        service = self._service()
+        service._resolve_hook_image.return_value = MagicMock(
+            data=b"hook", extension=".png", content_type="image/png"
+        )
+        generation = self._generation(GenerationStatus.IMAGE_GENERATION)
+        rendering = asyncio.Event()
+        status_at_upload: list[GenerationStatus] = []
+
+        async def upload(key: str, data: bytes, content_type: str) -> str:
+            # Only finishes once rendering has started
+            await asyncio.wait_for(rendering.wait(), timeout=1)
+            status_at_upload.append(generation.status)
+            return key
+
+        async def render(sc: SlideContent, **_: object) -> bytes:
+            rendering.set()
+            return f"render-{sc.position}".encode()
+
+        service.s3.upload_bytes_async = AsyncMock(side_effect=upload)
+        await self._run(service, generation, render_slide=AsyncMock(side_effect=render))
+
+        # RENDERING is only committed once the hook image is stored
+        assert status_at_upload == [GenerationStatus.IMAGE_GENERATION]
+        assert generation.hook_image_s3_key is not None
+        assert generation.hook_image_s3_key.endswith("_hook.png")
+        assert generation.status == GenerationStatus.COMPLETED
+
+    async def test_image_deadline_starts_with_image_generation(self) -> None:
+        service = self._service()
+        generation = self._generation(GenerationStatus.IMAGE_GENERATION)
+        now = 100.0
+
+        async def slow_cta(style_slug: str) -> None:
+            nonlocal now
+            now += 30.0
+
+        with patch("src.services.carousel_service.time.monotonic", side_effect=lambda: now):
+            await self._run(service, generation, cta_get=AsyncMock(side_effect=slow_cta))
+
+        # The CTA lookup before image generation does not eat into its budget
+        assert service._resolve_hook_image.call_args.kwargs["deadline"] == 190.0
+
+    async def test_archived_slides_are_resent_without_rendering(self) -> None:
+        service = self._service()
+        generation = self._generation(GenerationStatus.SENDING)
+        generation.slides = [
+            Slide(position=i, heading=sc.heading, rendered_s3_key=f"key-{i}")
+            for i, sc in enumerate(self.SLIDES)
+        ]
+
+        renderer = await self._run(service, generation)
+
+        renderer.render_slide.assert_not_called()
+        service.s3.download_many.assert_awaited_once_with(["key-0", "key-1"])
+        assert service._send_media_group.call_args.args[3] == [b"archived-0", b"archived-1"]
+        service._archive_slides.assert_not_called()
+        assert generation.status == GenerationStatus.COMPLETED
+
+    async def test_sent_carousel_is_only_archived_on_retry(self) -> None:
+        service = self._service()
+        service._archive_slides.side_effect = [RuntimeError("s3 down"), None]
+        generation = self._generation(GenerationStatus.RENDERING)
+
+        with pytest.raises(RuntimeError, match="s3 down"):
+            await self._run(service, generation, final_attempt=False)
+        assert generation.status == GenerationStatus.UPLOADING
+
+        await self._run(service, generation)
+
+        service._send_media_group.assert_awaited_once()
+        assert service._archive_slides.await_count == 2
+        assert generation.status == GenerationStatus.COMPLETED
+
+    async def test_final_archival_retry_failure_is_not_refunded(self) -> None:
+        service = self._service()
+        service._archive_slides.side_effect = RuntimeError("s3 down")
+        generation = self._generation(GenerationStatus.RENDERING)
+        refund = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="s3 down"):
+            await self._run(service, generation, final_attempt=False, refund=refund)
+        with pytest.raises(RuntimeError, match="s3 down"):
+            await self._run(service, generation, refund=refund)
+
+        service._send_media_group.assert_awaited_once()
+        assert service._archive_slides.await_count == 2
+        refund.assert_not_called()
+        assert generation.status == GenerationStatus.UPLOADING
+
+    async def test_archival_failure_after_delivery_is_not_refunded(self) -> None:
+        service = self._service()
+        service._archive_slides.side_effect = RuntimeError("s3 down")
+        generation = self._generation(GenerationStatus.RENDERING)
+        refund = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="s3 down"):
+            await self._run(service, generation, refund=refund)
+
+        service._send_media_group.assert_awaited_once()
+        refund.assert_not_called()
+        assert generation.status == GenerationStatus.UPLOADING
+        assert generation.error_message == "Archival failed: s3 down"
+
+    async def test_non_final_failure_keeps_stage_and_credits(self) -> None:
+        service = self._service()
+        service._send_media_group.side_effect = RuntimeError("telegram down")
+        generation = self._generation(GenerationStatus.RENDERING)
+
+        refund = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="telegram down"):
+            await self._run(service, generation, final_attempt=False, refund=refund)
+
+        assert generation.status == GenerationStatus.SENDING
+        assert generation.error_message == "telegram down"
+        refund.assert_not_called()
+
+    async def test_final_failure_marks_failed_and_refunds(self) -> None:
+        service = self._service()
+        service._send_media_group.side_effect = RuntimeError("telegram down")
+        generation = self._generation(GenerationStatus.RENDERING)
+
+        refund = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="telegram down"):
+            await self._run(service, generation, refund=refund)
+
+        assert generation.status == GenerationStatus.FAILED
+        refund.assert_awaited_once()
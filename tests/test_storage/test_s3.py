@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.storage.s3 import S3Client
+
+
+def _make_client(put_object: MagicMock, workers: int = 4) -> S3Client:
+    s3 = S3Client.__new__(S3Client)
+    s3.bucket = "test"
+    s3.region = "us-east-1"
+    s3.client = MagicMock()
+    s3.client.put_object = put_object
+    s3._executor = ThreadPoolExecutor(max_workers=workers)
+    s3._stats_lock = threading.Lock()
+    s3._uploads = 0
+    s3._failures = 0
+    s3._bytes = 0
+    s3._total_seconds = 0.0
+    s3._max_seconds = 0.0
+    return s3
+
+
+class TestUploadMany:
+    async def test_uploads_concurrently_and_keeps_order(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def put_object(**kwargs: object) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        s3 = _make_client(MagicMock(side_effect=put_object))
+        items = [(f"k{i}", b"x" * (i + 1)) for i in range(4)]
+
+        keys = await s3.upload_many(items)
+
+        assert keys == ["k0", "k1", "k2", "k3"]
+        assert peak > 1
+        stats = s3.stats()
+        assert stats.uploads == 4
+        assert stats.bytes == 1 + 2 + 3 + 4
+        assert stats.max_seconds <= stats.total_seconds
+
+    async def test_failure_is_counted_and_raised(self) -> None:
+        s3 = _make_client(MagicMock(side_effect=ConnectionError("down")))
+
+        with pytest.raises(ConnectionError):
+            await s3.upload_many([("k0", b"x")])
+        assert s3.stats().failures == 1
+        assert s3.stats().uploads == 0
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.config.settings import Settings, WorkerSettings
+from src.worker.celery_app import create_celery_app
+
+
+def _settings(**worker: object) -> Settings:
+    return Settings(worker=WorkerSettings(**worker))  # type: ignore[arg-type]
+
+
+class TestWorkerPool:
+    def test_prefork_runs_one_carousel_per_process(self) -> None:
+        with patch("src.worker.celery_app.get_settings", return_value=_settings(concurrency=3)):
+            app = create_celery_app()
+        assert app.conf.worker_pool == "prefork"
+        assert app.conf.worker_concurrency == 3
+
+    def test_threads_pool_concurrency_is_in_flight_limit(self) -> None:
+        with patch(
+            "src.worker.celery_app.get_settings",
+            return_value=_settings(pool="threads", max_in_flight=24),
+        ):
+            app = create_celery_app()
+        assert app.conf.worker_pool == "threads"
+        assert app.conf.worker_concurrency == 24
+        assert app.conf.worker_prefetch_multiplier == 1
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.ai.base import ImageProviderOverloadedError
+from src.ai.concurrency import AdaptiveLimiter
+from src.ai.hedging import HedgePolicy
+from src.ai.rate_limit import RateLimiter
+from src.worker.metrics import collect_stats, log_stats
+
+
+async def _overloaded_limiter() -> AdaptiveLimiter:
+    limiter = AdaptiveLimiter("test", initial=8, max_limit=8)
+    with pytest.raises(ImageProviderOverloadedError):
+        async with limiter.slot():
+            raise ImageProviderOverloadedError("429")
+    return limiter
+
+
+class TestWorkerMetrics:
+    async def test_collects_image_concurrency_limit(self) -> None:
+        limiter = await _overloaded_limiter()
+
+        with patch("src.ai.concurrency.get_image_limiter", return_value=limiter):
+            stats = collect_stats()
+
+        assert stats["image_concurrency"] == {
+            "limit": 4,
+            "in_flight": 0,
+            "increases": 0,
+            "decreases": 1,
+            "overloads": 1,
+            "latency_seconds": None,
+        }
+
+    async def test_collects_rate_limit_waits_of_enabled_limiters(self) -> None:
+        redis = MagicMock()
+        redis.zrem = AsyncMock()
+        redis.register_script.return_value = AsyncMock(return_value=1)
+        limiters = {
+            "anthropic": RateLimiter("anthropic", None),
+            "gemini": RateLimiter("gemini", redis, max_in_flight=2),
+        }
+        async with limiters["gemini"].acquire():
+            pass
+
+        with patch("src.ai.rate_limit.get_rate_limiter", side_effect=limiters.get):
+            stats = collect_stats()
+
+        rate_limits = stats["rate_limits"]
+        assert isinstance(rate_limits, dict)
+        assert set(rate_limits) == {"gemini"}
+        assert rate_limits["gemini"]["acquired"] == 1
+        assert rate_limits["gemini"]["max_wait_seconds"] >= 0
+
+    async def test_collects_hook_hedging(self) -> None:
+        policy = HedgePolicy(budget=0.1)
+        for _ in range(20):
+            policy.record(2.0)
+
+        with patch("src.ai.hedging.get_hook_hedge_policy", return_value=policy):
+            stats = collect_stats()
+
+        assert stats["hook_hedging"] == {
+            "requests": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "delay_seconds": 2.0,
+        }
+
+    async def test_collects_browser_restarts(self) -> None:
+        with (
+            patch("src.renderer.browser._current", None),
+            patch("src.renderer.browser._restarts", {"rss": 2}),
+        ):
+            stats = collect_stats()
+
+        browser = stats["browser"]
+        assert isinstance(browser, dict)
+        assert browser["running"] is False
+        assert browser["restarts_by_reason"] == {"rss": 2}
+        # No browser launched yet, so no page pool
+        assert stats["page_pool"] is None
+
+    async def test_logs_stats_as_json(self, caplog: pytest.LogCaptureFixture) -> None:
+        limiter = await _overloaded_limiter()
+
+        with (
+            patch("src.ai.concurrency.get_image_limiter", return_value=limiter),
+            caplog.at_level("INFO", logger="src.worker.metrics"),
+        ):
+            task = asyncio.create_task(log_stats(0.01))
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        record = next(r for r in caplog.records if r.getMessage().startswith("Worker stats "))
+        logged = json.loads(record.getMessage().removeprefix("Worker stats "))
+        assert logged["image_concurrency"]["limit"] == 4
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.worker import startup
+from src.worker.healthcheck import check, process_start_time
+from src.worker.startup import _WarmStart, get_readiness, prepare_worker
+
+
+@pytest.fixture
+def ready_dir(tmp_path: Path) -> Iterator[Path]:
+    settings = MagicMock()
+    settings.worker.ready_dir = str(tmp_path)
+    with (
+        patch("src.worker.startup.get_settings", return_value=settings),
+        patch.object(startup, "_readiness", get_readiness()),
+    ):
+        yield tmp_path
+
+
+def _cta_cache() -> MagicMock:
+    cache = MagicMock()
+    cache.preload = AsyncMock()
+    return cache
+
+
+class TestWarmStart:
+    async def test_reports_ready_with_step_timings(self, ready_dir: Path) -> None:
+        warm = _WarmStart()
+        warm.run("templates", lambda: None)
+        with (
+            patch("src.renderer.browser.warm_up", new=AsyncMock()),
+            patch("src.renderer.cta.get_cta_cache", return_value=_cta_cache()),
+        ):
+            await warm.finish_async()
+
+        readiness = get_readiness()
+        assert readiness.state == "ready"
+        assert readiness.cold_start_seconds is not None
+        assert set(readiness.steps) == {"templates", "browser", "cta"}
+        data = json.loads((ready_dir / f"{os.getpid()}.json").read_text())
+        assert data["state"] == "ready"
+        assert check(ready_dir)
+
+    async def test_failed_step_marks_degraded(self, ready_dir: Path) -> None:
+        warm = _WarmStart()
+        with (
+            patch("src.renderer.browser.warm_up", new=AsyncMock(side_effect=RuntimeError)),
+            patch("src.renderer.cta.get_cta_cache", return_value=_cta_cache()),
+        ):
+            await warm.finish_async()
+
+        assert get_readiness().state == "degraded"
+        assert get_readiness().failed == ("browser",)
+
+
+class TestPrepareWorker:
+    def test_removes_stale_readiness_files(self, ready_dir: Path) -> None:
+        (ready_dir / "12.json").write_text(json.dumps({"state": "ready"}))
+        (ready_dir / "12.tmp").write_text("{}")
+
+        with patch("src.worker.startup._import_pipeline") as import_pipeline:
+            prepare_worker("threads")
+
+        assert list(ready_dir.iterdir()) == []
+        import_pipeline.assert_not_called()
+
+    def test_prefork_imports_pipeline_before_forking(self, ready_dir: Path) -> None:
+        with patch("src.worker.startup._import_pipeline") as import_pipeline:
+            prepare_worker("prefork")
+
+        import_pipeline.assert_called_once()
+
+
+class TestHealthcheck:
+    def test_starting_process_is_not_healthy(self, tmp_path: Path) -> None:
+        (tmp_path / f"{os.getpid()}.json").write_text(json.dumps({"state": "starting"}))
+        assert not check(tmp_path)
+
+    def test_ignores_files_of_dead_processes(self, tmp_path: Path) -> None:
+        with patch("src.worker.healthcheck._alive", return_value=False):
+            (tmp_path / "12345.json").write_text(json.dumps({"state": "ready"}))
+            assert not check(tmp_path)
+
+    def test_ignores_files_of_reused_pids(self, tmp_path: Path) -> None:
+        start = process_start_time(os.getpid())
+        assert start is not None
+        path = tmp_path / f"{os.getpid()}.json"
+        path.write_text(json.dumps({"state": "ready", "process_start": start - 1}))
+        assert not check(tmp_path)
+
+        path.write_text(json.dumps({"state": "ready", "process_start": start}))
+        assert check(tmp_path)